@@ -0,0 +1,6 @@
+"""
+Benchmarks for the Expense Tracker API.
+
+Each module is a standalone script run with `python -m benchmarks.<name>`
+that prints its results as JSON, so runs can be diffed between commits.
+"""
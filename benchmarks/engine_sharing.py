@@ -0,0 +1,198 @@
+"""
+Throughput of an authenticated request with one shared engine versus the
+former separate auth and repository engines.
+
+"separate" replays the former setup: the auth dependency loaded the user
+through its own engine and session, held for the whole request, next to
+the container's engine, and both engines echoed every statement.
+"shared" is the current setup: one engine from src.db.create_engine,
+whose single request session serves both the user lookup and the
+repository query. Each simulated request loads the user, then reads a
+page of its transactions, with --concurrency requests in flight.
+
+Usage:
+    python -m benchmarks.engine_sharing --requests 2000 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import Awaitable, Callable
+
+from benchmarks.harness import (
+    DEFAULT_SQLITE_URL,
+    configure_environment,
+    insert_transactions,
+    insert_user,
+    percentile,
+    run_metadata,
+)
+
+
+class CheckoutCounter:
+    """Tracks how many pooled connections are checked out at once."""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+
+    def watch(self, engine) -> None:
+        from sqlalchemy import event
+
+        event.listen(engine.sync_engine, "checkout", self._checkout)
+        event.listen(engine.sync_engine, "checkin", self._checkin)
+
+    def _checkout(self, *args) -> None:
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+
+    def _checkin(self, *args) -> None:
+        self.current -= 1
+
+
+async def _drive(
+    request: Callable[[], Awaitable], requests: int, concurrency: int
+) -> dict:
+    latencies: list[float] = []
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            await request()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    ms = [latency * 1000 for latency in latencies]
+    return {
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "latency_ms": {
+            "p50": round(percentile(ms, 50), 3),
+            "p95": round(percentile(ms, 95), 3),
+        },
+    }
+
+
+async def run_separate(args: argparse.Namespace, user_id: int) -> dict:
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import (
+        AsyncSession,
+        async_sessionmaker,
+        create_async_engine,
+    )
+
+    from src.db.models import User
+    from src.db.repositories import TransactionRepository
+
+    auth_engine = create_async_engine(args.db_url, echo=True)
+    repository_engine = create_async_engine(args.db_url, echo=True)
+    counter = CheckoutCounter()
+    counter.watch(auth_engine)
+    counter.watch(repository_engine)
+    auth_sessions = async_sessionmaker(
+        auth_engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+    )
+    repository_sessions = async_sessionmaker(
+        repository_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def request() -> None:
+        async with auth_sessions() as auth_session:
+            await auth_session.scalar(select(User).where(User.id == user_id))
+            async with repository_sessions() as session:
+                await TransactionRepository(session).get_transactions(user_id, limit=20)
+
+    try:
+        result = await _drive(request, args.requests, args.concurrency)
+    finally:
+        await auth_engine.dispose()
+        await repository_engine.dispose()
+    return result | {"engines": 2, "peak_connections": counter.peak}
+
+
+async def run_shared(args: argparse.Namespace, user_id: int) -> dict:
+    from src.core.config import settings
+    from src.db import create_engine, create_sessionmaker
+    from src.db.repositories import TransactionRepository, UserRepository
+
+    engine = create_engine(settings)
+    counter = CheckoutCounter()
+    counter.watch(engine)
+    sessionmaker = create_sessionmaker(engine)
+
+    async def request() -> None:
+        async with sessionmaker() as session:
+            await UserRepository(session).get(user_id)
+            await TransactionRepository(session).get_transactions(user_id, limit=20)
+
+    try:
+        result = await _drive(request, args.requests, args.concurrency)
+    finally:
+        await engine.dispose()
+    return result | {"engines": 1, "peak_connections": counter.peak}
+
+
+async def run(args: argparse.Namespace) -> dict:
+    configure_environment(args.db_url)
+    from src.core.config import settings
+    from src.db import create_engine, create_sessionmaker
+    from src.db.models import Base
+
+    engine = create_engine(settings)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with create_sessionmaker(engine)() as session:
+        user_id, account_ids = await insert_user(session, "target", 3)
+        await insert_transactions(session, user_id, account_ids, args.transactions)
+        await session.commit()
+    await engine.dispose()
+
+    # echo=True logs through a handler bound to sys.stdout when the engine
+    # is created; send it to /dev/null so the cost stays but the noise goes.
+    results = {}
+    warmup = argparse.Namespace(**{**vars(args), "requests": 50})
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for name, setup in (("separate", run_separate), ("shared", run_shared)):
+            for _ in range(args.warmup):
+                await setup(warmup, user_id)
+            results[name] = await setup(args, user_id)
+
+    return {
+        "meta": run_metadata(
+            db=args.db_url.split("://", 1)[0],
+            requests=args.requests,
+            concurrency=args.concurrency,
+            transactions=args.transactions,
+        ),
+        "results": results,
+        "shared_over_separate_rps": round(
+            results["shared"]["throughput_rps"] / results["separate"]["throughput_rps"],
+            2,
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db-url", default=DEFAULT_SQLITE_URL)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument(
+        "--transactions", type=int, default=10_000, help="rows in the ledger"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="warm-up rounds before measuring"
+    )
+    args = parser.parse_args()
+    sys.stdout.write(json.dumps(asyncio.run(run(args)), indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Shared helpers for the benchmark scripts.
+
+The app is booted in-process: settings are read from the environment when
+`main` is first imported, so `boot_app` must run before anything from `src`
+is imported.
+"""
+
+import os
+import platform
+import statistics
+import subprocess
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import AsyncIterator
+
+import httpx
+
+DEFAULT_SQLITE_URL = "sqlite+aiosqlite:///./benchmark.db"
+# Rows per INSERT statement and commit when seeding transactions
+INSERT_BATCH = 10_000
+
+
+def configure_environment(db_url: str) -> None:
+    """Point the app settings at the benchmark database."""
+    os.environ["DB_URL"] = db_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    os.environ.setdefault("JWT_SECRET", "benchmark-jwt-secret")
+    os.environ.setdefault("DEBUG", "False")
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of the samples (pct in 0..100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_metadata(**params) -> dict:
+    """Describe the run so results from different commits can be compared."""
+    return {
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "params": params,
+    }
+
+
+@dataclass
+class ScenarioStats:
+    """Latency, status and query samples collected for one scenario."""
+
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def observe(self, status_code: int, seconds: float, queries: int) -> None:
+        self.latencies.append(seconds)
+        self.queries.append(queries)
+        self.statuses[status_code] = self.statuses.get(status_code, 0) + 1
+        if status_code >= 400:
+            self.errors += 1
+
+    def summary(self) -> dict:
+        count = len(self.latencies)
+        ms = [latency * 1000 for latency in self.latencies]
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "statuses": {str(code): n for code, n in sorted(self.statuses.items())},
+            "throughput_rps": round(count / self.elapsed, 2) if self.elapsed else 0.0,
+            "latency_ms": {
+                "mean": round(statistics.fmean(ms), 3) if ms else 0.0,
+                "p50": round(percentile(ms, 50), 3),
+                "p95": round(percentile(ms, 95), 3),
+                "p99": round(percentile(ms, 99), 3),
+                "max": round(max(ms), 3) if ms else 0.0,
+            },
+            "queries_per_request": (
+                round(statistics.fmean(self.queries), 2) if self.queries else 0.0
+            ),
+        }
+
+
+async def timed_request(
+    client: httpx.AsyncClient,
+    stats: ScenarioStats,
+    method: str,
+    url: str,
+    **kwargs,
+) -> httpx.Response:
+    """Send one request, recording its latency and query count."""
+    from src.db import track_queries
+
+    with track_queries() as queries:
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        await response.aread()
+        elapsed = time.perf_counter() - started
+    stats.observe(response.status_code, elapsed, queries.count)
+    return response
+
+
+@asynccontextmanager
+async def boot_app(db_url: str, reset: bool = True) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Start main:app in-process and yield an ASGI client bound to it.
+
+    With reset, the schema is dropped and recreated from the ORM metadata
+    before the app starts.
+    """
+    configure_environment(db_url)
+
+    import main
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from src.db.models import Base
+
+    app = main.app
+    async with app.router.lifespan_context(app):
+        engine = await app.state.dishka_container.get(AsyncEngine)
+        if reset:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+                await conn.run_sync(Base.metadata.create_all)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://benchmark",
+            timeout=None,
+        ) as client:
+            yield client
+
+
+async def insert_user(session, username: str, accounts: int) -> tuple[int, list[int]]:
+    """Insert a user with `accounts` debit accounts; return their ids."""
+    from sqlalchemy import insert
+
+    from src.db.models import Account, User
+    from src.models.enums import AccountType
+
+    user_id = await session.scalar(
+        insert(User)
+        .values(
+            first_name="Bench",
+            last_name="User",
+            username=username,
+            email=f"{username}@example.com",
+            hashed_password="-",
+        )
+        .returning(User.id)
+    )
+    account_ids = list(
+        await session.scalars(
+            insert(Account).returning(Account.id, sort_by_parameter_order=True),
+            [
+                {
+                    "name": f"Account {n}",
+                    "number": str(n),
+                    "holder": "Bench User",
+                    "value": Decimal(1000),
+                    "type": AccountType.DEBIT,
+                    "user_id": user_id,
+                }
+                for n in range(accounts)
+            ],
+        )
+    )
+    return user_id, account_ids
+
+
+async def insert_transactions(
+    session, user_id: int, account_ids: list[int], count: int
+) -> None:
+    """
+    Insert `count` expenses spread over the accounts, one second apart
+    going back from now, committing every INSERT_INSERT_BATCH rows.
+    """
+    from sqlalchemy import insert
+
+    from src.db.models import Transaction
+    from src.models.enums import TransactionType
+
+    now = datetime.now(timezone.utc)
+    for start in range(0, count, INSERT_BATCH):
+        await session.execute(
+            insert(Transaction),
+            [
+                {
+                    "amount": Decimal("1.00"),
+                    "description": "bench",
+                    "type": TransactionType.EXPENSE,
+                    "account_id": account_ids[n % len(account_ids)],
+                    "user_id": user_id,
+                    "created_at": now - timedelta(seconds=n),
+                    "updated_at": now,
+                }
+                for n in range(start, min(start + INSERT_BATCH, count))
+            ],
+        )
+        await session.commit()
@@ -0,0 +1,143 @@
+"""
+Cost of listing one user's accounts with their latest transactions as the
+rest of the transactions table grows.
+
+"global_window" is the former plan, which ranked every transaction in the
+table with row_number(). "bounded" is AccountRepository.get_accounts, whose
+cost should stay flat however many rows other users have.
+
+Usage:
+    python -m benchmarks.latest_transactions --table-rows 10000 100000 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from benchmarks.harness import (
+    DEFAULT_SQLITE_URL,
+    configure_environment,
+    insert_transactions,
+    insert_user,
+    percentile,
+    run_metadata,
+)
+
+
+async def _median_ms(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - started)
+    return round(percentile(samples, 50) * 1000, 3)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    configure_environment(args.db_url)
+    from sqlalchemy import func, select
+
+    from src.core.config import settings
+    from src.db import create_engine, create_sessionmaker
+    from src.db.models import Account, Base, Transaction
+    from src.db.repositories import AccountRepository
+
+    engine = create_engine(settings)
+    sessionmaker = create_sessionmaker(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with sessionmaker() as session:
+        user_id, account_ids = await insert_user(session, "target", args.accounts)
+        await insert_transactions(
+            session, user_id, account_ids, args.accounts * args.transactions
+        )
+        noise_user_id, noise_accounts = await insert_user(session, "noise", 100)
+        await session.commit()
+
+    async def bounded():
+        async with sessionmaker() as session:
+            await AccountRepository(session).get_accounts(user_id, args.limit)
+
+    async def global_window():
+        ranked = select(
+            Transaction.id,
+            func.row_number()
+            .over(
+                partition_by=Transaction.account_id,
+                order_by=Transaction.created_at.desc(),
+            )
+            .label("rn"),
+        ).subquery()
+        async with sessionmaker() as session:
+            await session.execute(
+                select(Transaction)
+                .join(ranked, ranked.c.id == Transaction.id)
+                .where(
+                    Transaction.account_id.in_(account_ids), ranked.c.rn <= args.limit
+                )
+            )
+
+    results = {}
+    table_rows = args.accounts * args.transactions
+    try:
+        for target in sorted(args.table_rows):
+            if target > table_rows:
+                async with sessionmaker() as session:
+                    await insert_transactions(
+                        session, noise_user_id, noise_accounts, target - table_rows
+                    )
+                table_rows = target
+            await bounded()
+            results[str(table_rows)] = {
+                "bounded_ms": await _median_ms(bounded, args.repeat),
+                "global_window_ms": await _median_ms(global_window, args.repeat),
+            }
+    finally:
+        await engine.dispose()
+
+    return {
+        "meta": run_metadata(
+            db=args.db_url.split("://", 1)[0],
+            accounts=args.accounts,
+            transactions_per_account=args.transactions,
+            limit=args.limit,
+        ),
+        "results_by_table_rows": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--db-url",
+        default=DEFAULT_SQLITE_URL,
+        help="database to benchmark against; its tables are recreated",
+    )
+    parser.add_argument(
+        "--table-rows",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="total transactions in the table at each measurement",
+    )
+    parser.add_argument(
+        "--accounts", type=int, default=10, help="target user's accounts"
+    )
+    parser.add_argument(
+        "--transactions", type=int, default=100, help="transactions per target account"
+    )
+    parser.add_argument("--limit", type=int, default=5, help="transactions per account")
+    parser.add_argument(
+        "--repeat", type=int, default=7, help="runs per case; the median is kept"
+    )
+    args = parser.parse_args()
+    report = asyncio.run(run(args))
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
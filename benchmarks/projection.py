@@ -0,0 +1,223 @@
+"""
+Cost of loading list results as ORM instances versus projected rows.
+
+"orm_validate" loads ORM instances and runs model_validate on each, which
+is how repositories build domain objects by default. "projection" is the
+row-tuple path used by the read-only list methods. Both read the same
+rows from a database seeded with one user's data.
+
+Usage:
+    python -m benchmarks.projection --sizes 100 1000 10000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from benchmarks.harness import (
+    DEFAULT_SQLITE_URL,
+    configure_environment,
+    percentile,
+    run_metadata,
+)
+
+
+async def seed(session, rows: int) -> int:
+    from sqlalchemy import insert
+
+    from src.db.models import Account, Transaction, User
+    from src.models.enums import AccountType, TransactionType
+
+    user_id = await session.scalar(
+        insert(User)
+        .values(
+            first_name="Bench",
+            last_name="User",
+            username="projection",
+            email="projection@example.com",
+            hashed_password="-",
+        )
+        .returning(User.id)
+    )
+    accounts = max(rows // 10, 1)
+    account_ids = list(
+        await session.scalars(
+            insert(Account).returning(Account.id, sort_by_parameter_order=True),
+            [
+                {
+                    "name": f"Account {n}",
+                    "number": str(n),
+                    "holder": "Bench User",
+                    "value": Decimal(1000),
+                    "type": AccountType.DEBIT,
+                    "user_id": user_id,
+                }
+                for n in range(accounts)
+            ],
+        )
+    )
+    now = datetime.now(timezone.utc)
+    await session.execute(
+        insert(Transaction),
+        [
+            {
+                "amount": Decimal("12.34"),
+                "description": f"transaction {n}",
+                "type": TransactionType.EXPENSE,
+                "account_id": account_ids[n % accounts],
+                "user_id": user_id,
+                "created_at": now - timedelta(seconds=n),
+                "updated_at": now,
+            }
+            for n in range(rows)
+        ],
+    )
+    await session.commit()
+    return user_id
+
+
+async def _timed(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - started)
+    return percentile(samples, 50)
+
+
+async def bench_size(sessionmaker, engine, rows: int, repeat: int) -> dict:
+    from sqlalchemy import func, select
+    from sqlalchemy.orm import selectinload
+
+    from src.db.models import Account, Base, Transaction
+    from src.db.repositories import AccountRepository, TransactionRepository
+    from src.models.domain.account import Account as AccountDomain
+    from src.models.domain.transaction import Transaction as TransactionDomain
+    from src.models.enums import TransactionType
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with sessionmaker() as session:
+        user_id = await seed(session, rows)
+
+    async def orm_transactions():
+        async with sessionmaker() as session:
+            result = await session.scalars(
+                select(Transaction)
+                .where(
+                    Transaction.user_id == user_id,
+                    Transaction.type == TransactionType.EXPENSE,
+                )
+                .order_by(Transaction.created_at.desc(), Transaction.id.desc())
+                .limit(rows)
+            )
+            return [TransactionDomain.model_validate(t) for t in result.all()]
+
+    async def projected_transactions():
+        async with sessionmaker() as session:
+            return await TransactionRepository(session).get_transactions(
+                user_id, TransactionType.EXPENSE, limit=rows
+            )
+
+    async def orm_accounts():
+        # The ORM version of get_accounts: 5 latest transactions per account
+        ranked = select(
+            Transaction.id,
+            func.row_number()
+            .over(
+                partition_by=Transaction.account_id,
+                order_by=Transaction.created_at.desc(),
+            )
+            .label("rn"),
+        ).subquery()
+        async with sessionmaker() as session:
+            result = await session.scalars(
+                select(Account)
+                .where(Account.user_id == user_id)
+                .options(
+                    selectinload(
+                        Account.transactions.and_(
+                            Transaction.id == ranked.c.id, ranked.c.rn <= 5
+                        )
+                    )
+                )
+            )
+            return [AccountDomain.model_validate(a) for a in result.all()]
+
+    async def projected_accounts():
+        async with sessionmaker() as session:
+            return await AccountRepository(session).get_accounts(user_id)
+
+    cases = {
+        "TransactionRepository.get_transactions": (
+            orm_transactions,
+            projected_transactions,
+            rows,
+        ),
+        "AccountRepository.get_accounts": (
+            orm_accounts,
+            projected_accounts,
+            max(rows // 10, 1),
+        ),
+    }
+    results = {}
+    for name, (orm, projected, count) in cases.items():
+        await orm()
+        await projected()
+        before = await _timed(orm, repeat)
+        after = await _timed(projected, repeat)
+        results[name] = {
+            "rows": count,
+            "orm_validate_ms": round(before * 1000, 3),
+            "projection_ms": round(after * 1000, 3),
+            "orm_validate_us_per_row": round(before / count * 1_000_000, 3),
+            "projection_us_per_row": round(after / count * 1_000_000, 3),
+        }
+    return results
+
+
+async def run(args: argparse.Namespace) -> dict:
+    configure_environment(args.db_url)
+    from src.core.config import settings
+    from src.db import create_engine, create_sessionmaker
+
+    engine = create_engine(settings)
+    try:
+        sessionmaker = create_sessionmaker(engine)
+        results = {
+            str(size): await bench_size(sessionmaker, engine, size, args.repeat)
+            for size in args.sizes
+        }
+    finally:
+        await engine.dispose()
+    return {
+        "meta": run_metadata(
+            db=args.db_url.split("://", 1)[0], sizes=args.sizes, repeat=args.repeat
+        ),
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--db-url",
+        default=DEFAULT_SQLITE_URL,
+        help="database to benchmark against; its tables are recreated",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="runs per case; the median is kept"
+    )
+    args = parser.parse_args()
+    report = asyncio.run(run(args))
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Throughput of balance reconciliation over a synthetic ledger.
+
+Seeds `--accounts` accounts with `--transactions` transactions each, skews
+the balance of every hundredth account, then runs ReconciliationService in
+report mode for each chunk size and reports transactions checked per minute.
+
+Usage:
+    python -m benchmarks.reconcile --accounts 10000 --transactions 100
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from benchmarks.harness import DEFAULT_SQLITE_URL, configure_environment, run_metadata
+
+BATCH = 10_000
+
+
+async def _seed(sessionmaker, accounts: int, transactions: int) -> None:
+    from sqlalchemy import insert, update
+
+    from src.db.models import Account, Transaction, User
+    from src.models.enums import AccountType, TransactionType
+
+    now = datetime.now(timezone.utc)
+    async with sessionmaker() as session:
+        user_id = await session.scalar(
+            insert(User)
+            .values(
+                first_name="Bench",
+                last_name="User",
+                username="reconcile",
+                email="reconcile@example.com",
+                hashed_password="-",
+            )
+            .returning(User.id)
+        )
+        # Each account nets +1.00 per transaction pair (2.00 in, 1.00 out)
+        balance = Decimal(1000) + Decimal(transactions // 2)
+        account_ids = list(
+            await session.scalars(
+                insert(Account).returning(Account.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "name": f"Account {n}",
+                        "number": str(n),
+                        "holder": "Bench User",
+                        "value": balance,
+                        "initial_value": Decimal(1000),
+                        "type": AccountType.DEBIT,
+                        "user_id": user_id,
+                    }
+                    for n in range(accounts)
+                ],
+            )
+        )
+        rows = (
+            {
+                "amount": Decimal("2.00") if n % 2 == 0 else Decimal("1.00"),
+                "description": "bench",
+                "type": (
+                    TransactionType.INCOME if n % 2 == 0 else TransactionType.EXPENSE
+                ),
+                "account_id": account_id,
+                "user_id": user_id,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for account_id in account_ids
+            for n in range(transactions - transactions % 2)
+        )
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == BATCH:
+                await session.execute(insert(Transaction), batch)
+                batch = []
+        if batch:
+            await session.execute(insert(Transaction), batch)
+
+        await session.execute(
+            update(Account)
+            .where(Account.id % 100 == 0)
+            .values(value=Account.value + Decimal("0.01"))
+        )
+        await session.commit()
+
+
+async def run(args: argparse.Namespace) -> dict:
+    configure_environment(args.db_url)
+    from src.core.config import settings
+    from src.db import UnitOfWork, create_engine, create_sessionmaker
+    from src.db.models import Base
+    from src.db.repositories import AccountRepository
+    from src.services import ReconciliationService
+
+    engine = create_engine(settings)
+    sessionmaker = create_sessionmaker(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    transactions = args.transactions - args.transactions % 2
+
+    results = {}
+    try:
+        await _seed(sessionmaker, args.accounts, transactions)
+        for chunk_size in args.chunk_sizes:
+            async with sessionmaker() as session:
+                service = ReconciliationService(
+                    AccountRepository(session), UnitOfWork(session)
+                )
+                started = time.perf_counter()
+                report = await service.reconcile(chunk_size=chunk_size)
+                elapsed = time.perf_counter() - started
+            checked = report.accounts_checked * transactions
+            results[str(chunk_size)] = {
+                "seconds": round(elapsed, 3),
+                "accounts_checked": report.accounts_checked,
+                "drifted_accounts": report.drifted_accounts,
+                "transactions_per_minute": round(checked / elapsed * 60),
+            }
+    finally:
+        await engine.dispose()
+
+    return {
+        "meta": run_metadata(
+            db=args.db_url.split("://", 1)[0],
+            accounts=args.accounts,
+            transactions_per_account=transactions,
+        ),
+        "results_by_chunk_size": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--db-url",
+        default=DEFAULT_SQLITE_URL,
+        help="database to benchmark against; its tables are recreated",
+    )
+    parser.add_argument("--accounts", type=int, default=10_000)
+    parser.add_argument(
+        "--transactions", type=int, default=100, help="transactions per account"
+    )
+    parser.add_argument(
+        "--chunk-sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 5000],
+        help="accounts per aggregate query",
+    )
+    args = parser.parse_args()
+    report = asyncio.run(run(args))
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
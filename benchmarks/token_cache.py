@@ -0,0 +1,88 @@
+"""
+Per-request cost of authenticating a bearer token, with and without the
+verified-token cache in src/core/token_cache.py.
+
+"verify" is what get_current_token did for every request before: build a
+RequestToken and decode and check it with AuthX. "cached" is the lookup
+that replaces it once a token has been seen.
+
+Usage:
+    python -m benchmarks.token_cache --tokens 1 100 10000
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from benchmarks.harness import DEFAULT_SQLITE_URL, configure_environment, run_metadata
+
+
+def _per_call_us(func, tokens: list[str], rounds: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for token in tokens:
+                func(token)
+        best = min(best, time.perf_counter() - started)
+    return round(best / (rounds * len(tokens)) * 1_000_000, 3)
+
+
+def run(token_counts: list[int], calls: int, repeat: int) -> dict:
+    from authx import RequestToken
+
+    from src.core.auth_config import security
+    from src.core.token_cache import TokenCache
+
+    def verify(token: str):
+        return security.verify_token(RequestToken(token=token, location="headers"))
+
+    results: dict[str, dict] = {}
+    for count in token_counts:
+        tokens = [
+            security.create_access_token(uid=str(n), data={"username": f"user{n}"})
+            for n in range(count)
+        ]
+        cache = TokenCache(max_size=max(count, 1), ttl=3600)
+        for token in tokens:
+            cache.add(token, verify(token))
+        assert all(cache.get_payload(token) == verify(token) for token in tokens)
+
+        rounds = max(calls // count, 1)
+        before = _per_call_us(verify, tokens, rounds, repeat)
+        after = _per_call_us(cache.get_payload, tokens, rounds, repeat)
+        results[str(count)] = {
+            "calls": rounds * count,
+            "verify_us_per_call": before,
+            "cached_us_per_call": after,
+            "speedup": round(before / after, 2) if after else None,
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--tokens",
+        type=int,
+        nargs="+",
+        default=[1, 100, 10000],
+        help="distinct tokens in rotation",
+    )
+    parser.add_argument("--calls", type=int, default=20000, help="calls per case")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="runs per case; the best is kept"
+    )
+    args = parser.parse_args()
+
+    configure_environment(DEFAULT_SQLITE_URL)
+    report = {
+        "meta": run_metadata(tokens=args.tokens, calls=args.calls, repeat=args.repeat),
+        "results": run(args.tokens, args.calls, args.repeat),
+    }
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,47 @@
-import uvicorn
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from dishka.integrations.fastapi import setup_dishka
+from dishka.integrations.fastapi import ContainerMiddleware
+from sqlalchemy.ext.asyncio import AsyncEngine
 
-from src.api.v1 import router as v1_router
+from src.api.metrics import router as metrics_router
+from src.api.v1 import IDEMPOTENT_PATHS, router as v1_router
+from src.core.config import settings
 from src.core.exceptions_handler import add_exception_handlers
 from src.core.ioc import create_container
-from src.db import db_session_manager
+from src.core.jobs import JobRunner
+from src.db.partitions import (
+    ensure_transaction_partitions,
+    missing_transaction_partitions,
+)
+from src.core.middleware import (
+    IdempotencyMiddleware,
+    MetricsMiddleware,
+    QueryCountMiddleware,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan events."""
-    # Startup
+    # Startup: the container, and with it the database engine, is only
+    # built here, so importing the app stays cheap
+    app.state.dishka_container = create_container()
+    engine = await app.state.dishka_container.get(AsyncEngine)
+    months_ahead = settings.transactions_partitions_ahead
+    await ensure_transaction_partitions(engine, months_ahead)
+    if missing := await missing_transaction_partitions(engine, months_ahead):
+        raise RuntimeError(
+            "transactions has no partition for "
+            f"{', '.join(missing)}; inserts for those months would fail"
+        )
+    if settings.jobs_enabled:
+        runner = await app.state.dishka_container.get(JobRunner)
+        runner.start(app.state.dishka_container)
     yield
-    # Shutdown: close database connections
-    await db_session_manager.close()
+    # Shutdown: release app-scoped dependencies (job runner, database engine,
+    # hashing executor)
+    await app.state.dishka_container.close()
 
 
 app = FastAPI(
@@ -25,6 +50,13 @@ app = FastAPI(
     version="0.0.5",
     lifespan=lifespan,
 )
+# Innermost, so stored responses hold only what the endpoint produced
+app.add_middleware(
+    IdempotencyMiddleware,
+    paths=IDEMPOTENT_PATHS,
+    wait_timeout=settings.idempotency_wait_timeout,
+    poll_interval=settings.idempotency_poll_interval,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173"],
@@ -33,15 +65,19 @@ app.add_middleware(
     allow_headers=["*"],
     expose_headers=["*"],
 )
+if settings.debug:
+    app.add_middleware(QueryCountMiddleware)
+app.add_middleware(MetricsMiddleware)
+# Opens a request scope on the container that lifespan creates
+app.add_middleware(ContainerMiddleware)
 add_exception_handlers(app)
 app.include_router(v1_router)
-
-# Setup dishka DI container
-container = create_container()
-setup_dishka(container, app)
+app.include_router(metrics_router)
 
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(
         "main:app",
         log_config=None,
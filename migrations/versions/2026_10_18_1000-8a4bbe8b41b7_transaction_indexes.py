@@ -0,0 +1,46 @@
+"""transaction indexes
+
+Revision ID: 8a4bbe8b41b7
+Revises: 63bf89f838c1
+Create Date: 2026-10-18 10:00:12.418305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4bbe8b41b7"
+down_revision: Union[str, Sequence[str], None] = "63bf89f838c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # accounts(user_id) lookups are already served by the leading column
+    # of the uq_user_account_number (user_id, number) unique index.
+    op.create_index(
+        "ix_transactions_user_id_created_at",
+        "transactions",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_transactions_user_id_type_created_at",
+        "transactions",
+        ["user_id", "type", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_transactions_account_id_created_at",
+        "transactions",
+        ["account_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_transactions_account_id_created_at", table_name="transactions")
+    op.drop_index("ix_transactions_user_id_type_created_at", table_name="transactions")
+    op.drop_index("ix_transactions_user_id_created_at", table_name="transactions")
@@ -0,0 +1,61 @@
+"""daily totals
+
+Revision ID: 8944f96b764a
+Revises: 8a4bbe8b41b7
+Create Date: 2026-10-18 10:30:41.052967
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "8944f96b764a"
+down_revision: Union[str, Sequence[str], None] = "8a4bbe8b41b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "daily_totals",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("account_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "type",
+            postgresql.ENUM(
+                "EXPENSE", "INCOME", name="transactiontype", create_type=False
+            ),
+            nullable=False,
+        ),
+        sa.Column("sum", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["account_id"], ["accounts.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "day", "account_id", "type"),
+    )
+
+    # Seed the rollup from the existing ledger.
+    if op.get_bind().dialect.name == "postgresql":
+        day = "CAST(timezone('UTC', created_at) AS DATE)"
+    else:
+        day = "date(created_at)"
+    op.execute(f"""
+        INSERT INTO daily_totals (user_id, account_id, day, type, sum, count)
+        SELECT user_id, account_id, {day}, type, sum(amount), count(*)
+        FROM transactions
+        GROUP BY user_id, account_id, {day}, type
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("daily_totals")
@@ -0,0 +1,48 @@
+"""account initial value
+
+Revision ID: 5d2f7c9e1a83
+Revises: c3e5a1f0d2b4
+Create Date: 2026-10-18 11:30:27.604118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2f7c9e1a83"
+down_revision: Union[str, Sequence[str], None] = "c3e5a1f0d2b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "accounts",
+        sa.Column(
+            "initial_value",
+            sa.Numeric(precision=10, scale=2),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+
+    # Derive opening balances from today's balances and ledger. Drift that
+    # already exists is folded into the opening balance; reconciliation can
+    # only detect drift from here on.
+    op.execute("""
+        UPDATE accounts
+        SET initial_value = value - COALESCE((
+            SELECT SUM(CASE WHEN type = 'INCOME' THEN amount ELSE -amount END)
+            FROM transactions
+            WHERE transactions.account_id = accounts.id
+        ), 0)
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("accounts", "initial_value")
@@ -0,0 +1,193 @@
+"""partition transactions by month
+
+Revision ID: 9b1e4d6a7c25
+Revises: 5d2f7c9e1a83
+Create Date: 2026-10-18 12:00:08.731642
+
+On Postgres, rebuilds `transactions` as a table range-partitioned on
+`created_at`, one partition per UTC month, and installs
+create_transaction_partitions() to create partitions ahead of time (see
+src/db/partitions.py). Existing rows are copied in this migration, which
+holds an exclusive lock on the table while it runs.
+
+The primary key becomes (id, created_at), since a partitioned table's
+unique constraints must include the partition key; ids still come from
+transactions_id_seq, so they stay unique on their own. The old table's
+constraints are renamed out of the way first, so the new table's keep
+their usual names.
+
+There is no DEFAULT partition: each new month's partition would have to
+scan it under lock, and rows parked there would never be detached with
+their month. Instead the app refuses to start when a partition up to
+TRANSACTIONS_PARTITIONS_AHEAD months out is missing.
+
+Other databases keep the plain table.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9b1e4d6a7c25"
+down_revision: Union[str, Sequence[str], None] = "5d2f7c9e1a83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "id, amount, description, type, user_id, account_id, created_at, updated_at"
+
+# Months of empty partitions to create beyond the current one
+MONTHS_AHEAD = 3
+
+CREATE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_transaction_partitions(
+    from_month date,
+    months_ahead integer
+) RETURNS integer AS $$
+DECLARE
+    start_month date := date_trunc('month', from_month)::date;
+    last_month date := (
+        date_trunc('month', timezone('UTC', now()))
+        + make_interval(months => months_ahead)
+    )::date;
+    partition_name text;
+    created integer := 0;
+BEGIN
+    WHILE start_month <= last_month LOOP
+        partition_name := format('transactions_%s', to_char(start_month, 'YYYY_MM'));
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF transactions '
+                'FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                start_month::timestamp AT TIME ZONE 'UTC',
+                (start_month + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+            );
+            created := created + 1;
+        END IF;
+        start_month := (start_month + interval '1 month')::date;
+    END LOOP;
+    RETURN created;
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def _create_indexes() -> None:
+    # Created on the parent, so every partition, including future ones,
+    # gets its own copy.
+    op.create_index(
+        "ix_transactions_user_id_created_at",
+        "transactions",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_transactions_user_id_type_created_at",
+        "transactions",
+        ["user_id", "type", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_transactions_account_id_created_at",
+        "transactions",
+        ["account_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def _rename_constraints(table: str) -> None:
+    """Rename the constraints of `transactions`, renamed to `table`."""
+    for constraint in ("pkey", "user_id_fkey", "account_id_fkey"):
+        op.execute(
+            f"ALTER TABLE {table} RENAME CONSTRAINT "
+            f"transactions_{constraint} TO {table}_{constraint}"
+        )
+
+
+def _drop_indexes(table: str) -> None:
+    for index in (
+        "ix_transactions_account_id_created_at",
+        "ix_transactions_user_id_type_created_at",
+        "ix_transactions_user_id_created_at",
+    ):
+        op.drop_index(index, table_name=table)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.rename_table("transactions", "transactions_unpartitioned")
+    _rename_constraints("transactions_unpartitioned")
+    _drop_indexes("transactions_unpartitioned")
+
+    op.execute("""
+        CREATE TABLE transactions (
+            id integer NOT NULL DEFAULT nextval('transactions_id_seq'),
+            amount numeric(10, 2) NOT NULL,
+            description varchar(255),
+            type transactiontype NOT NULL,
+            user_id integer NOT NULL,
+            account_id integer NOT NULL,
+            created_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            CONSTRAINT transactions_pkey PRIMARY KEY (id, created_at),
+            CONSTRAINT transactions_user_id_fkey
+                FOREIGN KEY (user_id) REFERENCES users (id),
+            CONSTRAINT transactions_account_id_fkey
+                FOREIGN KEY (account_id) REFERENCES accounts (id)
+        ) PARTITION BY RANGE (created_at)
+        """)
+    op.execute(CREATE_PARTITIONS_FUNCTION)
+    op.execute(f"""
+        SELECT create_transaction_partitions(
+            COALESCE(
+                (SELECT timezone('UTC', min(created_at))::date
+                 FROM transactions_unpartitioned),
+                timezone('UTC', now())::date
+            ),
+            {MONTHS_AHEAD}
+        )
+        """)
+    op.execute(
+        f"INSERT INTO transactions ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM transactions_unpartitioned"
+    )
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+    op.drop_table("transactions_unpartitioned")
+    _create_indexes()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _drop_indexes("transactions")
+    op.rename_table("transactions", "transactions_partitioned")
+    _rename_constraints("transactions_partitioned")
+    op.execute("""
+        CREATE TABLE transactions (
+            id integer NOT NULL DEFAULT nextval('transactions_id_seq'),
+            amount numeric(10, 2) NOT NULL,
+            description varchar(255),
+            type transactiontype NOT NULL,
+            user_id integer NOT NULL,
+            account_id integer NOT NULL,
+            created_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            CONSTRAINT transactions_pkey PRIMARY KEY (id),
+            CONSTRAINT transactions_user_id_fkey
+                FOREIGN KEY (user_id) REFERENCES users (id),
+            CONSTRAINT transactions_account_id_fkey
+                FOREIGN KEY (account_id) REFERENCES accounts (id)
+        )
+        """)
+    op.execute(
+        f"INSERT INTO transactions ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM transactions_partitioned"
+    )
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+    op.drop_table("transactions_partitioned")
+    op.execute("DROP FUNCTION create_transaction_partitions(date, integer)")
+    _create_indexes()
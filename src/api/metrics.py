@@ -0,0 +1,56 @@
+from dishka.integrations.fastapi import FromDishka, inject
+from fastapi import APIRouter, Response
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.hashing import PasswordHasher
+from src.core.token_cache import TokenCache
+from src.core.metrics import (
+    CACHE_HIT_RATIO,
+    CACHE_HITS,
+    CACHE_INVALIDATIONS,
+    CACHE_MISSES,
+    CACHE_SIZE,
+    CONTENT_TYPE,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    PASSWORD_HASH_PENDING,
+    registry,
+)
+from src.db.repositories import UserCache
+from src.services import SummaryCache
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+@inject
+async def metrics(
+    engine: FromDishka[AsyncEngine],
+    hasher: FromDishka[PasswordHasher],
+    user_cache: FromDishka[UserCache],
+    summary_cache: FromDishka[SummaryCache],
+    token_cache: FromDishka[TokenCache],
+) -> Response:
+    """Expose process metrics in the Prometheus text format."""
+    pool = engine.pool
+    # Only queue pools track sizes; in-memory SQLite uses a static pool
+    if hasattr(pool, "checkedout"):
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+        DB_POOL_SIZE.set(pool.size())
+
+    PASSWORD_HASH_PENDING.set(hasher.pending)
+
+    for name, cache in (
+        ("user", user_cache),
+        ("summary", summary_cache),
+        ("token", token_cache),
+    ):
+        CACHE_HITS.set_total(cache.hits, cache=name)
+        CACHE_MISSES.set_total(cache.misses, cache=name)
+        CACHE_INVALIDATIONS.set_total(cache.invalidations, cache=name)
+        CACHE_HIT_RATIO.set(cache.hit_ratio, cache=name)
+        CACHE_SIZE.set(len(cache), cache=name)
+
+    return Response(registry.render(), media_type=CONTENT_TYPE)
@@ -3,14 +3,31 @@ from fastapi import APIRouter
 from .users import router as user_router
 from .transactions import router as transactions_router
 from .accounts import router as accounts_router
+from .jobs import router as jobs_router
+from .batch import router as batch_router
 
 __all__ = [
     "user_router",
     "transactions_router",
     "accounts_router",
+    "jobs_router",
+    "batch_router",
+    "IDEMPOTENT_PATHS",
 ]
 
 router = APIRouter(prefix="/api/v1")
+
+# Create endpoints that honour an Idempotency-Key header
+IDEMPOTENT_PATHS = (
+    "/api/v1/accounts/",
+    "/api/v1/transactions/",
+    "/api/v1/transactions/bulk",
+    "/api/v1/batch/",
+    "/api/v1/jobs/",
+)
+
 router.include_router(user_router)
 router.include_router(transactions_router)
 router.include_router(accounts_router)
+router.include_router(jobs_router)
+router.include_router(batch_router)
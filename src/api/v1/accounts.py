@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from dishka.integrations.fastapi import inject, FromDishka
 
+from src.core.config import settings
 from src.core.helpers import get_current_user
 from src.core.schemas.account import AccountCreate, AccountRead, AccountUpdate
-from src.db.models.user import User
+from src.core.serialization import ResponseSerializer
+from src.models.domain.account import Account
+from src.models.domain.user import User
 from src.services import AccountService
 
 router = APIRouter(
@@ -11,6 +14,16 @@ router = APIRouter(
     tags=["accounts"],
 )
 
+account_serializer = ResponseSerializer(AccountRead, Account)
+account_list_serializer = ResponseSerializer(list[AccountRead], list[Account])
+
+TransactionsLimit = Query(
+    settings.accounts_transactions_limit,
+    ge=0,
+    le=settings.accounts_max_transactions_limit,
+    description="Number of latest transactions to include per account",
+)
+
 
 @router.get(
     "/",
@@ -19,9 +32,14 @@ router = APIRouter(
 @inject
 async def read_accounts(
     service: FromDishka[AccountService],
+    transactions_limit: int = TransactionsLimit,
     current_user: User = Depends(get_current_user),
 ):
-    return await service.get_accounts(user_id=current_user.id)
+    accounts = await service.get_accounts(
+        user_id=current_user.id,
+        transactions_limit=transactions_limit,
+    )
+    return account_list_serializer.respond(accounts)
 
 
 @router.get(
@@ -32,12 +50,15 @@ async def read_accounts(
 async def read_account(
     service: FromDishka[AccountService],
     account_id: int,
+    transactions_limit: int = TransactionsLimit,
     current_user: User = Depends(get_current_user),
 ):
-    return await service.get_account(
+    account = await service.get_account(
         account_id=account_id,
         user_id=current_user.id,
+        transactions_limit=transactions_limit,
     )
+    return account_serializer.respond(account)
 
 
 @router.post(
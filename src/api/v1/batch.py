@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends
+from dishka.integrations.fastapi import inject, FromDishka
+
+from src.core.helpers import get_current_user
+from src.core.schemas.batch import BatchRequest, BatchResult
+from src.core.serialization import ResponseSerializer
+from src.models.domain.batch import BatchResult as BatchResultDomain
+from src.models.domain.user import User
+from src.services import BatchService
+
+router = APIRouter(
+    prefix="/batch",
+    tags=["batch"],
+)
+
+batch_serializer = ResponseSerializer(BatchResult, BatchResultDomain)
+
+
+@router.post(
+    "/",
+    response_model=BatchResult,
+)
+@inject
+async def run_batch(
+    service: FromDishka[BatchService],
+    batch: BatchRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Run account and transaction operations in order, in one database
+    transaction. Each operation gets the status it would have had as a
+    separate request; in atomic mode a failure rolls back the whole batch.
+    """
+    result = await service.execute(
+        batch.operations,
+        mode=batch.mode,
+        user_id=current_user.id,
+    )
+    return batch_serializer.respond(result)
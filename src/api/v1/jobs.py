@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Depends, status
+from dishka.integrations.fastapi import inject, FromDishka
+
+from src.core.helpers import get_current_superuser, get_current_user
+from src.core.schemas.job import JobCreate, JobRead
+from src.models.domain.user import User
+from src.services import JobService
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"],
+)
+
+
+@router.post(
+    "/",
+    response_model=JobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+@inject
+async def create_job(
+    job_create: JobCreate,
+    service: FromDishka[JobService],
+    current_user: User = Depends(get_current_superuser),
+):
+    """
+    Enqueue a maintenance job. These jobs act on every user's data, so
+    only superusers may start them; poll GET /jobs/{job_id} for progress.
+    """
+    return await service.enqueue(
+        job_create.kind, job_create.params, user_id=current_user.id
+    )
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobRead,
+)
+@inject
+async def read_job(
+    service: FromDishka[JobService],
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+):
+    return await service.get_job(job_id=job_id, user_id=current_user.id)
+
+
+@router.post(
+    "/{job_id}/cancel",
+    response_model=JobRead,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+@inject
+async def cancel_job(
+    service: FromDishka[JobService],
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Request cancellation of a job. Pending jobs are cancelled at once;
+    running jobs stop shortly after, at their next cancellation check.
+    """
+    return await service.cancel_job(job_id=job_id, user_id=current_user.id)
@@ -1,49 +1,185 @@
-from fastapi import APIRouter, Depends, status
+import hashlib
+from datetime import date, datetime
+
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
 from dishka.integrations.fastapi import inject, FromDishka
 
+from src.core.config import settings
 from src.core.helpers import get_current_user
+from src.core.serialization import ResponseSerializer
 from src.core.schemas.transaction import (
+    TransactionAnalytics,
+    TransactionBulkCreate,
+    TransactionBulkResult,
     TransactionCreate,
+    TransactionPage,
     TransactionRead,
     TransactionUpdate,
     TransactionSummary,
 )
-from src.models.enums import TransactionType
+from src.models.enums import AnalyticsBucket, ExportFormat, TransactionType
 from src.services import TransactionService
-from src.db.models import User
+from src.models.domain.transaction import (
+    Transaction,
+    TransactionAnalytics as TransactionAnalyticsDomain,
+    TransactionBulkResult as TransactionBulkResultDomain,
+    TransactionPage as TransactionPageDomain,
+)
+from src.models.domain.user import User
 
 router = APIRouter(
     prefix="/transactions",
     tags=["transactions"],
 )
 
+transaction_serializer = ResponseSerializer(TransactionRead, Transaction)
+transaction_page_serializer = ResponseSerializer(TransactionPage, TransactionPageDomain)
+transaction_bulk_serializer = ResponseSerializer(
+    TransactionBulkResult, TransactionBulkResultDomain
+)
+transaction_analytics_serializer = ResponseSerializer(
+    TransactionAnalytics, TransactionAnalyticsDomain
+)
+
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
 
 @router.get(
     "/dashboard",
     response_model=TransactionSummary,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Summary unchanged"}},
 )
 @inject
 async def dashboard(
+    response: Response,
+    service: FromDishka[TransactionService],
+    current_user: User = Depends(get_current_user),
+    if_none_match: str | None = Header(None),
+):
+    """
+    Return the dashboard summary.
+
+    The ETag tracks the user's ledger version; a matching If-None-Match is
+    answered with 304 from the cache, without querying the database.
+    """
+    headers = {"Cache-Control": "private, no-cache"}
+    cached = service.get_cached_summary(current_user.id)
+    if cached is not None and _etag_matches(cached.etag, if_none_match):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={**headers, "ETag": cached.etag, "X-Cache": "HIT"},
+        )
+
+    entry = cached or await service.get_summary_entry(current_user.id)
+    response.headers.update(headers)
+    response.headers["ETag"] = entry.etag
+    response.headers["X-Cache"] = "HIT" if cached is not None else "MISS"
+    return entry.summary
+
+
+@router.get(
+    "/analytics",
+    response_model=TransactionAnalytics,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Series unchanged"}},
+)
+@inject
+async def transaction_analytics(
+    service: FromDishka[TransactionService],
+    bucket: AnalyticsBucket = AnalyticsBucket.DAY,
+    date_from: date | None = Query(None, alias="from"),
+    date_to: date | None = Query(None, alias="to"),
+    account_id: int | None = None,
+    tz: str = "UTC",
+    current_user: User = Depends(get_current_user),
+    if_none_match: str | None = Header(None),
+):
+    """
+    Return income and expense totals per day, week or month.
+
+    `from` and `to` are local dates in `tz`, `to` exclusive. Editing or
+    deleting a past transaction changes even a completed range, so clients
+    must always revalidate; the ETag lets them do so without the body.
+    """
+    analytics = await service.get_analytics(
+        user_id=current_user.id,
+        bucket=bucket,
+        tz_name=tz,
+        date_from=date_from,
+        date_to=date_to,
+        account_id=account_id,
+        max_periods=settings.analytics_max_periods,
+    )
+    body = transaction_analytics_serializer.dump_json(analytics)
+    etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+    headers = {"Cache-Control": "private, no-cache", "ETag": etag}
+    if _etag_matches(etag, if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+)
+@inject
+async def export_transactions(
     service: FromDishka[TransactionService],
+    export_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    account_id: int | None = None,
     current_user: User = Depends(get_current_user),
 ):
-    return await service.get_summary(current_user.id)
+    media_type = (
+        "text/csv" if export_format == ExportFormat.CSV else "application/x-ndjson"
+    )
+    return StreamingResponse(
+        service.export_transactions(
+            user_id=current_user.id,
+            export_format=export_format,
+            date_from=date_from,
+            date_to=date_to,
+            account_id=account_id,
+            fetch_size=settings.transactions_export_fetch_size,
+        ),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="transactions.{export_format.value}"'
+            )
+        },
+    )
 
 
 @router.get(
     "/",
-    response_model=list[TransactionRead],
+    response_model=TransactionPage,
 )
 @inject
 async def read_transactions(
     service: FromDishka[TransactionService],
     transaction_type: TransactionType = TransactionType.EXPENSE,
+    cursor: str | None = None,
+    limit: int = Query(
+        settings.transactions_page_size,
+        ge=1,
+        le=settings.transactions_max_page_size,
+    ),
     current_user: User = Depends(get_current_user),
 ):
-    return await service.get_transactions(
+    page = await service.get_transactions(
         user_id=current_user.id,
         transaction_type=transaction_type,
+        cursor=cursor,
+        limit=limit,
     )
+    return transaction_page_serializer.respond(page)
 
 
 @router.post(
@@ -63,6 +199,23 @@ async def create_transaction(
     )
 
 
+@router.post(
+    "/bulk",
+    response_model=TransactionBulkResult,
+)
+@inject
+async def create_transactions_bulk(
+    service: FromDishka[TransactionService],
+    bulk_data: TransactionBulkCreate,
+    current_user: User = Depends(get_current_user),
+):
+    result = await service.add_transactions(
+        items=bulk_data.items,
+        user_id=current_user.id,
+    )
+    return transaction_bulk_serializer.respond(result)
+
+
 @router.get(
     "/{transaction_id}",
     response_model=TransactionRead,
@@ -73,10 +226,11 @@ async def read_transaction(
     transaction_id: int,
     current_user: User = Depends(get_current_user),
 ):
-    return await service.get_transaction(
+    transaction = await service.get_transaction(
         transaction_id=transaction_id,
         user_id=current_user.id,
     )
+    return transaction_serializer.respond(transaction)
 
 
 @router.put(
@@ -2,13 +2,16 @@ from fastapi import APIRouter, status, Depends
 from dishka.integrations.fastapi import inject, FromDishka
 
 from src.core import get_current_token
+from src.core.helpers import get_current_superuser, get_current_user
 from src.core.schemas.user import (
     UserCreate,
     UserLoginRequest,
+    UserPasswordChange,
     UserRead,
     UserLoginResponse,
     UserRefreshResponse,
 )
+from src.models.domain.user import User
 from src.services import UserService, AuthService
 
 router = APIRouter(
@@ -68,3 +71,48 @@ async def read_current_user(
 ) -> UserRead:
     """Get the current authenticated user from the access token."""
     return await service.get_by_id(int(token_payload.sub))
+
+
+@router.put(
+    "/me/password",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+@inject
+async def change_password(
+    password_change: UserPasswordChange,
+    service: FromDishka[UserService],
+    current_user: User = Depends(get_current_user),
+):
+    """Change the current user's password, given their current one."""
+    await service.change_password(
+        current_user.id,
+        password_change.current_password,
+        password_change.new_password,
+    )
+
+
+@router.delete(
+    "/me",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+@inject
+async def delete_current_user(
+    service: FromDishka[UserService],
+    current_user: User = Depends(get_current_user),
+):
+    """Delete the current user along with their accounts and transactions."""
+    await service.delete(current_user.id)
+
+
+@router.post(
+    "/{user_id}/deactivate",
+    response_model=UserRead,
+)
+@inject
+async def deactivate_user(
+    user_id: int,
+    service: FromDishka[UserService],
+    current_user: User = Depends(get_current_superuser),
+) -> UserRead:
+    """Deactivate a user, who can no longer use the API. Superusers only."""
+    return await service.deactivate(user_id)
@@ -0,0 +1,53 @@
+"""
+Rebuild or verify the daily_totals rollup from the transaction ledger.
+
+Usage:
+    python -m src.commands.daily_totals backfill
+    python -m src.commands.daily_totals verify
+"""
+
+import argparse
+import asyncio
+import sys
+
+from src.core.config import settings
+from src.db import create_engine, create_sessionmaker
+from src.db.repositories import DailyTotalRepository
+
+
+async def backfill() -> int:
+    engine = create_engine(settings)
+    try:
+        async with create_sessionmaker(engine)() as session:
+            buckets = await DailyTotalRepository(session).rebuild()
+            await session.commit()
+    finally:
+        await engine.dispose()
+    print(f"Rebuilt daily totals: {buckets} buckets")
+    return 0
+
+
+async def verify() -> int:
+    engine = create_engine(settings)
+    try:
+        async with create_sessionmaker(engine)() as session:
+            mismatches = await DailyTotalRepository(session).verify()
+    finally:
+        await engine.dispose()
+
+    for key, expected, actual in mismatches:
+        print(f"Mismatch {key}: expected {expected}, found {actual}")
+    print(f"Daily totals verified: {len(mismatches)} mismatching buckets")
+    return 1 if mismatches else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("command", choices=["backfill", "verify"])
+    args = parser.parse_args()
+    command = backfill if args.command == "backfill" else verify
+    sys.exit(asyncio.run(command()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Create, check, list or detach the monthly partitions of the transactions
+table.
+
+Usage:
+    python -m src.commands.partitions ensure
+    python -m src.commands.partitions ensure --months-ahead 6
+    python -m src.commands.partitions check
+    python -m src.commands.partitions list
+    python -m src.commands.partitions detach --before 2025-01-01
+
+Postgres only; on other databases every command reports nothing to do.
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import date
+
+from src.core.config import settings
+from src.db import create_engine
+from src.db.partitions import (
+    detach_transaction_partitions,
+    ensure_transaction_partitions,
+    list_transaction_partitions,
+    missing_transaction_partitions,
+)
+
+
+async def run(args: argparse.Namespace) -> int:
+    engine = create_engine(settings)
+    try:
+        if args.command == "ensure":
+            created = await ensure_transaction_partitions(engine, args.months_ahead)
+            print(f"Created {created} partitions")
+        elif args.command == "check":
+            missing = await missing_transaction_partitions(engine, args.months_ahead)
+            for name in missing:
+                print(f"Missing {name}")
+            print(f"{len(missing)} partitions missing")
+            return 1 if missing else 0
+        elif args.command == "list":
+            partitions = await list_transaction_partitions(engine)
+            for name, month in partitions.items():
+                print(f"{name}\t{month:%Y-%m}")
+            print(f"{len(partitions)} partitions attached")
+        else:
+            detached = await detach_transaction_partitions(engine, args.before)
+            for name in detached:
+                print(f"Detached {name}")
+            print(f"Detached {len(detached)} partitions")
+    finally:
+        await engine.dispose()
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("command", choices=["ensure", "check", "list", "detach"])
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=settings.transactions_partitions_ahead,
+        help="months of partitions to create, or require, beyond the current one",
+    )
+    parser.add_argument(
+        "--before",
+        type=date.fromisoformat,
+        help="detach the months that end on or before this date (YYYY-MM-DD)",
+    )
+    args = parser.parse_args()
+    if args.command == "detach" and args.before is None:
+        parser.error("detach requires --before")
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Check account balances against the transaction ledger, optionally repairing drift.
+
+Usage:
+    python -m src.commands.reconcile
+    python -m src.commands.reconcile --repair
+    python -m src.commands.reconcile --chunk-size 5000
+"""
+
+import argparse
+import asyncio
+import sys
+
+from src.core.config import settings
+from src.db import UnitOfWork, create_engine, create_sessionmaker
+from src.db.repositories import AccountRepository
+from src.services import ReconciliationService
+
+
+async def reconcile(repair: bool, chunk_size: int) -> int:
+    engine = create_engine(settings)
+    try:
+        async with create_sessionmaker(engine)() as session:
+            service = ReconciliationService(
+                AccountRepository(session), UnitOfWork(session)
+            )
+            report = await service.reconcile(repair=repair, chunk_size=chunk_size)
+    finally:
+        await engine.dispose()
+
+    for drift in report.drifts:
+        print(
+            f"Drift on account {drift.account_id} (user {drift.user_id}): "
+            f"recorded {drift.recorded}, expected {drift.expected}"
+        )
+    action = "repaired" if repair else "found"
+    print(
+        f"Checked {report.accounts_checked} accounts: "
+        f"{report.drifted_accounts} drifted balances {action}"
+    )
+    return 1 if report.drifted_accounts and not repair else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--repair",
+        action="store_true",
+        help="set drifted balances to their expected value",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.reconcile_chunk_size,
+        help="accounts per aggregate query",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(reconcile(args.repair, args.chunk_size)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,43 @@
-from .config import settings
-from .auth_config import (
-    security,
-    get_password_hash,
-    verify_password,
-    generate_access_token,
-)
-from .helpers import (
-    get_current_token,
-    get_current_user_id,
-)
+"""
+Core configuration, security and helpers.
+
+Names are imported from their submodules on first access, so importing
+`src.core` (or `src.core.config`, as Alembic does) does not pull in the
+auth stack or FastAPI.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import settings
+    from .auth_config import (
+        security,
+        get_password_hash,
+        verify_password,
+        generate_access_token,
+    )
+    from .helpers import (
+        get_current_token,
+        get_current_user_id,
+    )
+
+_EXPORTS = {
+    "settings": ".config",
+    "security": ".auth_config",
+    "get_password_hash": ".auth_config",
+    "verify_password": ".auth_config",
+    "generate_access_token": ".auth_config",
+    "get_current_token": ".helpers",
+    "get_current_user_id": ".helpers",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,38 +1,63 @@
-from pwdlib import PasswordHash
 from datetime import timedelta
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
-from authx import AuthX, AuthXConfig
-
-from src.db.models.user import User
 from src.core.config import settings
 
-auth_config = AuthXConfig()
-auth_config.JWT_ALGORITHM = settings.jwt_algorithm
-auth_config.JWT_SECRET_KEY = settings.jwt_secret
-auth_config.JWT_ACCESS_TOKEN_EXPIRES = timedelta(
-    seconds=settings.jwt_access_token_lifetime
-)
-auth_config.JWT_REFRESH_TOKEN_EXPIRES = timedelta(
-    seconds=settings.jwt_refresh_token_lifetime
-)
-auth_config.JWT_TOKEN_LOCATION = ["headers"]
+if TYPE_CHECKING:
+    from authx import AuthX
+    from pwdlib import PasswordHash
+
+    from src.db.models.user import User
+
+
+# AuthX and the password hasher are built on first use: importing authx
+# (with PyJWT and cryptography) and argon2 is a large share of start-up time.
+@cache
+def get_security() -> "AuthX":
+    from authx import AuthX, AuthXConfig
+
+    auth_config = AuthXConfig()
+    auth_config.JWT_ALGORITHM = settings.jwt_algorithm
+    auth_config.JWT_SECRET_KEY = settings.jwt_secret
+    auth_config.JWT_ACCESS_TOKEN_EXPIRES = timedelta(
+        seconds=settings.jwt_access_token_lifetime
+    )
+    auth_config.JWT_REFRESH_TOKEN_EXPIRES = timedelta(
+        seconds=settings.jwt_refresh_token_lifetime
+    )
+    auth_config.JWT_TOKEN_LOCATION = ["headers"]
+    return AuthX(config=auth_config)
+
+
+@cache
+def get_password_hasher() -> "PasswordHash":
+    from pwdlib import PasswordHash
+
+    return PasswordHash.recommended()
 
-security = AuthX(config=auth_config)
 
-password_hash = PasswordHash.recommended()
+def __getattr__(name: str) -> Any:
+    # Kept for `from src.core.auth_config import security`, which builds
+    # AuthX at import time; call get_security() where that matters.
+    if name == "security":
+        return get_security()
+    if name == "password_hash":
+        return get_password_hasher()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def verify_password(plain_password, hashed_password):
-    return password_hash.verify(plain_password, hashed_password)
+    return get_password_hasher().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password):
-    return password_hash.hash(password)
+    return get_password_hasher().hash(password)
 
 
-def generate_access_token(user: User) -> str:
+def generate_access_token(user: "User") -> str:
     """Generate access token with additional data for a given user."""
-    access_token = security.create_access_token(
+    access_token = get_security().create_access_token(
         uid=str(user.id),
         data={
             "username": user.username,
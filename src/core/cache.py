@@ -0,0 +1,76 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Size-bounded, in-process LRU cache whose entries expire after a TTL,
+    either the cache-wide one or one given per entry.
+
+    Each worker process holds its own copy, so a change made by another
+    worker only becomes visible here once the local entry expires.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or None if it is missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """
+        Store a value for `ttl` seconds (the cache's TTL by default),
+        evicting the least recently used entries if full.
+        """
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """Drop a single entry, if present."""
+        if self._data.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def invalidate_matching(self, predicate: Callable[[K, V], bool]) -> int:
+        """Drop every entry for which predicate(key, value) holds; O(size)."""
+        keys = [key for key, (_, value) in self._data.items() if predicate(key, value)]
+        for key in keys:
+            del self._data[key]
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
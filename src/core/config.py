@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -7,7 +8,22 @@ class Config(BaseSettings):
     """Configuration settings for the application."""
 
     debug: bool = True
+    # Serialize read responses in the handler with a ResponseSerializer
+    # instead of through FastAPI's response_model; the JSON is identical
+    fast_serialization: bool = True
     db_url: str
+    db_echo: bool = False
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30  # seconds
+    db_pool_recycle: int = 1800  # seconds
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 500
+    # Optional read replica for read_only repository methods. Point it at
+    # the primary's URL to exercise the routing locally.
+    db_replica_url: str | None = None
+    # Seconds a user's reads stay on the primary after they write
+    db_replica_stickiness: float = 5
 
     secret_key: str
     jwt_secret: str
@@ -15,6 +31,45 @@ class Config(BaseSettings):
     jwt_access_token_lifetime: int = 3600  # 1 hour
     jwt_refresh_token_lifetime: int = 2592000  # 30 days
 
+    password_hash_executor: Literal["thread", "process"] = "thread"
+    password_hash_max_workers: int = 2
+    password_hash_max_queue: int = 32
+
+    user_cache_ttl: float = 60  # seconds
+    user_cache_max_size: int = 10000
+    summary_cache_ttl: float = 300  # seconds
+    summary_cache_max_size: int = 10000
+    # Verified access tokens; entries also expire with the token itself
+    token_cache_ttl: float = 3600  # seconds
+    token_cache_max_size: int = 10000
+
+    accounts_transactions_limit: int = 5
+    accounts_max_transactions_limit: int = 50
+    transactions_page_size: int = 100
+    transactions_max_page_size: int = 500
+    transactions_bulk_max_items: int = 1000
+    transactions_export_fetch_size: int = 1000
+    # Postgres: monthly partitions created ahead of the current month
+    transactions_partitions_ahead: int = 3
+    analytics_max_periods: int = 366
+    batch_max_operations: int = 100
+
+    # Idempotency-Key support on create endpoints. "memory" keeps keys in
+    # each worker process, "database" shares them across processes.
+    idempotency_backend: Literal["memory", "database"] = "memory"
+    idempotency_ttl: float = 86400  # seconds a response is kept for replays
+    idempotency_max_keys: int = 10000  # memory backend only
+    idempotency_lock_timeout: float = 60  # seconds before an unfinished claim lapses
+    idempotency_wait_timeout: float = 10  # seconds a duplicate waits for the first
+    idempotency_poll_interval: float = 0.1  # seconds, for claims held elsewhere
+
+    jobs_enabled: bool = True
+    jobs_max_workers: int = 4
+    jobs_poll_interval: float = 2.0  # seconds
+    jobs_stale_after: float = 60.0  # seconds without a heartbeat
+
+    reconcile_chunk_size: int = 1000  # accounts per aggregate query
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
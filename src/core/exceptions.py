@@ -27,3 +27,21 @@ class InsufficientFundsError(DomainException):
     """Raised when an account has insufficient funds for an expense."""
 
     pass
+
+
+class ServiceOverloadedError(DomainException):
+    """Raised when a bounded resource cannot accept more work right now."""
+
+    pass
+
+
+class InvalidCursorError(DomainException):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    pass
+
+
+class InvalidParameterError(DomainException):
+    """Raised when a request parameter is well-formed but not acceptable."""
+
+    pass
@@ -6,8 +6,31 @@ from src.core.exceptions import (
     EntityAlreadyExistsError,
     InvalidCredentialsError,
     InsufficientFundsError,
+    InvalidCursorError,
+    InvalidParameterError,
+    ServiceOverloadedError,
 )
 
+# Statuses for domain errors reported inside a response body rather than
+# as the response itself, e.g. per item of a batch. Keep in line with the
+# handlers below.
+STATUS_CODES: dict[type[DomainException], int] = {
+    EntityNotFoundError: status.HTTP_404_NOT_FOUND,
+    EntityAlreadyExistsError: status.HTTP_400_BAD_REQUEST,
+    InvalidCredentialsError: status.HTTP_401_UNAUTHORIZED,
+    InsufficientFundsError: status.HTTP_422_UNPROCESSABLE_CONTENT,
+    ServiceOverloadedError: status.HTTP_503_SERVICE_UNAVAILABLE,
+    InvalidCursorError: status.HTTP_400_BAD_REQUEST,
+    InvalidParameterError: status.HTTP_400_BAD_REQUEST,
+}
+
+
+def status_code_for(exc: DomainException) -> int:
+    for exc_type in type(exc).__mro__:
+        if exc_type in STATUS_CODES:
+            return STATUS_CODES[exc_type]
+    return status.HTTP_500_INTERNAL_SERVER_ERROR
+
 
 def add_exception_handlers(app: FastAPI) -> None:
 
@@ -50,3 +73,34 @@ def add_exception_handlers(app: FastAPI) -> None:
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={"detail": exc.message},
         )
+
+    @app.exception_handler(ServiceOverloadedError)
+    async def service_overloaded_handler(
+        request: Request,
+        exc: ServiceOverloadedError,
+    ):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": exc.message},
+            headers={"Retry-After": "1"},
+        )
+
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(
+        request: Request,
+        exc: InvalidCursorError,
+    ):
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": exc.message},
+        )
+
+    @app.exception_handler(InvalidParameterError)
+    async def invalid_parameter_handler(
+        request: Request,
+        exc: InvalidParameterError,
+    ):
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={"detail": exc.message},
+        )
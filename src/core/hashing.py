@@ -0,0 +1,85 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Literal
+
+from src.core.auth_config import get_password_hash, verify_password
+from src.core.exceptions import ServiceOverloadedError
+from src.core.metrics import (
+    PASSWORD_HASH_DURATION,
+    PASSWORD_HASH_QUEUE_WAIT,
+    PASSWORD_HASH_REJECTED,
+)
+
+
+class PasswordHasher:
+    """
+    Runs Argon2 hashing in a dedicated executor, off the event loop.
+
+    At most `max_workers` hashes run at once and at most `max_queue` more
+    may wait for a slot. Calls beyond that are rejected immediately with
+    ServiceOverloadedError instead of piling up behind a login burst.
+    """
+
+    def __init__(
+        self,
+        executor: Literal["thread", "process"] = "thread",
+        max_workers: int = 2,
+        max_queue: int = 32,
+    ):
+        self.executor = executor
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of hashing calls currently running or waiting."""
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run("verify", verify_password, password, hashed_password)
+
+    def shutdown(self) -> None:
+        """Stop the executor, waiting for running hashes to finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash",
+                )
+        return self._executor
+
+    async def _run(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_workers + self.max_queue:
+            PASSWORD_HASH_REJECTED.inc()
+            raise ServiceOverloadedError(
+                "Too many authentication requests, please retry shortly"
+            )
+
+        self._pending += 1
+        enqueued_at = time.perf_counter()
+        try:
+            async with self._semaphore:
+                started_at = time.perf_counter()
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self._get_executor(), func, *args)
+                finished_at = time.perf_counter()
+        finally:
+            self._pending -= 1
+
+        PASSWORD_HASH_QUEUE_WAIT.observe(started_at - enqueued_at, operation=operation)
+        PASSWORD_HASH_DURATION.observe(finished_at - started_at, operation=operation)
+        return result
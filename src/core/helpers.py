@@ -1,18 +1,26 @@
-from authx import RequestToken
+from dishka.integrations.fastapi import inject, FromDishka
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from src.db import db_session_manager
-from src.db.models.user import User
-from src.core.auth_config import security
+from src.db import current_user_id
+from src.db.repositories import UserRepository
+from src.models.domain.user import User
+from src.core.token_cache import TokenCache
 
 
-async def get_current_token(credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer())):
-    """Extract and verify access token from Authorization header."""
+@inject
+async def get_current_token(
+    cache: FromDishka[TokenCache],
+    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer()),
+):
+    """
+    Extract and verify access token from Authorization header.
+
+    Verified payloads are cached until the token expires, so a token
+    reused across requests costs a single lookup after its first use.
+    """
     try:
-        token = RequestToken(token=credentials.credentials, location="headers")
-        payload = security.verify_token(token)
-        return payload
+        return cache.verify(credentials.credentials)
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -21,22 +29,36 @@ async def get_current_token(credentials: HTTPAuthorizationCredentials = Depends(
         )
 
 
+@inject
 async def get_current_user(
+    repo: FromDishka[UserRepository],
     token_payload=Depends(get_current_token),
-    session=Depends(db_session_manager.get_async_session),
 ) -> User:
     """Get the current authenticated user from token."""
-    from sqlalchemy import select
+    user = await repo.get(int(token_payload.sub))
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user"
+        )
+    # Lets the database session keep this user's reads on the primary
+    # right after they write (see src.db.routing)
+    current_user_id.set(user.id)
+    return user
 
-    user_id = token_payload.sub
 
-    async with session as session:
-        user = await session.scalar(select(User).where(User.id == int(user_id)))
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-            )
-        return user
+async def get_current_superuser(
+    current_user: User = Depends(get_current_user),
+) -> User:
+    """Get the current user, who must be a superuser."""
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+        )
+    return current_user
 
 
 async def get_current_user_id(token_payload=Depends(get_current_token)) -> int:
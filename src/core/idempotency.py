@@ -0,0 +1,167 @@
+"""
+Stores for Idempotency-Key handling (see IdempotencyMiddleware).
+
+A store keeps, per key, the hash of the request that first used it and,
+once that request finished, the response to replay for its retries.
+While the first request runs its key is claimed, so a concurrent
+duplicate waits for it instead of running the request a second time.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.core.cache import TTLCache
+from src.db.repositories import IdempotencyRepository
+from src.models.domain.idempotency import IdempotencyRecord
+
+# Minimum time between sweeps of expired keys from the database
+PURGE_INTERVAL = timedelta(minutes=5)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class IdempotencyStore(ABC):
+    """
+    Keeps finished responses for `ttl` seconds. A claim left unfinished,
+    e.g. by a crashed worker, is given up after `lock_timeout` seconds.
+    """
+
+    def __init__(self, ttl: float, lock_timeout: float):
+        self.ttl = timedelta(seconds=ttl)
+        self.lock_timeout = timedelta(seconds=lock_timeout)
+
+    @abstractmethod
+    async def claim(self, key: str, request_hash: str) -> IdempotencyRecord | None:
+        """
+        Claim key for a new request and return None, or return the record
+        already held for it: either finished, or claimed by another request.
+        """
+
+    @abstractmethod
+    async def complete(
+        self,
+        key: str,
+        status_code: int,
+        headers: list[list[str]],
+        body: bytes,
+    ) -> None:
+        """Store the response of a claimed request for replaying."""
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """Give up a claim without storing a response."""
+
+    def _new_record(self, key: str, request_hash: str) -> IdempotencyRecord:
+        now = _now()
+        return IdempotencyRecord(
+            key=key,
+            request_hash=request_hash,
+            locked_until=now + self.lock_timeout,
+            expires_at=now + self.ttl,
+        )
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """
+    Per-process LRU of idempotency records, for single-node deployments.
+
+    Retries that reach another worker process are not recognised.
+    """
+
+    def __init__(self, max_size: int, ttl: float, lock_timeout: float):
+        super().__init__(ttl, lock_timeout)
+        self._records: TTLCache[str, IdempotencyRecord] = TTLCache(max_size, ttl)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    async def claim(self, key: str, request_hash: str) -> IdempotencyRecord | None:
+        record = self._records.get(key)
+        if record is not None and (record.completed or record.locked_until > _now()):
+            return record
+        self._records.set(key, self._new_record(key, request_hash))
+        return None
+
+    async def complete(
+        self,
+        key: str,
+        status_code: int,
+        headers: list[list[str]],
+        body: bytes,
+    ) -> None:
+        if (record := self._records.get(key)) is not None:
+            self._records.set(
+                key,
+                record.model_copy(
+                    update={
+                        "status_code": status_code,
+                        "headers": headers,
+                        "body": body,
+                        "expires_at": _now() + self.ttl,
+                    }
+                ),
+            )
+
+    async def release(self, key: str) -> None:
+        record = self._records.get(key)
+        if record is not None and not record.completed:
+            self._records.invalidate(key)
+
+
+class DatabaseIdempotencyStore(IdempotencyStore):
+    """
+    Idempotency records in the idempotency_keys table, shared by every
+    worker process. Each call runs in its own short transaction, apart
+    from the request's unit of work.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker,
+        ttl: float,
+        lock_timeout: float,
+    ):
+        super().__init__(ttl, lock_timeout)
+        self.sessionmaker = sessionmaker
+        self._purged_at = datetime.min.replace(tzinfo=timezone.utc)
+
+    @asynccontextmanager
+    async def repository(self) -> AsyncIterator[IdempotencyRepository]:
+        """An IdempotencyRepository on its own session, committed on exit."""
+        async with self.sessionmaker() as session:
+            yield IdempotencyRepository(session)
+            await session.commit()
+
+    async def claim(self, key: str, request_hash: str) -> IdempotencyRecord | None:
+        record = self._new_record(key, request_hash)
+        now = _now()
+        async with self.repository() as repo:
+            if now - self._purged_at >= PURGE_INTERVAL:
+                self._purged_at = now
+                await repo.delete_expired(now)
+            # The holder may release the key between the two statements;
+            # then it is free again and the next attempt claims it.
+            while not await repo.claim(record, now):
+                if (existing := await repo.get_record(key)) is not None:
+                    return existing
+        return None
+
+    async def complete(
+        self,
+        key: str,
+        status_code: int,
+        headers: list[list[str]],
+        body: bytes,
+    ) -> None:
+        async with self.repository() as repo:
+            await repo.complete(key, status_code, headers, body, _now() + self.ttl)
+
+    async def release(self, key: str) -> None:
+        async with self.repository() as repo:
+            await repo.release(key)
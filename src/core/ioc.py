@@ -1,36 +1,71 @@
-from typing import AsyncIterable
+from typing import AsyncIterable, Iterable, NewType
 
 from dishka import Container, Provider, Scope, provide, make_async_container
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     AsyncEngine,
-    create_async_engine,
     async_sessionmaker,
 )
 
 from src.core import settings
-from src.db.repositories import UserRepository, TransactionRepository, AccountRepository
-from src.services import UserService, AuthService, TransactionService, AccountService
+from src.core.hashing import PasswordHasher
+from src.core.idempotency import (
+    DatabaseIdempotencyStore,
+    IdempotencyStore,
+    MemoryIdempotencyStore,
+)
+from src.core.jobs import JobRunner
+from src.core.token_cache import TokenCache
+from src.db import RecentWriters, UnitOfWork, create_engine, create_sessionmaker
+from src.db.repositories import (
+    UserCache,
+    UserRepository,
+    TransactionRepository,
+    AccountRepository,
+    DailyTotalRepository,
+    JobRepository,
+)
+from src.services import (
+    UserService,
+    AuthService,
+    TransactionService,
+    AccountService,
+    SummaryCache,
+    JobService,
+    ReconciliationService,
+    BatchService,
+    JOB_HANDLERS,
+)
+
+ReplicaEngine = NewType("ReplicaEngine", AsyncEngine)
 
 
 class DatabaseProvider(Provider):
     """Provides database-related dependencies."""
 
     @provide(scope=Scope.APP)
-    def get_engine(self) -> AsyncEngine:
-        return create_async_engine(
-            settings.db_url,
-            echo=True,
-        )
+    async def get_engine(self) -> AsyncIterable[AsyncEngine]:
+        engine = create_engine(settings)
+        yield engine
+        await engine.dispose()
 
     @provide(scope=Scope.APP)
-    def get_sessionmaker(self, engine: AsyncEngine) -> async_sessionmaker:
-        return async_sessionmaker(
-            bind=engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-            autoflush=False,
-        )
+    async def get_replica_engine(self) -> AsyncIterable[ReplicaEngine | None]:
+        if not settings.db_replica_url:
+            yield None
+            return
+        engine = create_engine(settings, settings.db_replica_url, read_only=True)
+        yield ReplicaEngine(engine)
+        await engine.dispose()
+
+    @provide(scope=Scope.APP)
+    def get_sessionmaker(
+        self,
+        engine: AsyncEngine,
+        replica: ReplicaEngine | None,
+        recent_writers: RecentWriters,
+    ) -> async_sessionmaker:
+        return create_sessionmaker(engine, replica, recent_writers)
 
     @provide(scope=Scope.REQUEST)
     async def get_session(
@@ -39,13 +74,103 @@ class DatabaseProvider(Provider):
         async with factory() as session:
             yield session
 
+    @provide(scope=Scope.REQUEST)
+    def get_unit_of_work(
+        self, session: AsyncSession, recent_writers: RecentWriters
+    ) -> UnitOfWork:
+        return UnitOfWork(session, recent_writers)
+
+
+class SecurityProvider(Provider):
+    """Provides authentication-related dependencies."""
+
+    @provide(scope=Scope.APP)
+    def get_password_hasher(self) -> Iterable[PasswordHasher]:
+        hasher = PasswordHasher(
+            executor=settings.password_hash_executor,
+            max_workers=settings.password_hash_max_workers,
+            max_queue=settings.password_hash_max_queue,
+        )
+        yield hasher
+        hasher.shutdown()
+
+
+class CacheProvider(Provider):
+    """Provides process-wide in-memory caches."""
+
+    @provide(scope=Scope.APP)
+    def get_user_cache(self) -> UserCache:
+        return UserCache(
+            max_size=settings.user_cache_max_size,
+            ttl=settings.user_cache_ttl,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_recent_writers(self) -> RecentWriters:
+        return RecentWriters(
+            max_size=settings.user_cache_max_size,
+            ttl=settings.db_replica_stickiness,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_token_cache(self) -> TokenCache:
+        return TokenCache(
+            max_size=settings.token_cache_max_size,
+            ttl=settings.token_cache_ttl,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_summary_cache(self) -> SummaryCache:
+        return SummaryCache(
+            max_size=settings.summary_cache_max_size,
+            ttl=settings.summary_cache_ttl,
+        )
+
+
+class IdempotencyProvider(Provider):
+    """Provides the store backing Idempotency-Key handling."""
+
+    @provide(scope=Scope.APP)
+    def get_idempotency_store(self, factory: async_sessionmaker) -> IdempotencyStore:
+        if settings.idempotency_backend == "database":
+            return DatabaseIdempotencyStore(
+                factory,
+                ttl=settings.idempotency_ttl,
+                lock_timeout=settings.idempotency_lock_timeout,
+            )
+        return MemoryIdempotencyStore(
+            max_size=settings.idempotency_max_keys,
+            ttl=settings.idempotency_ttl,
+            lock_timeout=settings.idempotency_lock_timeout,
+        )
+
+
+class JobProvider(Provider):
+    """Provides the background job runner."""
+
+    @provide(scope=Scope.APP)
+    async def get_job_runner(
+        self, factory: async_sessionmaker
+    ) -> AsyncIterable[JobRunner]:
+        runner = JobRunner(
+            factory,
+            handlers=JOB_HANDLERS,
+            max_workers=settings.jobs_max_workers,
+            poll_interval=settings.jobs_poll_interval,
+            stale_after=settings.jobs_stale_after,
+        )
+        yield runner
+        await runner.stop()
+
 
 class RepositoryProvider(Provider):
     """Provides repository dependencies."""
 
     @provide(scope=Scope.REQUEST)
-    async def get_user_repository(self, session: AsyncSession) -> UserRepository:
-        return UserRepository(session)
+    async def get_user_repository(
+        self, session: AsyncSession, cache: UserCache
+    ) -> UserRepository:
+        return UserRepository(session, cache)
 
     @provide(scope=Scope.REQUEST)
     async def get_transaction_repository(
@@ -57,37 +182,114 @@ class RepositoryProvider(Provider):
     async def get_account_repository(self, session: AsyncSession) -> AccountRepository:
         return AccountRepository(session)
 
+    @provide(scope=Scope.REQUEST)
+    async def get_daily_total_repository(
+        self, session: AsyncSession
+    ) -> DailyTotalRepository:
+        return DailyTotalRepository(session)
+
+    @provide(scope=Scope.REQUEST)
+    async def get_job_repository(self, session: AsyncSession) -> JobRepository:
+        return JobRepository(session)
+
 
 class ServiceProvider(Provider):
     """Provides service dependencies."""
 
     @provide(scope=Scope.REQUEST)
-    async def get_user_service(self, user_repository: UserRepository) -> UserService:
-        return UserService(user_repository)
+    async def get_user_service(
+        self,
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+        uow: UnitOfWork,
+        token_cache: TokenCache,
+        account_repository: AccountRepository,
+        transaction_repository: TransactionRepository,
+        daily_total_repository: DailyTotalRepository,
+    ) -> UserService:
+        return UserService(
+            user_repository,
+            password_hasher,
+            uow,
+            token_cache,
+            account_repository,
+            transaction_repository,
+            daily_total_repository,
+        )
 
     @provide(scope=Scope.REQUEST)
     async def get_transaction_service(
         self,
         transaction_repository: TransactionRepository,
         account_repository: AccountRepository,
+        daily_total_repository: DailyTotalRepository,
+        uow: UnitOfWork,
+        summary_cache: SummaryCache,
     ) -> TransactionService:
-        return TransactionService(transaction_repository, account_repository)
+        return TransactionService(
+            transaction_repository,
+            account_repository,
+            daily_total_repository,
+            uow,
+            summary_cache,
+        )
 
     @provide(scope=Scope.REQUEST)
     async def get_account_service(
-        self, account_repository: AccountRepository
+        self,
+        account_repository: AccountRepository,
+        daily_total_repository: DailyTotalRepository,
+        uow: UnitOfWork,
+        summary_cache: SummaryCache,
     ) -> AccountService:
-        return AccountService(account_repository)
+        return AccountService(
+            account_repository, daily_total_repository, uow, summary_cache
+        )
+
+    @provide(scope=Scope.REQUEST)
+    async def get_job_service(
+        self,
+        job_repository: JobRepository,
+        uow: UnitOfWork,
+        runner: JobRunner,
+    ) -> JobService:
+        return JobService(job_repository, uow, runner)
 
     @provide(scope=Scope.REQUEST)
-    async def get_auth_service(self, user_service: UserService) -> AuthService:
-        return AuthService(user_service)
+    async def get_reconciliation_service(
+        self,
+        account_repository: AccountRepository,
+        uow: UnitOfWork,
+        summary_cache: SummaryCache,
+    ) -> ReconciliationService:
+        return ReconciliationService(account_repository, uow, summary_cache)
+
+    @provide(scope=Scope.REQUEST)
+    async def get_batch_service(
+        self,
+        account_service: AccountService,
+        transaction_service: TransactionService,
+        uow: UnitOfWork,
+    ) -> BatchService:
+        return BatchService(account_service, transaction_service, uow)
+
+    @provide(scope=Scope.REQUEST)
+    async def get_auth_service(
+        self,
+        user_service: UserService,
+        password_hasher: PasswordHasher,
+    ) -> AuthService:
+        return AuthService(user_service, password_hasher)
 
 
 def create_container() -> Container:
     """Create and configure the DI container."""
     return make_async_container(
         DatabaseProvider(),
+        SecurityProvider(),
+        CacheProvider(),
+        IdempotencyProvider(),
+        JobProvider(),
         RepositoryProvider(),
         ServiceProvider(),
     )
@@ -0,0 +1,224 @@
+"""
+In-process background job runner.
+
+Jobs are rows in the jobs table. Services enqueue them through JobService;
+the runner started from the application lifespan claims pending rows,
+runs their handlers on a bounded pool of asyncio tasks and records
+progress, results and failures back on the row. Several processes may run
+a runner against the same table: claims are conditional updates, and jobs
+of a runner that stops sending heartbeats are requeued.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timedelta, timezone
+from typing import Any, TypeVar
+
+from dishka import AsyncContainer
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.core.metrics import JOBS_FINISHED, JOBS_RUNNING
+from src.db.repositories import JobRepository
+from src.models.domain.job import Job
+from src.models.enums import JobStatus
+
+T = TypeVar("T")
+
+JobHandler = Callable[["JobContext"], Awaitable[dict[str, Any] | None]]
+
+logger = logging.getLogger(__name__)
+
+
+class JobContext:
+    """What a handler gets to run one job: its row, dependencies and progress."""
+
+    def __init__(
+        self,
+        job: Job,
+        container: AsyncContainer,
+        runner: "JobRunner",
+        progress_interval: float = 0.5,
+    ):
+        self.job = job
+        self.container = container
+        self.progress_interval = progress_interval
+        self._runner = runner
+        self._last_report = 0.0
+
+    @property
+    def params(self) -> dict[str, Any]:
+        return self.job.params
+
+    async def get(self, dependency: type[T]) -> T:
+        """Resolve a dependency from the job's own request scope."""
+        return await self.container.get(dependency)
+
+    async def report(self, done: int, total: int | None = None) -> None:
+        """
+        Record progress. Writes are throttled to one per `progress_interval`
+        seconds, except the final one (done == total).
+        """
+        now = time.monotonic()
+        if done != total and now - self._last_report < self.progress_interval:
+            return
+        self._last_report = now
+        async with self._runner.repository() as repo:
+            await repo.set_progress(self.job.id, done, total)
+
+
+class JobRunner:
+    """
+    Runs pending jobs on at most `max_workers` concurrent tasks.
+
+    Running jobs send a heartbeat every `poll_interval` seconds, which is
+    also when cancellation requests made through other processes are
+    picked up. Jobs without a heartbeat for `stale_after` seconds are
+    returned to the queue.
+    """
+
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker,
+        handlers: Mapping[str, JobHandler] | None = None,
+        max_workers: int = 4,
+        poll_interval: float = 2.0,
+        stale_after: float = 60.0,
+    ):
+        self.sessionmaker = sessionmaker
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self._handlers: dict[str, JobHandler] = dict(handlers or {})
+        self._container: AsyncContainer | None = None
+        self._slots = asyncio.Semaphore(max_workers)
+        self._wakeup = asyncio.Event()
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._cancelled: set[int] = set()
+        self._loops: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> int:
+        """Number of jobs currently running in this process."""
+        return len(self._tasks)
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        self._handlers[kind] = handler
+
+    def start(self, container: AsyncContainer) -> None:
+        """Start claiming jobs; handlers resolve dependencies from container."""
+        if self._loops:
+            return
+        self._container = container
+        self._loops = [
+            asyncio.create_task(self._dispatch(), name="jobs-dispatch"),
+            asyncio.create_task(self._heartbeat(), name="jobs-heartbeat"),
+        ]
+
+    async def stop(self) -> None:
+        """Stop claiming jobs and requeue the ones still running."""
+        for task in (*self._loops, *self._tasks.values()):
+            task.cancel()
+        await asyncio.gather(
+            *self._loops, *self._tasks.values(), return_exceptions=True
+        )
+        self._loops = []
+
+    def notify(self) -> None:
+        """Wake the dispatcher, e.g. after a job was enqueued."""
+        self._wakeup.set()
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a job if it is running in this process."""
+        task = self._tasks.get(job_id)
+        if task is None:
+            return False
+        self._cancelled.add(job_id)
+        task.cancel()
+        return True
+
+    @asynccontextmanager
+    async def repository(self) -> AsyncIterator[JobRepository]:
+        """A JobRepository on its own session, committed on exit."""
+        async with self.sessionmaker() as session:
+            yield JobRepository(session)
+            await session.commit()
+
+    async def _dispatch(self) -> None:
+        while True:
+            await self._slots.acquire()
+            self._wakeup.clear()
+            try:
+                async with self.repository() as repo:
+                    job = await repo.claim_next()
+            except Exception:
+                logger.exception("Could not claim a job")
+                job = None
+
+            if job is None:
+                self._slots.release()
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                continue
+
+            task = asyncio.create_task(self._run(job), name=f"job-{job.id}")
+            self._tasks[job.id] = task
+            JOBS_RUNNING.inc()
+            task.add_done_callback(lambda _, job_id=job.id: self._release(job_id))
+
+    def _release(self, job_id: int) -> None:
+        self._tasks.pop(job_id, None)
+        self._cancelled.discard(job_id)
+        self._slots.release()
+        JOBS_RUNNING.dec()
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                stale_before = datetime.now(timezone.utc) - timedelta(
+                    seconds=self.stale_after
+                )
+                async with self.repository() as repo:
+                    cancelled = (
+                        await repo.heartbeat(list(self._tasks)) if self._tasks else []
+                    )
+                    await repo.requeue_stale(stale_before)
+            except Exception:
+                logger.exception("Job heartbeat failed")
+                continue
+            for job_id in cancelled:
+                self.cancel(job_id)
+
+    async def _run(self, job: Job) -> None:
+        handler = self._handlers.get(job.kind)
+        try:
+            if handler is None:
+                raise LookupError(f"No handler for job kind {job.kind!r}")
+            async with self._container() as request_container:
+                result = await handler(JobContext(job, request_container, self))
+        except asyncio.CancelledError:
+            if job.id in self._cancelled:
+                await self._finish(job, JobStatus.CANCELLED)
+            else:
+                async with self.repository() as repo:
+                    await repo.requeue([job.id])
+            raise
+        except Exception as exc:
+            logger.exception("Job %s (%s) failed", job.id, job.kind)
+            await self._finish(job, JobStatus.FAILED, error=str(exc) or repr(exc))
+        else:
+            await self._finish(job, JobStatus.SUCCEEDED, result=result)
+
+    async def _finish(
+        self,
+        job: Job,
+        status: JobStatus,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> None:
+        async with self.repository() as repo:
+            await repo.finish(job.id, status, result=result, error=error)
+        JOBS_FINISHED.inc(kind=job.kind, status=status.value)
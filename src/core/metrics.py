@@ -0,0 +1,327 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+Metrics live in the process that records them; with several workers each
+one exposes its own values and the scraper aggregates them.
+"""
+
+import functools
+import inspect
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+M = TypeVar("M", bound="Metric")
+C = TypeVar("C", bound=type)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """Base class for a metric family with a fixed set of label names."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.type}",
+            *self._samples(),
+        ]
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """A monotonically increasing value."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def set_total(self, value: float, **labels: Any) -> None:
+        """
+        Record a running total kept elsewhere, sampled at scrape time. A
+        lower value than the last one reads as a counter reset.
+        """
+        self._values[self._key(labels)] = value
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in self._values.items()
+        ]
+
+
+class Gauge(Metric):
+    """A value that can go up and down, or is sampled at scrape time."""
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def _samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in self._values.items()
+        ]
+
+
+class Histogram(Metric):
+    """Distribution of observed values over fixed buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (+Inf last), sum]
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = series
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def _samples(self) -> list[str]:
+        lines = []
+        for key, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                labels = _format_labels(
+                    (*self.labelnames, "le"), (*key, _format_value(bound))
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total[0])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metric families and renders them for a scrape."""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS_IN_FLIGHT = registry.register(
+    Gauge("http_requests_in_flight", "HTTP requests currently being served")
+)
+HTTP_REQUEST_DURATION = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by route template",
+        ("method", "route", "status"),
+    )
+)
+REPOSITORY_CALL_DURATION = registry.register(
+    Histogram(
+        "repository_call_duration_seconds",
+        "Time spent in repository methods",
+        ("repository", "method"),
+    )
+)
+DB_POOL_CHECKED_OUT = registry.register(
+    Gauge("db_pool_checked_out", "Connections currently checked out of the pool")
+)
+DB_POOL_OVERFLOW = registry.register(
+    Gauge("db_pool_overflow", "Connections open beyond the pool size")
+)
+DB_POOL_SIZE = registry.register(Gauge("db_pool_size", "Configured pool size"))
+DB_POOL_WAIT = registry.register(
+    Histogram(
+        "db_pool_wait_seconds",
+        "Time spent waiting to check a connection out of the pool",
+    )
+)
+PASSWORD_HASH_DURATION = registry.register(
+    Histogram(
+        "password_hash_duration_seconds",
+        "Argon2 hash and verify time in the hashing executor",
+        ("operation",),
+        buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+)
+PASSWORD_HASH_QUEUE_WAIT = registry.register(
+    Histogram(
+        "password_hash_queue_wait_seconds",
+        "Time hashing calls waited for a free executor slot",
+        ("operation",),
+    )
+)
+PASSWORD_HASH_REJECTED = registry.register(
+    Counter(
+        "password_hash_rejected_total",
+        "Hashing calls rejected because the queue was full",
+    )
+)
+PASSWORD_HASH_PENDING = registry.register(
+    Gauge("password_hash_pending", "Hashing calls running or waiting for a slot")
+)
+CACHE_HITS = registry.register(
+    Counter("cache_hits_total", "Lookups served from an in-process cache", ("cache",))
+)
+CACHE_MISSES = registry.register(
+    Counter(
+        "cache_misses_total",
+        "Lookups not served from an in-process cache",
+        ("cache",),
+    )
+)
+CACHE_INVALIDATIONS = registry.register(
+    Counter("cache_invalidations_total", "Entries invalidated by writes", ("cache",))
+)
+CACHE_HIT_RATIO = registry.register(
+    Gauge("cache_hit_ratio", "Share of lookups served from the cache", ("cache",))
+)
+CACHE_SIZE = registry.register(
+    Gauge("cache_size", "Entries currently held in the cache", ("cache",))
+)
+JOBS_RUNNING = registry.register(
+    Gauge("jobs_running", "Background jobs currently running in this process")
+)
+JOBS_FINISHED = registry.register(
+    Counter(
+        "jobs_finished_total",
+        "Background jobs finished, by kind and final status",
+        ("kind", "status"),
+    )
+)
+IDEMPOTENT_REPLAYS = registry.register(
+    Counter(
+        "idempotent_replays_total",
+        "Responses replayed for retried requests with an Idempotency-Key",
+    )
+)
+
+
+def _timed(repository: str, name: str, func: Callable) -> Callable:
+    if inspect.isasyncgenfunction(func):
+
+        @functools.wraps(func)
+        async def timed_generator(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                async for item in func(*args, **kwargs):
+                    yield item
+            finally:
+                REPOSITORY_CALL_DURATION.observe(
+                    time.perf_counter() - started, repository=repository, method=name
+                )
+
+        return timed_generator
+
+    @functools.wraps(func)
+    async def timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            REPOSITORY_CALL_DURATION.observe(
+                time.perf_counter() - started, repository=repository, method=name
+            )
+
+    return timed
+
+
+def instrument_repository(cls: C) -> C:
+    """
+    Class decorator timing every public async method of a repository,
+    including the ones it inherits, under repository_call_duration_seconds.
+    """
+    for name in dir(cls):
+        if name.startswith("_"):
+            continue
+        attr = inspect.getattr_static(cls, name)
+        if inspect.iscoroutinefunction(attr) or inspect.isasyncgenfunction(attr):
+            setattr(cls, name, _timed(cls.__name__, name, attr))
+    return cls
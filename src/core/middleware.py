@@ -0,0 +1,337 @@
+import asyncio
+import hashlib
+import time
+from collections.abc import Iterable
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.idempotency import IdempotencyStore
+from src.core.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    IDEMPOTENT_REPLAYS,
+)
+from src.core.token_cache import TokenCache
+from src.db.query_counter import track_queries
+from src.models.domain.idempotency import IdempotencyRecord
+
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Return the path template of the route that handled the request.
+
+    Depending on the FastAPI version, scope["route"] holds the path either
+    with or without the prefixes of the routers it was included through.
+    Whatever the route itself did not match at the end of the request path
+    is that prefix, so it is put back in front of the route's template.
+    """
+    route = scope.get("route")
+    if route is None:
+        return "<unmatched>"
+    template = getattr(route, "path_format", None) or route.path
+    path_regex = getattr(route, "path_regex", None)
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path) :]
+    if path_regex is None or path_regex.match(path):
+        return template
+    start = path.find("/", 1)
+    while start != -1:
+        if path_regex.match(path[start:]):
+            return path[:start] + template
+        start = path.find("/", start + 1)
+    return template
+
+
+class MetricsMiddleware:
+    """
+    Records in-flight requests and per-route latency for HTTP requests.
+
+    Latency is labelled with the matched route template (e.g.
+    `/api/v1/accounts/{account_id}`) rather than the raw path, so the
+    number of series stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                method=scope["method"],
+                route=route_template(scope),
+                status=status_code,
+            )
+
+
+class QueryCountMiddleware:
+    """
+    Reports the SQL statements a request issued in debug response headers.
+
+    `X-DB-Query-Count` holds the number of statements and `Server-Timing`
+    the time spent executing them, as counted up to the moment the
+    response starts.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (b"x-db-query-count", str(stats.count).encode()),
+                        (
+                            b"server-timing",
+                            f"db;dur={stats.seconds * 1000:.2f}".encode(),
+                        ),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+class IdempotencyMiddleware:
+    """
+    Makes POST requests to `paths` safe to retry with an Idempotency-Key.
+
+    The first request with a key runs normally and its response is stored;
+    a retry with the same key and payload gets the stored response, marked
+    with `Idempotent-Replayed: true`, without running the endpoint again.
+    A retry arriving while the first request still runs waits for it, for
+    up to `wait_timeout` seconds before getting a 409. Reusing a key for a
+    different payload is a 422.
+
+    Keys are scoped to the authenticated user, the method and the path, so
+    a retry sent with a refreshed token still replays. Requests without a
+    valid bearer token are passed to the endpoint, which rejects them. 5xx
+    responses are not stored, so the request can be retried for real.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Iterable[str],
+        wait_timeout: float,
+        poll_interval: float,
+    ):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        # Requests running in this process, by store key; duplicates wait
+        # on these rather than polling the store
+        self._running: dict[str, asyncio.Event] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] not in self.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get("idempotency-key")
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not 0 < len(idempotency_key) <= IDEMPOTENCY_KEY_MAX_LENGTH:
+            response = JSONResponse(
+                {
+                    "detail": "Idempotency-Key must be 1 to "
+                    f"{IDEMPOTENCY_KEY_MAX_LENGTH} characters long"
+                },
+                status_code=400,
+            )
+            await response(scope, receive, send)
+            return
+
+        container = scope["app"].state.dishka_container
+        subject = await _subject(container, headers)
+        if subject is None:
+            await self.app(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        key = _sha256(subject, scope["method"], scope["path"], idempotency_key)
+        request_hash = _sha256(
+            scope["method"], scope["path"], scope["query_string"].decode(), body
+        )
+        store: IdempotencyStore = await container.get(IdempotencyStore)
+
+        record = await self._claim(store, key, request_hash)
+        if record is None:
+            await self._run(store, key, body, scope, receive, send)
+            return
+
+        if record.request_hash != request_hash:
+            response = JSONResponse(
+                {"detail": "Idempotency-Key was already used for another request"},
+                status_code=422,
+            )
+        elif not record.completed:
+            response = JSONResponse(
+                {"detail": "A request with this Idempotency-Key is in progress"},
+                status_code=409,
+                headers={"Retry-After": "1"},
+            )
+        else:
+            IDEMPOTENT_REPLAYS.inc()
+            await _replay(record, send)
+            return
+        await response(scope, receive, send)
+
+    async def _claim(
+        self, store: IdempotencyStore, key: str, request_hash: str
+    ) -> IdempotencyRecord | None:
+        """
+        Claim key, or return its record once it is finished, belongs to
+        another payload, or the wait for it timed out.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.wait_timeout
+        while True:
+            record = await store.claim(key, request_hash)
+            if (
+                record is None
+                or record.completed
+                or record.request_hash != request_hash
+            ):
+                return record
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return record
+            if (running := self._running.get(key)) is not None:
+                try:
+                    await asyncio.wait_for(running.wait(), remaining)
+                except TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(min(self.poll_interval, remaining))
+
+    async def _run(
+        self,
+        store: IdempotencyStore,
+        key: str,
+        body: bytes,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        status_code = 500
+        response_headers: list[list[str]] = []
+        chunks: list[bytes] = []
+        body_sent = False
+
+        async def receive_body() -> Message:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers.extend(
+                    [name.decode("latin-1"), value.decode("latin-1")]
+                    for name, value in message.get("headers", [])
+                )
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        running = self._running[key] = asyncio.Event()
+        try:
+            await self.app(scope, receive_body, send_wrapper)
+            if status_code < 500:
+                await store.complete(
+                    key, status_code, response_headers, b"".join(chunks)
+                )
+            else:
+                await store.release(key)
+        except BaseException:
+            await store.release(key)
+            raise
+        finally:
+            del self._running[key]
+            running.set()
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+async def _replay(record: IdempotencyRecord, send: Send) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": record.status_code,
+            "headers": [
+                *(
+                    (name.encode("latin-1"), value.encode("latin-1"))
+                    for name, value in record.headers or []
+                ),
+                (b"idempotent-replayed", b"true"),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": record.body or b""})
+
+
+async def _subject(container, headers: Headers) -> str | None:
+    """The `sub` of a valid bearer token, or None."""
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    cache: TokenCache = await container.get(TokenCache)
+    try:
+        return cache.verify(token).sub
+    except Exception:
+        return None
+
+
+def _sha256(*parts: str | bytes) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode() if isinstance(part, str) else part)
+        digest.update(b"\0")
+    return digest.hexdigest()
@@ -0,0 +1,22 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from src.core.exceptions import InvalidCursorError
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """Encode a keyset position into an opaque, URL-safe cursor."""
+    raw = json.dumps([created_at.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor back into (created_at, id)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(id)
+    except (binascii.Error, ValueError, TypeError):
+        raise InvalidCursorError("Invalid pagination cursor")
@@ -0,0 +1,40 @@
+from collections.abc import Iterator
+from datetime import date, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from src.core.exceptions import InvalidParameterError
+from src.models.enums import AnalyticsBucket
+
+
+def resolve_timezone(name: str) -> ZoneInfo:
+    """Return the IANA time zone with this name."""
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise InvalidParameterError(f"Unknown time zone: {name}")
+
+
+def period_start(day: date, bucket: AnalyticsBucket) -> date:
+    """Return the first day of the period containing day (weeks start on Monday)."""
+    if bucket == AnalyticsBucket.WEEK:
+        return day - timedelta(days=day.weekday())
+    if bucket == AnalyticsBucket.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def next_period(start: date, bucket: AnalyticsBucket) -> date:
+    """Return the first day of the period after the one starting on start."""
+    if bucket == AnalyticsBucket.WEEK:
+        return start + timedelta(weeks=1)
+    if bucket == AnalyticsBucket.MONTH:
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def iter_periods(start: date, end: date, bucket: AnalyticsBucket) -> Iterator[date]:
+    """Yield the start of every period overlapping [start, end)."""
+    current = period_start(start, bucket)
+    while current < end:
+        yield current
+        current = next_period(current, bucket)
@@ -11,8 +11,16 @@ from .transaction import (
     TransactionCreate,
     TransactionUpdate,
     TransactionRead,
+    TransactionPage,
+    TransactionBulkCreate,
+    TransactionBulkError,
+    TransactionBulkResult,
     TransactionSummary,
+    TransactionAnalyticsPoint,
+    TransactionAnalytics,
 )
+from .job import JobRead
+from .batch import BatchRequest, BatchItemResult, BatchResult
 
 __all__ = [
     # User schemas
@@ -27,5 +35,17 @@ __all__ = [
     "TransactionCreate",
     "TransactionUpdate",
     "TransactionRead",
+    "TransactionPage",
+    "TransactionBulkCreate",
+    "TransactionBulkError",
+    "TransactionBulkResult",
     "TransactionSummary",
+    "TransactionAnalyticsPoint",
+    "TransactionAnalytics",
+    # Job schemas
+    "JobRead",
+    # Batch schemas
+    "BatchRequest",
+    "BatchItemResult",
+    "BatchResult",
 ]
@@ -0,0 +1,97 @@
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Field
+
+from src.core.config import settings
+from src.core.schemas.account import AccountCreate, AccountRead, AccountUpdate
+from src.core.schemas.transaction import (
+    TransactionCreate,
+    TransactionRead,
+    TransactionUpdate,
+)
+from src.models.enums import BatchMode, BatchOperationType
+
+
+class AccountCreateOperation(BaseModel):
+    op: Literal[BatchOperationType.ACCOUNT_CREATE]
+    data: AccountCreate
+
+
+class AccountUpdateOperation(BaseModel):
+    op: Literal[BatchOperationType.ACCOUNT_UPDATE]
+    id: int
+    data: AccountUpdate
+
+
+class AccountDeleteOperation(BaseModel):
+    op: Literal[BatchOperationType.ACCOUNT_DELETE]
+    id: int
+
+
+class TransactionCreateOperation(BaseModel):
+    op: Literal[BatchOperationType.TRANSACTION_CREATE]
+    data: TransactionCreate
+
+
+class TransactionUpdateOperation(BaseModel):
+    op: Literal[BatchOperationType.TRANSACTION_UPDATE]
+    id: int
+    data: TransactionUpdate
+
+
+class TransactionDeleteOperation(BaseModel):
+    op: Literal[BatchOperationType.TRANSACTION_DELETE]
+    id: int
+
+
+BatchOperation = Annotated[
+    AccountCreateOperation
+    | AccountUpdateOperation
+    | AccountDeleteOperation
+    | TransactionCreateOperation
+    | TransactionUpdateOperation
+    | TransactionDeleteOperation,
+    Field(discriminator="op"),
+]
+
+
+class BatchRequest(BaseModel):
+    """Schema for running several operations in one request."""
+
+    mode: BatchMode = Field(
+        BatchMode.ATOMIC,
+        description=(
+            "atomic: commit all operations or none; "
+            "best_effort: commit the ones that succeed"
+        ),
+    )
+    operations: list[BatchOperation] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.batch_max_operations,
+        description="Operations to run, in order",
+    )
+
+
+class BatchItemResult(BaseModel):
+    """Schema for the outcome of one operation of a batch."""
+
+    index: int = Field(..., description="Position of the operation in the request")
+    op: BatchOperationType
+    status: int = Field(
+        ...,
+        description="Status the operation would have had as a separate request",
+    )
+    result: AccountRead | TransactionRead | None = None
+    detail: str | None = None
+
+
+class BatchResult(BaseModel):
+    """Schema for the outcome of a batch request."""
+
+    mode: BatchMode
+    committed: bool = Field(
+        ...,
+        description="Whether any changes were committed",
+    )
+    results: list[BatchItemResult]
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.models.enums import JobKind, JobStatus
+
+
+class JobCreate(BaseModel):
+    """Schema for enqueuing a background job."""
+
+    kind: JobKind
+    params: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Handler parameters, see the handler for the job kind",
+    )
+
+
+class JobRead(BaseModel):
+    """Schema for reading the state of a background job."""
+
+    id: int
+    kind: str
+    status: JobStatus
+    progress_done: int = Field(..., description="Units of work completed so far")
+    progress_total: int | None = Field(
+        None,
+        description="Total units of work, or null while unknown",
+    )
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    cancel_requested: bool
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,9 +1,11 @@
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from src.core.config import settings
 from src.db.models.transaction import TransactionType
+from src.models.enums import AnalyticsBucket
 
 
 class TransactionBase(BaseModel):
@@ -56,6 +58,40 @@ class TransactionRead(TransactionBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TransactionPage(BaseModel):
+    """Schema for a page of transactions."""
+
+    items: list[TransactionRead]
+    next_cursor: str | None = Field(
+        None,
+        description="Cursor for the next page, or null on the last page",
+    )
+
+
+class TransactionBulkCreate(BaseModel):
+    """Schema for creating many transactions in one request."""
+
+    items: list[TransactionCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.transactions_bulk_max_items,
+    )
+
+
+class TransactionBulkError(BaseModel):
+    """Schema for a rejected item of a bulk request."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    detail: str
+
+
+class TransactionBulkResult(BaseModel):
+    """Schema for the outcome of a bulk create request."""
+
+    created: list[TransactionRead]
+    errors: list[TransactionBulkError]
+
+
 class TransactionSummary(BaseModel):
     """Schema for transaction summary statistics."""
 
@@ -63,3 +99,23 @@ class TransactionSummary(BaseModel):
     total_incomes: Decimal = 0
     total_expenses: Decimal = 0
     # goals_progress: Decimal
+
+
+class TransactionAnalyticsPoint(BaseModel):
+    """Schema for the income and expense totals of one period."""
+
+    period: date = Field(..., description="First local day of the period")
+    incomes: Decimal = 0
+    expenses: Decimal = 0
+    income_count: int = 0
+    expense_count: int = 0
+
+
+class TransactionAnalytics(BaseModel):
+    """Schema for income and expense series grouped by period."""
+
+    bucket: AnalyticsBucket
+    tz: str = Field(..., description="IANA time zone the periods are local to")
+    date_from: date = Field(..., description="First local day covered")
+    date_to: date = Field(..., description="Local day after the last one covered")
+    series: list[TransactionAnalyticsPoint]
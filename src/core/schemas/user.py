@@ -35,6 +35,15 @@ class UserUpdate(BaseModel):
     last_name: str | None = Field(None, min_length=2, max_length=50)
 
 
+class UserPasswordChange(BaseModel):
+    current_password: str = Field(min_length=8, max_length=128)
+    new_password: str = Field(
+        min_length=8,
+        max_length=128,
+        description="Must be at least 8 characters",
+    )
+
+
 class UserLoginRequest(BaseModel):
     username: str = Field(min_length=3, max_length=30)
     password: str = Field(min_length=8, max_length=128)
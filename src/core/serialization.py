@@ -0,0 +1,79 @@
+"""
+JSON serialization of domain objects for read endpoints.
+
+A `ResponseSerializer` turns domain objects into the JSON body of their
+response schema in the handler: it validates them into the schema and
+dumps the result with a TypeAdapter built once at import time. That is
+what FastAPI does for a response_model, so the body is byte-for-byte the
+same either way. Handlers use it when they need the body itself, e.g. to
+derive an ETag from it.
+"""
+
+from types import UnionType
+from typing import Any, Generic, TypeVar, Union, get_args, get_origin
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from src.core.config import settings
+
+T = TypeVar("T")
+
+
+def _models(annotation: Any) -> list[type[BaseModel]]:
+    """Collect the pydantic models nested in a type annotation."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return [annotation]
+    if get_origin(annotation) in (list, tuple, set, Union, UnionType):
+        return [model for arg in get_args(annotation) for model in _models(arg)]
+    return []
+
+
+def _check_fields(schema: Any, domain: Any, path: str = "response") -> None:
+    """
+    Ensure the domain type exposes exactly the fields of the schema, so a
+    drift between the two fails at import time rather than on a request.
+    """
+    schema_models, domain_models = _models(schema), _models(domain)
+    if len(schema_models) != len(domain_models):
+        raise TypeError(f"{path}: {domain!r} does not mirror {schema!r}")
+
+    for schema_model, domain_model in zip(schema_models, domain_models):
+        schema_fields = schema_model.model_fields
+        domain_fields = domain_model.model_fields
+        if set(schema_fields) != set(domain_fields):
+            raise TypeError(
+                f"{path}: {domain_model.__name__} fields {sorted(domain_fields)} "
+                f"differ from {schema_model.__name__} fields {sorted(schema_fields)}"
+            )
+        for name, field in schema_fields.items():
+            _check_fields(
+                field.annotation, domain_fields[name].annotation, f"{path}.{name}"
+            )
+
+
+class ResponseSerializer(Generic[T]):
+    """Dumps values of a domain type as the JSON body of a response schema."""
+
+    def __init__(self, schema: Any, domain: type[T] | Any):
+        _check_fields(schema, domain)
+        self.adapter: TypeAdapter = TypeAdapter(schema)
+
+    def dump_json(self, content: T) -> bytes:
+        """Dump content through the schema: its field order and rendering."""
+        return self.adapter.dump_json(
+            self.adapter.validate_python(content, from_attributes=True)
+        )
+
+    def respond(self, content: T, status_code: int = 200) -> Response | T:
+        """
+        Return a ready JSON response, or the content itself for FastAPI to
+        validate against the response_model when fast serialization is off.
+        """
+        if not settings.fast_serialization:
+            return content
+        return Response(
+            content=self.dump_json(content),
+            status_code=status_code,
+            media_type="application/json",
+        )
@@ -0,0 +1,68 @@
+import hashlib
+import time
+from typing import TYPE_CHECKING
+
+from src.core.cache import TTLCache
+
+if TYPE_CHECKING:
+    from authx import TokenPayload
+
+
+class TokenCache(TTLCache[str, "TokenPayload"]):
+    """
+    Payloads of verified access tokens, so a token reused across requests
+    is only decoded and signature-checked once per process.
+
+    Entries are keyed by the sha256 of the raw token, so the cache never
+    holds usable credentials, and expire with the token's own `exp` (or
+    after `ttl` seconds, whichever comes first). Tokens without `exp` are
+    not cached.
+
+    Code that revokes tokens (logout, password change, disabling a user)
+    must call `revoke` or `revoke_subject` in every process, or the
+    revoked tokens keep working here until they expire.
+    """
+
+    def get_payload(self, token: str) -> "TokenPayload | None":
+        return self.get(_token_key(token))
+
+    def verify(self, token: str) -> "TokenPayload":
+        """
+        Return the payload of a valid access token, from the cache when it
+        was verified before. Raises if the token is invalid or expired.
+        """
+        if (payload := self.get_payload(token)) is not None:
+            return payload
+        from authx import RequestToken
+
+        from src.core.auth_config import get_security
+
+        payload = get_security().verify_token(
+            RequestToken(token=token, location="headers")
+        )
+        self.add(token, payload)
+        return payload
+
+    def add(self, token: str, payload: "TokenPayload") -> None:
+        if payload.exp is None:
+            return
+        expires_at = (
+            payload.exp
+            if isinstance(payload.exp, (int, float))
+            else payload.exp.timestamp()
+        )
+        remaining = expires_at - time.time()
+        if remaining > 0:
+            self.set(_token_key(token), payload, min(remaining, self.ttl))
+
+    def revoke(self, token: str) -> None:
+        """Forget a single token, so it is verified again on its next use."""
+        self.invalidate(_token_key(token))
+
+    def revoke_subject(self, subject: str) -> int:
+        """Forget every cached token issued to a subject (a user id)."""
+        return self.invalidate_matching(lambda _, payload: payload.sub == subject)
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
@@ -1 +1,4 @@
-from .session import db_session_manager
+from .session import create_engine, create_sessionmaker
+from .routing import RecentWriters, current_user_id, read_only
+from .unit_of_work import UnitOfWork
+from .query_counter import QueryStats, query_budget, track_queries
@@ -2,6 +2,9 @@ from .base import Base
 from .user import User
 from .account import Account, AccountType
 from .transaction import Transaction, TransactionType
+from .daily_total import DailyTotal
+from .job import Job
+from .idempotency_key import IdempotencyKey
 
 __all__ = [
     "Base",
@@ -10,4 +13,7 @@ __all__ = [
     "TransactionType",
     "Account",
     "AccountType",
+    "DailyTotal",
+    "Job",
+    "IdempotencyKey",
 ]
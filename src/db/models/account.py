@@ -40,6 +40,13 @@ class Account(TimestampMixin, Base):
         Numeric(10, 2),
         nullable=False,
     )
+    initial_value: Mapped[Decimal] = mapped_column(
+        Numeric(10, 2),
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="Opening balance; value should equal it plus the ledger's net.",
+    )
     description: Mapped[str] = mapped_column(
         String(255),
         nullable=True,
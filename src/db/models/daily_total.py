@@ -0,0 +1,39 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, ForeignKey, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+from src.models.enums import TransactionType
+
+
+class DailyTotal(Base):
+    """Per-day rollup of a user's transactions, by account and type."""
+
+    __tablename__ = "daily_totals"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+    )
+    account_id: Mapped[int] = mapped_column(
+        ForeignKey("accounts.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    type: Mapped[TransactionType] = mapped_column(
+        primary_key=True,
+    )
+    sum: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2),
+        nullable=False,
+        default=0,
+    )
+    count: Mapped[int] = mapped_column(
+        nullable=False,
+        default=0,
+    )
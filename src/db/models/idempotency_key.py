@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+from .types import UTCDateTime
+
+
+class IdempotencyKey(Base):
+    """
+    A request made with an Idempotency-Key header and, once it finished,
+    the response to replay for retries of it.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    # sha256 of the caller's credentials and the key they sent
+    key: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+    )
+    request_hash: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+    # Null while the first request is still running
+    status_code: Mapped[int | None] = mapped_column(
+        nullable=True,
+    )
+    headers: Mapped[list[list[str]] | None] = mapped_column(
+        JSON,
+        nullable=True,
+    )
+    body: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+    )
+    locked_until: Mapped[datetime] = mapped_column(
+        UTCDateTime(),
+        nullable=False,
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        UTCDateTime(),
+        nullable=False,
+        index=True,
+    )
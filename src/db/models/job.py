@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, ForeignKey, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+from .mixins import TimestampMixin
+from .types import UTCDateTime
+from src.models.enums import JobStatus
+
+
+class Job(TimestampMixin, Base):
+    """A unit of background work, claimed and run by the job runner."""
+
+    __tablename__ = "jobs"
+    __table_args__ = (Index("ix_jobs_status_id", "status", "id"),)
+
+    id: Mapped[int] = mapped_column(
+        primary_key=True,
+        autoincrement=True,
+        nullable=False,
+    )
+    kind: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+    status: Mapped[JobStatus] = mapped_column(
+        nullable=False,
+        default=JobStatus.PENDING,
+    )
+    params: Mapped[dict[str, Any]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=dict,
+    )
+    progress_done: Mapped[int] = mapped_column(
+        nullable=False,
+        default=0,
+    )
+    progress_total: Mapped[int | None] = mapped_column(
+        nullable=True,
+    )
+    result: Mapped[dict[str, Any] | None] = mapped_column(
+        JSON,
+        nullable=True,
+    )
+    error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    cancel_requested: Mapped[bool] = mapped_column(
+        nullable=False,
+        default=False,
+    )
+    started_at: Mapped[datetime | None] = mapped_column(
+        UTCDateTime(),
+        nullable=True,
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        UTCDateTime(),
+        nullable=True,
+    )
+
+    user_id: Mapped[int | None] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
@@ -1,22 +1,30 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import func
 from sqlalchemy.orm import Mapped, mapped_column
 
+from ..types import UTCDateTime
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
 
 class TimestampMixin:
     """Mixin to add created_at and updated_at timestamp columns to a model."""
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         nullable=False,
+        default=utcnow,
         server_default=func.now(),
         doc="Timestamp when the record was created.",
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        UTCDateTime(),
         nullable=False,
+        default=utcnow,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=utcnow,
         doc="Timestamp when the record was last updated.",
     )
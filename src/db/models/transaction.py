@@ -1,7 +1,7 @@
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Numeric, String
+from sqlalchemy import ForeignKey, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 
 
 class Transaction(TimestampMixin, Base):
+    # On Postgres the migrations partition this table by created_at month
+    # with a (id, created_at) primary key; ids are still unique on their
+    # own, so the mapping keeps id as the identity (see src/db/partitions.py).
     __tablename__ = "transactions"
 
     id: Mapped[int] = mapped_column(
@@ -49,3 +52,29 @@ class Transaction(TimestampMixin, Base):
     user: Mapped["User"] = relationship(
         back_populates="transactions",
     )
+
+
+# Composite indexes matching the repository access patterns: listing and
+# aggregating a user's transactions over time (optionally by type), and
+# fetching the latest transactions of an account. The trailing id DESC
+# matches the (created_at DESC, id DESC) keyset order, so those queries
+# read the index in order without a sort (see tests/test_index_plans.py).
+Index(
+    "ix_transactions_user_id_created_at",
+    Transaction.user_id,
+    Transaction.created_at.desc(),
+    Transaction.id.desc(),
+)
+Index(
+    "ix_transactions_user_id_type_created_at",
+    Transaction.user_id,
+    Transaction.type,
+    Transaction.created_at.desc(),
+    Transaction.id.desc(),
+)
+Index(
+    "ix_transactions_account_id_created_at",
+    Transaction.account_id,
+    Transaction.created_at.desc(),
+    Transaction.id.desc(),
+)
@@ -0,0 +1,181 @@
+"""
+Maintenance of the monthly partitions of the transactions table.
+
+On Postgres, migration 9b1e4d6a7c25 partitions `transactions` by
+`created_at`, one partition per UTC month named transactions_YYYY_MM.
+Partitions must exist before rows for their month arrive, so the app
+creates them ahead of time at startup, and refuses to start if any is
+still missing, and `src.commands.partitions` can do the same from cron.
+There is no DEFAULT partition to catch stray rows: each new month's
+partition would have to scan it under lock, and rows parked there would
+never leave with their month.
+
+Old months are detached, which leaves their rows in a standalone table
+for archiving. The ledger then no longer holds them, so their net is
+folded into the accounts' opening balances, and the daily_totals rollup
+keeps their days (see `ledger_start`).
+
+Other databases keep a plain table; these functions do nothing there.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import case, column, func, select, table, text, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.db.models import Account, Transaction
+from src.models.enums import TransactionType
+
+PARTITION_PREFIX = "transactions_"
+
+# Advisory lock taken by a detach, and by readers of `ledger_start`, so no
+# rollup rebuild sees the ledger halfway through losing a month
+DETACH_LOCK_KEY = 0x74786E73
+
+_ATTACHED_PARTITIONS = text(
+    "SELECT c.relname FROM pg_inherits i "
+    "JOIN pg_class c ON c.oid = i.inhrelid "
+    "WHERE i.inhparent = to_regclass('transactions') "
+    "ORDER BY c.relname"
+)
+
+
+def _is_partitioned_backend(engine: AsyncEngine) -> bool:
+    return engine.dialect.name == "postgresql"
+
+
+async def ensure_transaction_partitions(engine: AsyncEngine, months_ahead: int) -> int:
+    """
+    Create any missing partitions from the current month to `months_ahead`
+    months after it. Returns the number created.
+    """
+    if not _is_partitioned_backend(engine):
+        return 0
+    async with engine.begin() as conn:
+        installed = await conn.scalar(
+            text(
+                "SELECT to_regprocedure("
+                "'create_transaction_partitions(date, integer)') IS NOT NULL"
+            )
+        )
+        if not installed:
+            return 0
+        return await conn.scalar(
+            text(
+                "SELECT create_transaction_partitions("
+                "timezone('UTC', now())::date, :months_ahead)"
+            ),
+            {"months_ahead": months_ahead},
+        )
+
+
+async def list_transaction_partitions(engine: AsyncEngine) -> dict[str, date]:
+    """Return the attached partitions, mapped to the month each one holds."""
+    if not _is_partitioned_backend(engine):
+        return {}
+    async with engine.connect() as conn:
+        names = await conn.scalars(_ATTACHED_PARTITIONS)
+        return {name: _month_of(name) for name in names}
+
+
+async def ledger_start(session: AsyncSession) -> date | None:
+    """
+    Return the first day of the oldest month still attached, or None when
+    the ledger was never cut. The transactions before it were detached.
+
+    Waits for a detach in progress, and holds off the next one until the
+    session's transaction ends, so the answer stays true for that long.
+    """
+    if not _is_partitioned_backend(session.bind):
+        return None
+    await session.execute(
+        text("SELECT pg_advisory_xact_lock(:key)"), {"key": DETACH_LOCK_KEY}
+    )
+    names = (await session.scalars(_ATTACHED_PARTITIONS)).all()
+    return _month_of(names[0]) if names else None
+
+
+async def missing_transaction_partitions(
+    engine: AsyncEngine, months_ahead: int
+) -> list[str]:
+    """
+    Return the names of the partitions missing from the current month to
+    `months_ahead` months after it; inserts for those months would fail.
+    Empty when the table is not partitioned.
+    """
+    if not _is_partitioned_backend(engine):
+        return []
+    async with engine.connect() as conn:
+        kind = await conn.scalar(
+            text(
+                "SELECT relkind::text FROM pg_class "
+                "WHERE oid = to_regclass('transactions')"
+            )
+        )
+    if kind != "p":
+        return []
+
+    partitions = await list_transaction_partitions(engine)
+    month = datetime.now(timezone.utc).date().replace(day=1)
+    missing = []
+    for _ in range(months_ahead + 1):
+        name = f"{PARTITION_PREFIX}{month:%Y_%m}"
+        if name not in partitions:
+            missing.append(name)
+        month = (month + timedelta(days=32)).replace(day=1)
+    return missing
+
+
+async def detach_transaction_partitions(engine: AsyncEngine, before: date) -> list[str]:
+    """
+    Detach the partitions of months that end on or before `before`.
+
+    Reconciliation checks balances against opening balance plus ledger,
+    so in the transaction that detaches a month, each account's net over
+    it is added to the account's `initial_value`. That rules out DETACH
+    CONCURRENTLY: the plain DETACH locks `transactions` until the commit,
+    for as long as one grouped scan of the month takes, which also keeps
+    writes out of the month between its detach and its fold. Returns the
+    detached table names.
+    """
+    cutoff = before.replace(day=1)
+    partitions = await list_transaction_partitions(engine)
+    detached = [name for name, month in partitions.items() if month < cutoff]
+    for name in detached:
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": DETACH_LOCK_KEY}
+            )
+            await conn.execute(
+                text(f'ALTER TABLE transactions DETACH PARTITION "{name}"')
+            )
+            await conn.execute(_fold_into_opening_balances(name))
+    return detached
+
+
+def _fold_into_opening_balances(partition: str):
+    """UPDATE adding each account's net over `partition` to its initial_value."""
+    rows = table(
+        partition,
+        column("account_id"),
+        column("amount"),
+        column("type", Transaction.type.type),
+    )
+    signed_amount = case(
+        (rows.c.type == TransactionType.INCOME, rows.c.amount),
+        else_=-rows.c.amount,
+    )
+    net = (
+        select(rows.c.account_id, func.sum(signed_amount).label("net"))
+        .group_by(rows.c.account_id)
+        .subquery("net")
+    )
+    return (
+        update(Account)
+        .where(Account.id == net.c.account_id)
+        .values(initial_value=Account.initial_value + net.c.net)
+    )
+
+
+def _month_of(partition: str) -> date:
+    return datetime.strptime(partition.removeprefix(PARTITION_PREFIX), "%Y_%m").date()
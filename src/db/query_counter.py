@@ -0,0 +1,88 @@
+"""
+Per-request accounting of SQL statements.
+
+Statements are attributed to whatever `track_queries()` blocks are active
+in the current task, so concurrent requests never see each other's counts.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass
+class QueryStats:
+    """Number of statements executed and time spent executing them."""
+
+    count: int = 0
+    seconds: float = 0.0
+
+
+_active: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_stats", default=())
+
+_STARTED_KEY = "query_counter_started"
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by `query_budget` when a block issues too many statements."""
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect the statements issued by the current task inside the block."""
+    stats = QueryStats()
+    token = _active.set((*_active.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int, label: str = "block") -> Iterator[QueryStats]:
+    """
+    Fail if the block issues more than max_queries statements.
+
+    Meant for tests and benchmarks, e.g. to keep `GET /accounts` at a
+    constant number of queries however many accounts the user has.
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(
+            f"{label} issued {stats.count} queries, budget is {max_queries}"
+        )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info[_STARTED_KEY].pop()
+    elapsed = time.perf_counter() - started
+    for stats in _active.get():
+        stats.count += 1
+        stats.seconds += elapsed
+
+
+def _handle_error(exception_context) -> None:
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(_STARTED_KEY):
+        conn.info[_STARTED_KEY].pop()
+
+
+def install_query_counter(engine: AsyncEngine | Engine) -> None:
+    """Hook the counter into an engine's cursor execution events."""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
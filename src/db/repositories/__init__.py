@@ -1,11 +1,18 @@
 from .base import BaseRepository
-from .user_repository import UserRepository
+from .user_repository import UserCache, UserRepository
 from .transaction_repository import TransactionRepository
 from .account_repository import AccountRepository
+from .daily_total_repository import DailyTotalRepository
+from .job_repository import JobRepository
+from .idempotency_repository import IdempotencyRepository
 
 __all__ = [
     "BaseRepository",
+    "UserCache",
     "UserRepository",
     "TransactionRepository",
     "AccountRepository",
+    "DailyTotalRepository",
+    "JobRepository",
+    "IdempotencyRepository",
 ]
@@ -1,15 +1,22 @@
+from collections import defaultdict
+from collections.abc import Sequence
 from decimal import Decimal
 
-from sqlalchemy import select, func, update as sa_update
+from sqlalchemy import Row, case, delete, select, func, true, update as sa_update
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import Account as AccountORM
 from src.db.models import Transaction as TransactionORM
 from src.models.domain.account import Account as AccountDomain
-from .base import BaseRepository
+from src.models.domain.transaction import Transaction as TransactionDomain
+from src.models.enums import TransactionType
+from src.core.metrics import instrument_repository
+from src.db.routing import read_only
+from .base import BaseRepository, projection_columns
 
 
+@instrument_repository
 class AccountRepository(BaseRepository[AccountDomain, AccountORM]):
     """Repository for Account model operations."""
 
@@ -19,9 +26,9 @@ class AccountRepository(BaseRepository[AccountDomain, AccountORM]):
 
     async def create(self, domain_obj: AccountDomain) -> AccountDomain:
         db_data = domain_obj.model_dump(exclude={"id"})
-        db_obj = self.db_model(**db_data)
+        db_obj = self.db_model(**db_data, initial_value=domain_obj.value)
         self.session.add(db_obj)
-        await self.session.commit()
+        await self.session.flush()
         return await self._load_with_transactions(db_obj.id)
 
     async def _load_with_transactions(self, account_id: int) -> AccountDomain | None:
@@ -29,6 +36,8 @@ class AccountRepository(BaseRepository[AccountDomain, AccountORM]):
             select(self.db_model)
             .where(self.db_model.id == account_id)
             .options(selectinload(AccountORM.transactions))
+            # Overwrite the flushed instance with the values as stored
+            .execution_options(populate_existing=True)
         )
         return self._to_domain(result)
 
@@ -48,63 +57,114 @@ class AccountRepository(BaseRepository[AccountDomain, AccountORM]):
             if hasattr(db_obj, field):
                 setattr(db_obj, field, value)
 
-        self.session.add(db_obj)
-        await self.session.commit()
+        await self.session.flush()
         return await self._load_with_transactions(id)
 
+    async def delete_for_user(self, user_id: int) -> None:
+        """Delete the user's accounts; their transactions must be gone first."""
+        await self.session.execute(
+            delete(self.db_model).where(self.db_model.user_id == user_id)
+        )
+
+    @read_only
     async def get_account(
         self,
         account_id: int,
         user_id: int,
+        transactions_limit: int = 5,
     ) -> AccountDomain | None:
-        subq = (
-            select(TransactionORM.id)
-            .where(TransactionORM.account_id == account_id)
-            .order_by(TransactionORM.created_at.desc())
-            .limit(5)
-            .subquery()
-        )
-        result = await self.session.scalar(
-            select(self.db_model)
-            .where(
+        """Return one of the user's accounts with its latest transactions."""
+        result = await self.session.execute(
+            self._select_projection().where(
                 self.db_model.id == account_id,
                 self.db_model.user_id == user_id,
             )
-            .options(
-                selectinload(AccountORM.transactions.and_(TransactionORM.id.in_(subq)))
-            )
         )
-        return self._to_domain(result)
+        accounts = await self._with_latest_transactions(
+            self._rows_to_domain(result), transactions_limit
+        )
+        return accounts[0] if accounts else None
 
+    @read_only
     async def get_accounts(
         self,
         user_id: int,
+        transactions_limit: int = 5,
     ) -> list[AccountDomain]:
-        subq = select(
-            TransactionORM.id,
-            func.row_number()
-            .over(
-                partition_by=TransactionORM.account_id,
-                order_by=TransactionORM.created_at.desc(),
-            )
-            .label("rn"),
-        ).subquery()
+        """Return the user's accounts, each with its latest transactions."""
+        result = await self.session.execute(
+            self._select_projection()
+            .where(self.db_model.user_id == user_id)
+            .order_by(self.db_model.id)
+        )
+        return await self._with_latest_transactions(
+            self._rows_to_domain(result), transactions_limit
+        )
 
-        stmt = (
-            select(AccountORM)
-            .where(AccountORM.user_id == user_id)
-            .options(
-                selectinload(
-                    AccountORM.transactions.and_(
-                        TransactionORM.id == subq.c.id,
-                        subq.c.rn <= 5,
-                    )
-                )
-            )
+    async def _with_latest_transactions(
+        self, accounts: list[AccountDomain], limit: int
+    ) -> list[AccountDomain]:
+        """Attach up to `limit` newest transactions to each account."""
+        if not accounts or limit <= 0:
+            return accounts
+
+        account_ids = [account.id for account in accounts]
+        if self.session.bind.dialect.name == "postgresql":
+            query = self._latest_transactions_lateral(account_ids, limit)
+        else:
+            query = self._latest_transactions_correlated(account_ids, limit)
+
+        construct = TransactionDomain.model_construct
+        latest: dict[int, list[TransactionDomain]] = defaultdict(list)
+        for row in await self.session.execute(query):
+            latest[row.account_id].append(construct(**row._mapping))
+        for account in accounts:
+            account.transactions = latest[account.id]
+        return accounts
+
+    @staticmethod
+    def _latest_transactions_lateral(account_ids: list[int], limit: int):
+        """
+        Postgres plan: one LATERAL index scan per account on
+        (account_id, created_at DESC), stopping after `limit` rows.
+        """
+        columns = projection_columns(TransactionDomain, TransactionORM)
+        latest = (
+            select(*columns)
+            .where(TransactionORM.account_id == AccountORM.id)
+            .order_by(TransactionORM.created_at.desc(), TransactionORM.id.desc())
+            .limit(limit)
+            .lateral("latest")
+        )
+        return (
+            select(*(latest.c[column.name] for column in columns))
+            .select_from(AccountORM)
+            .join(latest, true())
+            .where(AccountORM.id.in_(account_ids))
+            .order_by(latest.c.created_at.desc(), latest.c.id.desc())
         )
 
-        result = await self.session.scalars(stmt)
-        return [self._to_domain(a) for a in result.unique().all()]
+    @staticmethod
+    def _latest_transactions_correlated(account_ids: list[int], limit: int):
+        """
+        Portable plan for SQLite: for each account, a correlated subquery
+        picks the ids of its `limit` newest transactions from the
+        (account_id, created_at DESC) index; only those rows are read.
+        """
+        newest_ids = (
+            select(TransactionORM.id)
+            .where(TransactionORM.account_id == AccountORM.id)
+            .order_by(TransactionORM.created_at.desc(), TransactionORM.id.desc())
+            .limit(limit)
+            .correlate(AccountORM)
+        )
+        return (
+            select(*projection_columns(TransactionDomain, TransactionORM))
+            .select_from(AccountORM)
+            .join(TransactionORM, TransactionORM.id.in_(newest_ids))
+            .where(AccountORM.id.in_(account_ids))
+            .order_by(TransactionORM.created_at.desc(), TransactionORM.id.desc())
+        )
 
     async def get_balance(self, account_id: int, user_id: int) -> Decimal | None:
         """Return the current balance of an account, or None if not found / not owned."""
@@ -115,6 +175,34 @@ class AccountRepository(BaseRepository[AccountDomain, AccountORM]):
             )
         )
 
+    async def get_balances_for_update(
+        self, account_ids: set[int], user_id: int
+    ) -> dict[int, Decimal]:
+        """
+        Return balances of the given accounts owned by the user, keyed by id.
+
+        The rows stay locked until the transaction ends (where the database
+        supports row locks), so the balances cannot change underneath the
+        caller. Accounts that do not exist or are not owned are omitted.
+        """
+        result = await self.session.execute(
+            select(self.db_model.id, self.db_model.value)
+            .where(
+                self.db_model.id.in_(account_ids),
+                self.db_model.user_id == user_id,
+            )
+            .with_for_update()
+        )
+        return {row.id: row.value for row in result}
+
+    async def adjust_balances(self, deltas: dict[int, Decimal]) -> None:
+        """Add a per-account delta to several balances in one UPDATE."""
+        await self.session.execute(
+            sa_update(self.db_model)
+            .where(self.db_model.id.in_(deltas))
+            .values(value=self.db_model.value + case(deltas, value=self.db_model.id))
+        )
+
     async def adjust_balance(self, account_id: int, delta: Decimal) -> None:
         """Atomically add delta (positive or negative) to the account balance."""
         await self.session.execute(
@@ -122,8 +210,36 @@ class AccountRepository(BaseRepository[AccountDomain, AccountORM]):
             .where(self.db_model.id == account_id)
             .values(value=self.db_model.value + delta)
         )
-        await self.session.commit()
 
+    async def adjust_owned_balance(
+        self,
+        account_id: int,
+        user_id: int,
+        delta: Decimal,
+        check_funds: bool = False,
+    ) -> Decimal | None:
+        """
+        Atomically add delta to the balance of an account owned by the user.
+
+        With check_funds, the update only applies if the balance stays
+        non-negative, so concurrent expenses can never overdraw the account.
+        Returns the new balance, or None if the account was not found, is
+        not owned, or (with check_funds) has insufficient funds.
+        """
+        stmt = (
+            sa_update(self.db_model)
+            .where(
+                self.db_model.id == account_id,
+                self.db_model.user_id == user_id,
+            )
+            .values(value=self.db_model.value + delta)
+            .returning(self.db_model.value)
+        )
+        if check_funds:
+            stmt = stmt.where(self.db_model.value + delta >= 0)
+        return await self.session.scalar(stmt)
+
+    @read_only
     async def get_overall_balance(self, user_id: int) -> Decimal:
         """Return overall balance between all existing accounts"""
         result = await self.session.scalar(
@@ -132,3 +248,55 @@ class AccountRepository(BaseRepository[AccountDomain, AccountORM]):
             )
         )
         return result or Decimal(0)
+
+    async def count_accounts(self) -> int:
+        return await self.session.scalar(select(func.count()).select_from(AccountORM))
+
+    async def get_expected_balances(self, after_id: int, limit: int) -> Sequence[Row]:
+        """
+        Return (id, user_id, value, expected) for up to `limit` accounts
+        with id > after_id, in id order.
+
+        `expected` is the opening balance plus the net of the account's
+        ledger, computed by one grouped aggregate over the chunk's
+        transactions. Both sides are read in the same statement, so they
+        are consistent with each other.
+        """
+        chunk = (
+            select(
+                self.db_model.id,
+                self.db_model.user_id,
+                self.db_model.value,
+                self.db_model.initial_value,
+            )
+            .where(self.db_model.id > after_id)
+            .order_by(self.db_model.id)
+            .limit(limit)
+            .subquery("chunk")
+        )
+        signed_amount = case(
+            (TransactionORM.type == TransactionType.INCOME, TransactionORM.amount),
+            else_=-TransactionORM.amount,
+        )
+        ledger = (
+            select(
+                TransactionORM.account_id,
+                func.sum(signed_amount).label("net"),
+            )
+            .where(TransactionORM.account_id.in_(select(chunk.c.id)))
+            .group_by(TransactionORM.account_id)
+            .subquery("ledger")
+        )
+        result = await self.session.execute(
+            select(
+                chunk.c.id,
+                chunk.c.user_id,
+                chunk.c.value,
+                (chunk.c.initial_value + func.coalesce(ledger.c.net, 0)).label(
+                    "expected"
+                ),
+            )
+            .outerjoin(ledger, ledger.c.account_id == chunk.c.id)
+            .order_by(chunk.c.id)
+        )
+        return result.all()
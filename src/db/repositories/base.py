@@ -1,7 +1,10 @@
 from abc import ABC
+from collections.abc import Iterable
+from functools import cache
 from typing import Generic, TypeVar, Type, Any, Union
 
 from pydantic import BaseModel
+from sqlalchemy import Column, Row, Select, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models.base import Base
@@ -11,9 +14,23 @@ T_Domain = TypeVar("T_Domain")
 T_DB = TypeVar("T_DB", bound=Base)
 
 
+@cache
+def projection_columns(domain_model: type, db_model: type) -> tuple[Column, ...]:
+    """Table columns backing the fields of a domain model, in field order."""
+    columns = db_model.__table__.columns
+    return tuple(
+        columns[name] for name in domain_model.model_fields if name in columns
+    )
+
+
 class BaseRepository(ABC, Generic[T_Domain, T_DB]):
     """
     Abstract base repository implementing common CRUD operations.
+
+    Writes are flushed but never committed here: services run them inside
+    a UnitOfWork, which commits all of a request's writes together.
+    Methods marked with @read_only may be served by the read replica;
+    all others run on the primary.
     """
 
     def __init__(
@@ -39,19 +56,37 @@ class BaseRepository(ABC, Generic[T_Domain, T_DB]):
             return None
         return self.domain_model.model_validate(db_obj)
 
+    def _select_projection(self) -> Select:
+        """
+        Select the domain model's columns as plain rows.
+
+        Opt-in fast path for read-only lists: rows skip ORM instances and
+        the identity map, and `_rows_to_domain` builds the domain objects
+        without re-validating values that came straight from the database.
+        """
+        return select(*projection_columns(self.domain_model, self.db_model))
+
+    def _rows_to_domain(self, rows: Iterable[Row]) -> list[T_Domain]:
+        """Convert rows from `_select_projection` to domain objects."""
+        construct = self.domain_model.model_construct
+        return [construct(**row._mapping) for row in rows]
+
     async def get(self, id: int) -> T_Domain | None:
         """Get a single record by ID."""
         result = await self.session.get(self.db_model, id)
         return self._to_domain(result)
 
     async def create(self, domain_obj: T_Domain) -> T_Domain:
-        """Create a new record."""
-        db_data = domain_obj.model_dump(exclude={"id"})
-        db_obj = self.db_model(**db_data)
+        """
+        Create a new record.
 
-        self.session.add(db_obj)
-        await self.session.commit()
-        await self.session.refresh(db_obj)
+        The row is read back with RETURNING, so the result holds the values
+        as stored (e.g. amounts at the column's scale), not as passed in.
+        """
+        db_obj = await self.session.scalar(
+            insert(self.db_model).returning(self.db_model),
+            [domain_obj.model_dump(exclude={"id"})],
+        )
         return self._to_domain(db_obj)
 
     async def update(
@@ -74,8 +109,7 @@ class BaseRepository(ABC, Generic[T_Domain, T_DB]):
             if hasattr(db_obj, field):
                 setattr(db_obj, field, value)
 
-        self.session.add(db_obj)
-        await self.session.commit()
+        await self.session.flush()
         await self.session.refresh(db_obj)
         return self._to_domain(db_obj)
 
@@ -83,6 +117,6 @@ class BaseRepository(ABC, Generic[T_Domain, T_DB]):
         """Delete a record by ID. Returns True if deleted, False if not found."""
         if db_obj := await self.session.get(self.db_model, id):
             await self.session.delete(db_obj)
-            await self.session.commit()
+            await self.session.flush()
             return True
         return False
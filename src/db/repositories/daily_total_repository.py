@@ -0,0 +1,191 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+from sqlalchemy import Date, case, cast, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.metrics import instrument_repository
+from src.db.partitions import ledger_start
+from src.db.routing import read_only
+from src.db.models import DailyTotal as DailyTotalORM
+from src.db.models import Transaction as TransactionORM
+from src.models.enums import TransactionType
+
+RollupKey = tuple[int, int, date, TransactionType]
+
+
+@instrument_repository
+class DailyTotalRepository:
+    """
+    Repository for the daily_totals rollup of the transaction ledger.
+
+    Writes are meant to run in the same UnitOfWork as the ledger write they
+    belong to, so the rollup and the ledger always commit together.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize daily totals repository with session."""
+        self.session = session
+
+    @staticmethod
+    def day_of(moment: datetime) -> date:
+        """Return the UTC calendar day a transaction timestamp belongs to."""
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(timezone.utc)
+        return moment.date()
+
+    async def apply(
+        self,
+        user_id: int,
+        account_id: int,
+        day: date,
+        transaction_type: TransactionType,
+        amount: Decimal,
+        count: int,
+    ) -> None:
+        """Add amount and count (either may be negative) to one day bucket."""
+        insert_stmt = self._upsert_insert()(DailyTotalORM).values(
+            user_id=user_id,
+            account_id=account_id,
+            day=day,
+            type=transaction_type,
+            sum=amount,
+            count=count,
+        )
+        await self.session.execute(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[
+                    DailyTotalORM.user_id,
+                    DailyTotalORM.day,
+                    DailyTotalORM.account_id,
+                    DailyTotalORM.type,
+                ],
+                set_={
+                    "sum": DailyTotalORM.sum + insert_stmt.excluded.sum,
+                    "count": DailyTotalORM.count + insert_stmt.excluded.count,
+                },
+            )
+        )
+
+    async def delete_for_account(self, account_id: int) -> None:
+        await self.session.execute(
+            delete(DailyTotalORM).where(DailyTotalORM.account_id == account_id)
+        )
+
+    async def delete_for_user(self, user_id: int) -> None:
+        await self.session.execute(
+            delete(DailyTotalORM).where(DailyTotalORM.user_id == user_id)
+        )
+
+    @read_only
+    async def get_incomes_and_expenses(
+        self,
+        user_id: int,
+        days: int = 30,
+    ) -> tuple[Decimal, Decimal]:
+        """Return income and expense totals over the last `days` UTC days."""
+        since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+        is_income = DailyTotalORM.type == TransactionType.INCOME
+        is_expense = DailyTotalORM.type == TransactionType.EXPENSE
+        result = await self.session.execute(
+            select(
+                func.coalesce(
+                    func.sum(case((is_income, DailyTotalORM.sum), else_=0)), 0
+                ).label("total_incomes"),
+                func.coalesce(
+                    func.sum(case((is_expense, DailyTotalORM.sum), else_=0)), 0
+                ).label("total_expenses"),
+            ).where(
+                DailyTotalORM.user_id == user_id,
+                DailyTotalORM.day >= since,
+            )
+        )
+        summary = result.one()
+        return summary.total_incomes, summary.total_expenses
+
+    async def rebuild(self) -> int:
+        """
+        Recompute the rollup from the ledger. Returns the bucket count.
+
+        Days before `ledger_start` are left alone: their transactions were
+        detached from the ledger, and the rollup is what remains of them.
+        """
+        since = await ledger_start(self.session)
+        stale = delete(DailyTotalORM)
+        if since is not None:
+            stale = stale.where(DailyTotalORM.day >= since)
+        await self.session.execute(stale)
+        result = await self.session.execute(
+            insert(DailyTotalORM).from_select(
+                ["user_id", "account_id", "day", "type", "sum", "count"],
+                self._ledger_totals_query(since),
+            )
+        )
+        return result.rowcount
+
+    async def verify(self) -> list[tuple[RollupKey, tuple, tuple]]:
+        """
+        Compare the rollup with the ledger, from `ledger_start` on.
+
+        Returns (key, expected, actual) for every bucket that differs, where
+        expected and actual are (sum, count) pairs.
+        """
+        since = await ledger_start(self.session)
+        rollup = select(
+            DailyTotalORM.user_id,
+            DailyTotalORM.account_id,
+            DailyTotalORM.day,
+            DailyTotalORM.type,
+            DailyTotalORM.sum,
+            DailyTotalORM.count,
+        ).where(DailyTotalORM.count != 0)
+        if since is not None:
+            rollup = rollup.where(DailyTotalORM.day >= since)
+        expected = {
+            (row.user_id, row.account_id, row.day, row.type): (row.sum, row.count)
+            for row in await self.session.execute(self._ledger_totals_query(since))
+        }
+        actual = {
+            (row.user_id, row.account_id, row.day, row.type): (row.sum, row.count)
+            for row in await self.session.execute(rollup)
+        }
+        mismatches = []
+        for key in expected.keys() | actual.keys():
+            want = expected.get(key, (Decimal(0), 0))
+            got = actual.get(key, (Decimal(0), 0))
+            if Decimal(want[0]) != Decimal(got[0]) or want[1] != got[1]:
+                mismatches.append((key, want, got))
+        return mismatches
+
+    def _ledger_totals_query(self, since: date | None = None):
+        day = self._ledger_day()
+        query = select(
+            TransactionORM.user_id,
+            TransactionORM.account_id,
+            day.label("day"),
+            TransactionORM.type,
+            func.sum(TransactionORM.amount).label("sum"),
+            func.count().label("count"),
+        ).group_by(
+            TransactionORM.user_id,
+            TransactionORM.account_id,
+            day,
+            TransactionORM.type,
+        )
+        if since is not None:
+            start = datetime.combine(since, time.min, tzinfo=timezone.utc)
+            query = query.where(TransactionORM.created_at >= start)
+        return query
+
+    def _ledger_day(self):
+        if self.session.bind.dialect.name == "postgresql":
+            return cast(func.timezone("UTC", TransactionORM.created_at), Date)
+        return func.date(TransactionORM.created_at, type_=Date)
+
+    def _upsert_insert(self):
+        # Imported here so only the dialect in use is ever loaded
+        if self.session.bind.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        return insert
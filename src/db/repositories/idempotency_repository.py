@@ -0,0 +1,108 @@
+from datetime import datetime
+
+from sqlalchemy import and_, delete, or_, select, update as sa_update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import IdempotencyKey as IdempotencyKeyORM
+from src.models.domain.idempotency import IdempotencyRecord as IdempotencyRecordDomain
+from src.core.metrics import instrument_repository
+from .base import BaseRepository
+
+
+@instrument_repository
+class IdempotencyRepository(BaseRepository[IdempotencyRecordDomain, IdempotencyKeyORM]):
+    """
+    Repository for the idempotency_keys table.
+
+    Claims are a single INSERT .. ON CONFLICT statement, so concurrent
+    requests with the same key cannot both claim it, whichever process
+    they run in.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize idempotency repository with session."""
+        super().__init__(session, IdempotencyRecordDomain, IdempotencyKeyORM)
+
+    async def get_record(self, key: str) -> IdempotencyRecordDomain | None:
+        return self._to_domain(
+            await self.session.scalar(
+                select(self.db_model).where(self.db_model.key == key)
+            )
+        )
+
+    async def claim(self, record: IdempotencyRecordDomain, now: datetime) -> bool:
+        """
+        Store record as in progress unless its key is taken. A key is free
+        again once it expired, or once a claim on it was left unfinished
+        past its lock. Returns whether the record was stored.
+        """
+        insert = self._upsert_insert()
+        insert_stmt = insert(self.db_model).values(
+            key=record.key,
+            request_hash=record.request_hash,
+            locked_until=record.locked_until,
+            expires_at=record.expires_at,
+        )
+        claimed = await self.session.scalar(
+            insert_stmt.on_conflict_do_update(
+                index_elements=[self.db_model.key],
+                set_={
+                    "request_hash": insert_stmt.excluded.request_hash,
+                    "status_code": None,
+                    "headers": None,
+                    "body": None,
+                    "locked_until": insert_stmt.excluded.locked_until,
+                    "expires_at": insert_stmt.excluded.expires_at,
+                },
+                where=or_(
+                    self.db_model.expires_at <= now,
+                    and_(
+                        self.db_model.status_code.is_(None),
+                        self.db_model.locked_until <= now,
+                    ),
+                ),
+            ).returning(self.db_model.key)
+        )
+        return claimed is not None
+
+    async def complete(
+        self,
+        key: str,
+        status_code: int,
+        headers: list[list[str]],
+        body: bytes,
+        expires_at: datetime,
+    ) -> None:
+        await self.session.execute(
+            sa_update(self.db_model)
+            .where(self.db_model.key == key)
+            .values(
+                status_code=status_code,
+                headers=headers,
+                body=body,
+                expires_at=expires_at,
+            )
+        )
+
+    async def release(self, key: str) -> None:
+        """Drop an unfinished claim, so a retry runs the request again."""
+        await self.session.execute(
+            delete(self.db_model).where(
+                self.db_model.key == key,
+                self.db_model.status_code.is_(None),
+            )
+        )
+
+    async def delete_expired(self, now: datetime) -> int:
+        result = await self.session.execute(
+            delete(self.db_model).where(self.db_model.expires_at <= now)
+        )
+        return result.rowcount
+
+    def _upsert_insert(self):
+        # Imported here so only the dialect in use is ever loaded
+        if self.session.bind.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        return insert
@@ -0,0 +1,156 @@
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import select, update as sa_update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import Job as JobORM
+from src.models.domain.job import Job as JobDomain
+from src.models.enums import JobStatus
+from src.core.metrics import instrument_repository
+from src.db.routing import read_only
+from .base import BaseRepository
+
+FINISHED_STATUSES = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+REQUEUED = {
+    "status": JobStatus.PENDING,
+    "started_at": None,
+    "progress_done": 0,
+    "progress_total": None,
+}
+
+
+@instrument_repository
+class JobRepository(BaseRepository[JobDomain, JobORM]):
+    """
+    Repository for the jobs table backing the background job runner.
+
+    State transitions are single conditional UPDATEs, so several runner
+    processes can share the table without claiming the same job twice.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize job repository with session."""
+        super().__init__(session, JobDomain, JobORM)
+
+    @read_only
+    async def get_job_by_user(self, job_id: int, user_id: int) -> JobDomain | None:
+        return self._to_domain(
+            await self.session.scalar(
+                select(self.db_model).where(
+                    self.db_model.id == job_id,
+                    self.db_model.user_id == user_id,
+                )
+            )
+        )
+
+    async def claim_next(self) -> JobDomain | None:
+        """Mark the oldest pending job as running and return it."""
+        next_id = (
+            select(self.db_model.id)
+            .where(self.db_model.status == JobStatus.PENDING)
+            .order_by(self.db_model.id)
+            .limit(1)
+        )
+        if self.session.bind.dialect.name == "postgresql":
+            next_id = next_id.with_for_update(skip_locked=True)
+
+        return self._to_domain(
+            await self.session.scalar(
+                sa_update(self.db_model)
+                .where(
+                    self.db_model.id == next_id.scalar_subquery(),
+                    self.db_model.status == JobStatus.PENDING,
+                )
+                .values(status=JobStatus.RUNNING, started_at=_now())
+                .returning(self.db_model)
+            )
+        )
+
+    async def set_progress(self, job_id: int, done: int, total: int | None) -> None:
+        await self.session.execute(
+            sa_update(self.db_model)
+            .where(self.db_model.id == job_id)
+            .values(progress_done=done, progress_total=total)
+        )
+
+    async def finish(
+        self,
+        job_id: int,
+        status: JobStatus,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> None:
+        await self.session.execute(
+            sa_update(self.db_model)
+            .where(self.db_model.id == job_id)
+            .values(status=status, result=result, error=error, finished_at=_now())
+        )
+
+    async def requeue(self, job_ids: Iterable[int]) -> None:
+        """Return running jobs to the queue, e.g. when their runner stops."""
+        await self.session.execute(
+            sa_update(self.db_model)
+            .where(
+                self.db_model.id.in_(list(job_ids)),
+                self.db_model.status == JobStatus.RUNNING,
+            )
+            .values(**REQUEUED)
+        )
+
+    async def requeue_stale(self, before: datetime) -> int:
+        """Requeue running jobs whose runner stopped sending heartbeats."""
+        result = await self.session.execute(
+            sa_update(self.db_model)
+            .where(
+                self.db_model.status == JobStatus.RUNNING,
+                self.db_model.updated_at < before,
+            )
+            .values(**REQUEUED)
+        )
+        return result.rowcount
+
+    async def heartbeat(self, job_ids: Iterable[int]) -> list[int]:
+        """
+        Record that these running jobs are alive.
+
+        Returns the ids among them whose cancellation was requested.
+        """
+        result = await self.session.execute(
+            sa_update(self.db_model)
+            .where(self.db_model.id.in_(list(job_ids)))
+            .values(updated_at=_now())
+            .returning(self.db_model.id, self.db_model.cancel_requested)
+        )
+        return [row.id for row in result if row.cancel_requested]
+
+    async def request_cancel(self, job_id: int, user_id: int) -> JobDomain | None:
+        """
+        Flag an unfinished job for cancellation.
+
+        A pending job is cancelled outright; a running one stops at the
+        runner's next check. Returns None if there is no such unfinished job.
+        """
+        job = await self.session.scalar(
+            select(self.db_model)
+            .where(
+                self.db_model.id == job_id,
+                self.db_model.user_id == user_id,
+                self.db_model.status.not_in(FINISHED_STATUSES),
+            )
+            .with_for_update()
+        )
+        if job is None:
+            return None
+
+        job.cancel_requested = True
+        if job.status == JobStatus.PENDING:
+            job.status = JobStatus.CANCELLED
+            job.finished_at = _now()
+        await self.session.flush()
+        return self._to_domain(job)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
@@ -1,16 +1,21 @@
-from decimal import Decimal
-from datetime import datetime, timedelta, timezone
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from zoneinfo import ZoneInfo
 
-from sqlalchemy import case, func, select
+from sqlalchemy import Date, Row, cast, delete, func, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models.transaction import Transaction as TransactionORM, TransactionType
 from src.models.domain.transaction import (
     Transaction as TransactionDomain,
 )
+from src.models.enums import AnalyticsBucket
+from src.core.metrics import instrument_repository
+from src.db.routing import read_only
 from .base import BaseRepository
 
 
+@instrument_repository
 class TransactionRepository(BaseRepository[TransactionDomain, TransactionORM]):
     """
     Repository for Transaction model operations.
@@ -22,31 +27,153 @@ class TransactionRepository(BaseRepository[TransactionDomain, TransactionORM]):
         """Initialize transaction repository with session."""
         super().__init__(session, TransactionDomain, TransactionORM)
 
+    @read_only
     async def get_transactions(
         self,
         user_id: int,
         transaction_type: TransactionType | None = None,
-        skip: int = 0,
+        after: tuple[datetime, int] | None = None,
         limit: int = 100,
     ) -> list[TransactionDomain]:
+        """
+        Return a page of the user's transactions, newest first.
+
+        Pages are keyed on (created_at, id): pass the position of the last
+        row of the previous page as `after` to continue from it.
+        """
         query = (
-            select(self.db_model)
+            self._select_projection()
             .where(self.db_model.user_id == user_id)
-            .order_by(self.db_model.created_at.desc())
-            .offset(skip)
+            .order_by(self.db_model.created_at.desc(), self.db_model.id.desc())
             .limit(limit)
         )
         if transaction_type is not None:
             query = query.where(self.db_model.type == transaction_type)
+        if after is not None:
+            query = query.where(
+                tuple_(self.db_model.created_at, self.db_model.id) < tuple_(*after)
+            )
+
+        result = await self.session.execute(query)
+        return self._rows_to_domain(result)
 
-        obj_list = await self.session.scalars(query)
-        return [self._to_domain(t) for t in obj_list.all()]
+    @read_only
+    async def stream_transactions(
+        self,
+        user_id: int,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        account_id: int | None = None,
+        fetch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Stream the user's transactions, oldest first, in batches of rows.
+
+        Uses a server-side cursor, so at most `fetch_size` rows are held in
+        memory at a time regardless of the size of the ledger.
+        """
+        query = (
+            select(
+                self.db_model.id,
+                self.db_model.created_at,
+                self.db_model.type,
+                self.db_model.amount,
+                self.db_model.account_id,
+                self.db_model.description,
+            )
+            .where(self.db_model.user_id == user_id)
+            .order_by(self.db_model.created_at, self.db_model.id)
+            .execution_options(yield_per=fetch_size)
+        )
+        if date_from is not None:
+            query = query.where(self.db_model.created_at >= date_from)
+        if date_to is not None:
+            query = query.where(self.db_model.created_at < date_to)
+        if account_id is not None:
+            query = query.where(self.db_model.account_id == account_id)
+
+        result = await self.session.stream(query)
+        async for rows in result.partitions():
+            yield rows
+
+    @read_only
+    async def get_bucketed_totals(
+        self,
+        user_id: int,
+        bucket: AnalyticsBucket,
+        start: datetime,
+        end: datetime,
+        tz: ZoneInfo,
+        account_id: int | None = None,
+    ) -> Sequence[Row]:
+        """
+        Return (period, type, total, count) rows for the user's transactions
+        in [start, end), grouped by the local period they fall in.
+
+        `period` is the first local day of the day, week (Monday) or month.
+        """
+        period = self._local_period(bucket, tz, start).label("period")
+        query = (
+            select(
+                period,
+                self.db_model.type,
+                func.sum(self.db_model.amount).label("total"),
+                func.count().label("count"),
+            )
+            .where(
+                self.db_model.user_id == user_id,
+                self.db_model.created_at >= start,
+                self.db_model.created_at < end,
+            )
+            .group_by(period, self.db_model.type)
+            .order_by(period)
+        )
+        if account_id is not None:
+            query = query.where(self.db_model.account_id == account_id)
+
+        result = await self.session.execute(query)
+        return result.all()
+
+    def _local_period(self, bucket: AnalyticsBucket, tz: ZoneInfo, start: datetime):
+        created_at = self.db_model.created_at
+        if self.session.bind.dialect.name == "postgresql":
+            local = func.timezone(tz.key, created_at)
+            return cast(func.date_trunc(bucket.value, local), Date)
+
+        # SQLite has no time zone database: shift by the zone's offset at the
+        # start of the range. Periods across a DST change may be off by the
+        # DST delta for rows within that long of midnight.
+        offset = int(start.astimezone(tz).utcoffset().total_seconds() // 60)
+        modifiers = [f"{offset:+d} minutes"]
+        if bucket == AnalyticsBucket.WEEK:
+            modifiers += ["-6 days", "weekday 1"]
+        elif bucket == AnalyticsBucket.MONTH:
+            modifiers.append("start of month")
+        return func.strftime("%Y-%m-%d", created_at, *modifiers, type_=Date)
+
+    async def create_many(
+        self, domain_objs: list[TransactionDomain]
+    ) -> list[TransactionDomain]:
+        """Insert many transactions in batched multi-row INSERTs."""
+        result = await self.session.scalars(
+            insert(self.db_model).returning(
+                self.db_model, sort_by_parameter_order=True
+            ),
+            [obj.model_dump(exclude={"id"}) for obj in domain_objs],
+        )
+        return [self._to_domain(t) for t in result.all()]
+
+    async def delete_for_user(self, user_id: int) -> None:
+        await self.session.execute(
+            delete(self.db_model).where(self.db_model.user_id == user_id)
+        )
 
     async def get_transaction_by_user(
         self,
         transaction_id: int,
         user_id: int,
         transaction_type: TransactionType | None = None,
+        for_update: bool = False,
     ) -> TransactionDomain | None:
         query = select(self.db_model).where(
             self.db_model.id == transaction_id,
@@ -54,29 +181,7 @@ class TransactionRepository(BaseRepository[TransactionDomain, TransactionORM]):
         )
         if transaction_type is not None:
             query = query.where(self.db_model.type == transaction_type)
+        if for_update:
+            query = query.with_for_update()
 
         return self._to_domain(await self.session.scalar(query))
-    
-    async def get_incomes_and_expenses(
-        self,
-        user_id: int,
-        days: int = 30,
-    ) -> tuple[Decimal, Decimal]:
-        since = datetime.now(timezone.utc) - timedelta(days=days)
-        result = await self.session.execute(
-            select(
-                func.coalesce(func.sum(
-                    case((self.db_model.type == TransactionType.INCOME, self.db_model.amount), else_=0)
-                ), 0).label("total_incomes"),
-                func.coalesce(func.sum(
-                    case((self.db_model.type == TransactionType.EXPENSE, self.db_model.amount), else_=0)
-                ), 0).label("total_expenses"),
-            ).where(
-                self.db_model.user_id == user_id,
-                self.db_model.created_at >= since,
-            )
-        )
-        summary = result.one()
-        return summary.total_incomes, summary.total_expenses
-
-        
\ No newline at end of file
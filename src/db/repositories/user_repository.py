@@ -1,21 +1,65 @@
+from typing import Any
+
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import TTLCache
+from src.core.metrics import instrument_repository
 from src.db.models.user import User as UserORM
 from src.models.domain.user import User as UserDomain
 from .base import BaseRepository
 
 
+class UserCache(TTLCache[int, UserDomain]):
+    """Process-wide cache of users by id, used by the per-request auth lookup."""
+
+    pass
+
+
+@instrument_repository
 class UserRepository(BaseRepository[UserDomain, UserORM]):
     """
     Repository for User model operations.
 
-    Provides user-specific queries beyond basic CRUD.
+    Provides user-specific queries beyond basic CRUD. Lookups by id are
+    served from the optional user cache; every write through this
+    repository invalidates the affected entry. That alone does not keep a
+    concurrent request from caching the old row again before the write
+    commits, so services also invalidate once their unit of work commits.
     """
 
-    def __init__(self, session: AsyncSession):
-        """Initialize user repository with session."""
+    def __init__(self, session: AsyncSession, cache: UserCache | None = None):
+        """Initialize user repository with session and optional cache."""
         super().__init__(session, UserDomain, UserORM)
+        self.cache = cache
+
+    async def get(self, id: int) -> UserDomain | None:
+        if self.cache is not None and (user := self.cache.get(id)) is not None:
+            return user
+
+        user = await super().get(id)
+        if user is not None and self.cache is not None:
+            self.cache.set(id, user)
+        return user
+
+    async def update(
+        self,
+        id: int,
+        update_data: UserDomain | dict[str, Any],
+    ) -> UserDomain | None:
+        user = await super().update(id, update_data)
+        self.invalidate(id)
+        return user
+
+    async def delete(self, id: int) -> bool:
+        deleted = await super().delete(id)
+        self.invalidate(id)
+        return deleted
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop the user's cached entry, if any."""
+        if self.cache is not None:
+            self.cache.invalidate(user_id)
 
     async def activate_user(self, user_id: int) -> UserDomain | None:
         return await self.update(user_id, {"is_active": True})
@@ -0,0 +1,111 @@
+"""
+Routing of read-only repository methods to a read replica.
+
+Repository methods decorated with `read_only` may run on the replica;
+everything else, and everything inside a UnitOfWork, runs on the primary.
+After a user's unit of work commits, that user's reads stay on the primary
+for a short window, so they see their own writes despite replication lag.
+"""
+
+import functools
+import inspect
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from sqlalchemy import Delete, Insert, Update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.core.cache import TTLCache
+
+F = TypeVar("F", bound=Callable)
+
+# Id of the user the current request acts for, set by get_current_user
+current_user_id: ContextVar[int | None] = ContextVar("current_user_id", default=None)
+
+_read_only: ContextVar[bool] = ContextVar("read_only", default=False)
+
+WRITING = "writing"
+
+
+class RecentWriters(TTLCache[int, bool]):
+    """Users who committed a write within the last `ttl` seconds."""
+
+    def mark(self, user_id: int | None) -> None:
+        if user_id is not None:
+            self.set(user_id, True)
+
+    def is_recent(self, user_id: int | None) -> bool:
+        return user_id is not None and self.get(user_id) is not None
+
+
+def read_only(func: F) -> F:
+    """Mark a repository method as a read that may be served by the replica."""
+    if inspect.isasyncgenfunction(func):
+
+        @functools.wraps(func)
+        async def read_only_generator(*args, **kwargs):
+            generator = func(*args, **kwargs)
+            try:
+                while True:
+                    token = _read_only.set(True)
+                    try:
+                        item = await anext(generator)
+                    except StopAsyncIteration:
+                        return
+                    finally:
+                        _read_only.reset(token)
+                    yield item
+            finally:
+                await generator.aclose()
+
+        return read_only_generator
+
+    @functools.wraps(func)
+    async def read_only_method(*args, **kwargs):
+        token = _read_only.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+
+    return read_only_method
+
+
+class RoutingSession(Session):
+    """
+    Session that sends statements from `read_only` methods to the replica.
+
+    Statements go to the primary when there is no replica, when the
+    session is inside a UnitOfWork or flushing, for DML, and for users in
+    `recent_writers`.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replica: Engine | None = None,
+        recent_writers: RecentWriters | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.replica = replica
+        self.recent_writers = recent_writers
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        if self._use_replica(clause):
+            return self.replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def _use_replica(self, clause) -> bool:
+        if self.replica is None or not _read_only.get():
+            return False
+        if self._flushing or self.info.get(WRITING):
+            return False
+        if isinstance(clause, (Insert, Update, Delete)):
+            return False
+        return not (
+            self.recent_writers is not None
+            and self.recent_writers.is_recent(current_user_id.get())
+        )
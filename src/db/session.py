@@ -1,40 +1,108 @@
-from typing import AsyncGenerator
+import time
+from typing import Any
 
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
 )
 
-from src.core import settings
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
+from src.core.config import Config
+from src.core.metrics import DB_POOL_WAIT
+from src.db.query_counter import install_query_counter
+from src.db.routing import RecentWriters, RoutingSession
 
-class AsyncSessionManager:
-    def __init__(self, database_url: str):
-        self.engine = create_async_engine(database_url, echo=True)
-        self.sessionmaker = async_sessionmaker(
-            bind=self.engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-            autoflush=False,
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started)
+
+
+def create_engine(
+    config: Config,
+    db_url: str | None = None,
+    read_only: bool = False,
+) -> AsyncEngine:
+    """
+    Create an async engine with pool settings from config.
+
+    Connects to `db_url`, by default the primary. With read_only the
+    database rejects writes on its connections, so a statement routed to
+    a replica by mistake fails instead of diverging from the primary.
+    """
+    url = make_url(db_url or config.db_url)
+    options: dict[str, Any] = {
+        "echo": config.db_echo,
+        "query_cache_size": config.db_statement_cache_size,
+    }
+
+    # In-memory SQLite runs on a single static connection, so the queue
+    # pool settings do not apply there.
+    in_memory = url.get_backend_name() == "sqlite" and url.database in (
+        None,
+        "",
+        ":memory:",
+    )
+    if not in_memory:
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=config.db_pool_size,
+            max_overflow=config.db_max_overflow,
+            pool_timeout=config.db_pool_timeout,
+            pool_recycle=config.db_pool_recycle,
+            pool_pre_ping=config.db_pool_pre_ping,
         )
 
-    async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
-        """
-        Dependency that yields a database session and closes it after the request.
-        """
-        async with self.sessionmaker() as session:
-            try:
-                yield session
-            except Exception:
-                await session.rollback()
-                raise
-            finally:
-                await session.close()
-
-    async def close(self):
-        """Dispose of the database engine and close all connections."""
-        await self.engine.dispose()
-
-
-db_session_manager = AsyncSessionManager(database_url=settings.db_url)
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": config.db_statement_cache_size,
+        }
+        if read_only:
+            options["connect_args"]["server_settings"] = {
+                "default_transaction_read_only": "on",
+            }
+
+    engine = create_async_engine(url, **options)
+    install_query_counter(engine)
+    if read_only and url.get_backend_name() == "sqlite":
+        event.listen(engine.sync_engine, "connect", _sqlite_query_only)
+    return engine
+
+
+def _sqlite_query_only(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only = ON")
+    cursor.close()
+
+
+def create_sessionmaker(
+    engine: AsyncEngine,
+    replica: AsyncEngine | None = None,
+    recent_writers: RecentWriters | None = None,
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Create the session factory bound to the application's engine.
+
+    With a replica, reads from `read_only` repository methods go to it;
+    see src.db.routing.
+    """
+    return async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        replica=replica.sync_engine if replica is not None else None,
+        recent_writers=recent_writers,
+        expire_on_commit=False,
+        autoflush=False,
+    )
@@ -0,0 +1,72 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .routing import WRITING, RecentWriters, current_user_id
+
+
+class UnitOfWork:
+    """
+    Groups repository writes into a single database transaction.
+
+    Leaving the outermost `async with` block commits, or rolls back if an
+    exception escapes it. Nested blocks join the enclosing transaction, so
+    one service can call another without committing half of the work.
+
+    Everything inside the block runs on the primary database. Once it
+    commits, the current user is added to `recent_writers`, which keeps
+    their reads off the replica until it has caught up.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        recent_writers: RecentWriters | None = None,
+    ):
+        self.session = session
+        self.recent_writers = recent_writers
+        self._depth = 0
+        self._on_commit: list[Callable[[], None]] = []
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self._depth += 1
+        self.session.info[WRITING] = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._depth -= 1
+        if self._depth:
+            return
+
+        callbacks, self._on_commit = self._on_commit, []
+        self.session.info[WRITING] = False
+        if exc_type is not None:
+            await self.session.rollback()
+            return
+
+        await self.session.commit()
+        if self.recent_writers is not None:
+            self.recent_writers.mark(current_user_id.get())
+        for callback in callbacks:
+            callback()
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Run callback once the outermost block has committed successfully."""
+        self._on_commit.append(callback)
+
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[None]:
+        """
+        Run a block under a SAVEPOINT inside the current unit of work.
+
+        If the block raises, only its own writes are rolled back, along with
+        the on_commit callbacks it registered; the exception propagates.
+        """
+        callbacks = len(self._on_commit)
+        try:
+            async with self.session.begin_nested():
+                yield
+        except BaseException:
+            del self._on_commit[callbacks:]
+            raise
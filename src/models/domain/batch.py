@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+from .account import Account
+from .transaction import Transaction
+from src.models.enums import BatchMode, BatchOperationType
+
+
+class BatchItemResult(BaseModel):
+    index: int
+    op: BatchOperationType
+    status: int
+    result: Account | Transaction | None = None
+    detail: str | None = None
+
+
+class BatchResult(BaseModel):
+    mode: BatchMode
+    committed: bool = False
+    results: list[BatchItemResult] = []
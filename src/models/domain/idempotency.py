@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class IdempotencyRecord(BaseModel):
+    key: str
+    request_hash: str
+    status_code: int | None = None
+    headers: list[list[str]] | None = None
+    body: bytes | None = None
+    locked_until: datetime
+    expires_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @property
+    def completed(self) -> bool:
+        return self.status_code is not None
@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+from src.models.enums import JobStatus
+
+
+class Job(BaseModel):
+    id: int | None = None
+    kind: str
+    status: JobStatus = JobStatus.PENDING
+    params: dict[str, Any] = {}
+    progress_done: int = 0
+    progress_total: int | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    cancel_requested: bool = False
+    user_id: int | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
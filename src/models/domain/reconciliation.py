@@ -0,0 +1,18 @@
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class BalanceDrift(BaseModel):
+    account_id: int
+    user_id: int
+    recorded: Decimal
+    expected: Decimal
+
+
+class ReconciliationReport(BaseModel):
+    accounts_checked: int = 0
+    drifted_accounts: int = 0
+    repaired: bool = False
+    # At most `max_reported` entries; drifted_accounts has the full count
+    drifts: list[BalanceDrift] = []
@@ -1,10 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from src.models.enums import TransactionType
+from src.models.enums import AnalyticsBucket, TransactionType
 
 
 class Transaction(BaseModel):
@@ -20,6 +20,21 @@ class Transaction(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TransactionPage(BaseModel):
+    items: list[Transaction] = []
+    next_cursor: str | None = None
+
+
+class TransactionBulkError(BaseModel):
+    index: int
+    detail: str
+
+
+class TransactionBulkResult(BaseModel):
+    created: list[Transaction] = []
+    errors: list[TransactionBulkError] = []
+
+
 class TransactionSummary(BaseModel):
     total_balance: Decimal = 0
     total_incomes: Decimal = 0
@@ -27,3 +42,19 @@ class TransactionSummary(BaseModel):
     # goals_progress: Decimal  # TODO
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TransactionAnalyticsPoint(BaseModel):
+    period: date
+    incomes: Decimal = Decimal(0)
+    expenses: Decimal = Decimal(0)
+    income_count: int = 0
+    expense_count: int = 0
+
+
+class TransactionAnalytics(BaseModel):
+    bucket: AnalyticsBucket
+    tz: str
+    date_from: date
+    date_to: date
+    series: list[TransactionAnalyticsPoint] = []
@@ -6,6 +6,44 @@ class TransactionType(StrEnum):
     INCOME = "income"
 
 
+class ExportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class AnalyticsBucket(StrEnum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class JobKind(StrEnum):
+    DAILY_TOTALS_REBUILD = "daily_totals_rebuild"
+    BALANCE_RECONCILE = "balance_reconcile"
+
+
+class JobStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class BatchMode(StrEnum):
+    ATOMIC = "atomic"
+    BEST_EFFORT = "best_effort"
+
+
+class BatchOperationType(StrEnum):
+    ACCOUNT_CREATE = "account.create"
+    ACCOUNT_UPDATE = "account.update"
+    ACCOUNT_DELETE = "account.delete"
+    TRANSACTION_CREATE = "transaction.create"
+    TRANSACTION_UPDATE = "transaction.update"
+    TRANSACTION_DELETE = "transaction.delete"
+
+
 class AccountType(StrEnum):
     DEBIT = "debit"
     CREDIT = "credit"
@@ -2,3 +2,8 @@ from .user_service import UserService
 from .auth_service import AuthService
 from .transaction_service import TransactionService
 from .account_service import AccountService
+from .summary_cache import SummaryCache
+from .job_service import JobService
+from .reconciliation_service import ReconciliationService
+from .batch_service import BatchService
+from .job_handlers import JOB_HANDLERS
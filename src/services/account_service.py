@@ -3,7 +3,9 @@ from src.core.schemas.account import AccountCreate, AccountUpdate
 
 from .base_service import BaseService
 from src.models.domain.account import Account as AccountDomain
-from src.db.repositories import AccountRepository
+from src.db import UnitOfWork
+from src.db.repositories import AccountRepository, DailyTotalRepository
+from .summary_cache import SummaryCache
 from sqlalchemy.exc import IntegrityError
 
 
@@ -11,24 +13,32 @@ class AccountService(BaseService):
     def __init__(
         self,
         account_repository: AccountRepository,
+        daily_total_repository: DailyTotalRepository,
+        uow: UnitOfWork,
+        summary_cache: SummaryCache,
     ):
         self.repo = account_repository
+        self.daily_totals = daily_total_repository
+        self.uow = uow
+        self.summary_cache = summary_cache
 
     async def get_account(
         self,
         account_id: int,
         user_id: int,
+        transactions_limit: int = 5,
     ) -> AccountDomain:
         return self._require(
-            await self.repo.get_account(account_id, user_id),
+            await self.repo.get_account(account_id, user_id, transactions_limit),
             f"Account with id {account_id} not found",
         )
 
     async def get_accounts(
         self,
         user_id: int,
+        transactions_limit: int = 5,
     ) -> list[AccountDomain]:
-        return await self.repo.get_accounts(user_id)
+        return await self.repo.get_accounts(user_id, transactions_limit)
 
     async def create(
         self,
@@ -37,7 +47,9 @@ class AccountService(BaseService):
     ) -> AccountDomain:
         new_account = AccountDomain(**data.model_dump(), user_id=user_id)
         try:
-            return await self.repo.create(new_account)
+            async with self.uow:
+                self._touch_ledger(user_id)
+                return await self.repo.create(new_account)
         except IntegrityError as e:
             constraint_name = getattr(e.orig, "constraint_name", None) or str(e.orig)
             if "uq_user_account_number" in constraint_name:
@@ -52,9 +64,13 @@ class AccountService(BaseService):
         data: AccountUpdate,
         user_id: int,
     ) -> AccountDomain:
-        await self.get_account(account_id, user_id)
+        await self.get_account(account_id, user_id, transactions_limit=0)
         try:
-            return await self.repo.update(account_id, data.model_dump(exclude_unset=True))
+            async with self.uow:
+                self._touch_ledger(user_id)
+                return await self.repo.update(
+                    account_id, data.model_dump(exclude_unset=True)
+                )
         except IntegrityError as e:
             constraint_name = getattr(e.orig, "constraint_name", None) or str(e.orig)
             if "uq_user_account_number" in constraint_name:
@@ -64,5 +80,12 @@ class AccountService(BaseService):
             raise DomainException("Something went wrong...")
 
     async def delete(self, account_id: int, user_id: int) -> None:
-        await self.get_account(account_id, user_id)
-        await self.repo.delete(account_id)
+        async with self.uow:
+            await self.get_account(account_id, user_id, transactions_limit=0)
+            await self.daily_totals.delete_for_account(account_id)
+            await self.repo.delete(account_id)
+            self._touch_ledger(user_id)
+
+    def _touch_ledger(self, user_id: int) -> None:
+        """Account balances feed the dashboard; drop its cached summary on commit."""
+        self.uow.on_commit(lambda: self.summary_cache.bump(user_id))
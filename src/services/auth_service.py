@@ -1,14 +1,14 @@
-from authx import RequestToken
-
 from .user_service import UserService
 from .base_service import BaseService
-from src.core.auth_config import verify_password, generate_access_token, security
+from src.core.auth_config import generate_access_token, get_security
 from src.core.exceptions import InvalidCredentialsError
+from src.core.hashing import PasswordHasher
 
 
 class AuthService(BaseService):
-    def __init__(self, user_service: UserService):
+    def __init__(self, user_service: UserService, password_hasher: PasswordHasher):
         self.user_service = user_service
+        self.password_hasher = password_hasher
 
     async def authenticate_and_create_token_pair(
         self,
@@ -17,20 +17,24 @@ class AuthService(BaseService):
     ) -> dict[str, str]:
         user = await self.user_service.get_by_username(username)
 
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await self.password_hasher.verify(
+            password, user.hashed_password
+        ):
             raise InvalidCredentialsError("Invalid credentials")
 
         return {
             "access_token": generate_access_token(user),
-            "refresh_token": security.create_refresh_token(uid=str(user.id)),
+            "refresh_token": get_security().create_refresh_token(uid=str(user.id)),
             "token_type": "Bearer",
         }
 
     async def refresh_access_token(self, token: str) -> dict[str, str]:
+        from authx import RequestToken
+
         converted_token = RequestToken(token=token, location="json", type="refresh")
 
         try:
-            payload = security.verify_token(converted_token)
+            payload = get_security().verify_token(converted_token)
         except Exception:
             raise InvalidCredentialsError("Invalid or expired token.")
 
@@ -0,0 +1,160 @@
+from collections.abc import Sequence
+from contextlib import nullcontext
+from http import HTTPStatus
+
+from src.core.exceptions import DomainException
+from src.core.exceptions_handler import status_code_for
+from src.core.schemas.batch import (
+    AccountCreateOperation,
+    AccountDeleteOperation,
+    AccountUpdateOperation,
+    BatchOperation,
+    TransactionCreateOperation,
+    TransactionDeleteOperation,
+    TransactionUpdateOperation,
+)
+from src.db import UnitOfWork
+from src.models.domain.account import Account as AccountDomain
+from src.models.domain.batch import (
+    BatchItemResult as BatchItemResultDomain,
+    BatchResult as BatchResultDomain,
+)
+from src.models.domain.transaction import Transaction as TransactionDomain
+from src.models.enums import BatchMode
+
+from .account_service import AccountService
+from .base_service import BaseService
+from .transaction_service import TransactionService
+
+
+class _RollBack(Exception):
+    """Leaves the unit of work of an atomic batch without committing it."""
+
+
+class BatchService(BaseService):
+    """
+    Runs several account and transaction operations in one database
+    transaction, in the order given.
+
+    In atomic mode the first failing operation rolls back the whole batch.
+    In best-effort mode every operation runs under its own savepoint, so a
+    failure only undoes that operation and the rest are committed.
+    """
+
+    def __init__(
+        self,
+        account_service: AccountService,
+        transaction_service: TransactionService,
+        uow: UnitOfWork,
+    ):
+        self.accounts = account_service
+        self.transactions = transaction_service
+        self.uow = uow
+
+    async def execute(
+        self,
+        operations: Sequence[BatchOperation],
+        mode: BatchMode,
+        user_id: int,
+    ) -> BatchResultDomain:
+        results: list[BatchItemResultDomain] = []
+        try:
+            async with self.uow:
+                for index, operation in enumerate(operations):
+                    item = await self._execute_one(index, operation, mode, user_id)
+                    results.append(item)
+                    if item.detail is not None and mode == BatchMode.ATOMIC:
+                        raise _RollBack()
+        except _RollBack:
+            return BatchResultDomain(
+                mode=mode,
+                committed=False,
+                results=self._rolled_back(operations, results),
+            )
+
+        return BatchResultDomain(
+            mode=mode,
+            committed=any(item.detail is None for item in results),
+            results=results,
+        )
+
+    async def _execute_one(
+        self,
+        index: int,
+        operation: BatchOperation,
+        mode: BatchMode,
+        user_id: int,
+    ) -> BatchItemResultDomain:
+        scope = self.uow.savepoint() if mode == BatchMode.BEST_EFFORT else nullcontext()
+        try:
+            async with scope:
+                status, result = await self._dispatch(operation, user_id)
+        except DomainException as e:
+            return BatchItemResultDomain(
+                index=index,
+                op=operation.op,
+                status=status_code_for(e),
+                detail=e.message,
+            )
+        return BatchItemResultDomain(
+            index=index, op=operation.op, status=status, result=result
+        )
+
+    async def _dispatch(
+        self, operation: BatchOperation, user_id: int
+    ) -> tuple[int, AccountDomain | TransactionDomain | None]:
+        match operation:
+            case AccountCreateOperation():
+                return HTTPStatus.CREATED, await self.accounts.create(
+                    operation.data, user_id
+                )
+            case AccountUpdateOperation():
+                return HTTPStatus.OK, await self.accounts.update(
+                    operation.id, operation.data, user_id
+                )
+            case AccountDeleteOperation():
+                await self.accounts.delete(operation.id, user_id)
+                return HTTPStatus.NO_CONTENT, None
+            case TransactionCreateOperation():
+                return HTTPStatus.CREATED, await self.transactions.add_transaction(
+                    operation.data, user_id
+                )
+            case TransactionUpdateOperation():
+                return HTTPStatus.OK, await self.transactions.update_transaction(
+                    operation.id, operation.data, user_id
+                )
+            case TransactionDeleteOperation():
+                await self.transactions.delete_transaction(operation.id, user_id)
+                return HTTPStatus.NO_CONTENT, None
+        raise DomainException(f"Unsupported batch operation {operation.op}")
+
+    @staticmethod
+    def _rolled_back(
+        operations: Sequence[BatchOperation],
+        results: list[BatchItemResultDomain],
+    ) -> list[BatchItemResultDomain]:
+        """
+        Results of an atomic batch that failed: the failing operation keeps
+        its error, everything before it was undone and nothing after it ran.
+        """
+        failed = results[-1]
+        rolled_back = [
+            BatchItemResultDomain(
+                index=item.index,
+                op=item.op,
+                status=HTTPStatus.FAILED_DEPENDENCY,
+                detail="Rolled back",
+            )
+            for item in results[:-1]
+        ]
+        not_executed = [
+            BatchItemResultDomain(
+                index=index,
+                op=operation.op,
+                status=HTTPStatus.FAILED_DEPENDENCY,
+                detail="Not executed",
+            )
+            for index, operation in enumerate(operations)
+            if index > failed.index
+        ]
+        return [*rolled_back, failed, *not_executed]
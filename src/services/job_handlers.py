@@ -0,0 +1,69 @@
+"""Handlers for the job kinds in JobKind, registered with the JobRunner."""
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.core.config import settings
+from src.core.jobs import JobContext, JobHandler
+from src.db import UnitOfWork
+from src.db.repositories import DailyTotalRepository
+from src.models.enums import JobKind
+from .reconciliation_service import ReconciliationService
+from .summary_cache import SummaryCache
+
+
+class RebuildDailyTotalsParams(BaseModel):
+    """A daily_totals_rebuild job takes no params."""
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ReconcileBalancesParams(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    repair: bool = False
+    chunk_size: int = Field(default_factory=lambda: settings.reconcile_chunk_size, ge=1)
+
+
+async def rebuild_daily_totals(ctx: JobContext) -> dict[str, Any]:
+    """
+    Recompute the daily_totals rollup from the ledger.
+
+    Any user's totals may change, so every cached dashboard summary is
+    invalidated once the rebuild commits.
+    """
+    uow = await ctx.get(UnitOfWork)
+    daily_totals = await ctx.get(DailyTotalRepository)
+    summary_cache = await ctx.get(SummaryCache)
+    await ctx.report(0, 1)
+    async with uow:
+        buckets = await daily_totals.rebuild()
+        uow.on_commit(summary_cache.bump_all)
+    await ctx.report(1, 1)
+    return {"buckets": buckets}
+
+
+async def reconcile_balances(ctx: JobContext) -> dict[str, Any]:
+    """Check account balances against the ledger; see ReconcileBalancesParams."""
+    params = ReconcileBalancesParams.model_validate(ctx.params)
+    service = await ctx.get(ReconciliationService)
+    report = await service.reconcile(
+        repair=params.repair,
+        chunk_size=params.chunk_size,
+        max_reported=100,
+        progress=ctx.report,
+    )
+    return report.model_dump(mode="json")
+
+
+JOB_HANDLERS: dict[str, JobHandler] = {
+    JobKind.DAILY_TOTALS_REBUILD: rebuild_daily_totals,
+    JobKind.BALANCE_RECONCILE: reconcile_balances,
+}
+
+# Params accepted by each job kind, checked when the job is enqueued
+JOB_PARAMS: dict[str, type[BaseModel]] = {
+    JobKind.DAILY_TOTALS_REBUILD: RebuildDailyTotalsParams,
+    JobKind.BALANCE_RECONCILE: ReconcileBalancesParams,
+}
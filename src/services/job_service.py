@@ -0,0 +1,75 @@
+from typing import Any
+
+from pydantic import ValidationError
+
+from src.core.exceptions import InvalidParameterError
+from src.core.jobs import JobRunner
+from src.db import UnitOfWork
+from src.db.repositories import JobRepository
+from src.models.domain.job import Job as JobDomain
+from src.models.enums import JobKind, JobStatus
+
+from .base_service import BaseService
+from .job_handlers import JOB_PARAMS
+
+
+class JobService(BaseService):
+    """Enqueues background jobs and reports on them."""
+
+    def __init__(
+        self,
+        job_repository: JobRepository,
+        uow: UnitOfWork,
+        runner: JobRunner,
+    ):
+        self.repo = job_repository
+        self.uow = uow
+        self.runner = runner
+
+    async def enqueue(
+        self,
+        kind: JobKind,
+        params: dict[str, Any] | None = None,
+        user_id: int | None = None,
+    ) -> JobDomain:
+        """
+        Add a job to the queue. When called inside a wider UnitOfWork the
+        job is only visible to the runner once that work commits.
+
+        Raises InvalidParameterError if the params do not fit the kind.
+        """
+        try:
+            checked = JOB_PARAMS[kind].model_validate(params or {})
+        except ValidationError as exc:
+            errors = "; ".join(
+                f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                for error in exc.errors()
+            )
+            raise InvalidParameterError(f"Invalid params for {kind}: {errors}")
+
+        async with self.uow:
+            job = await self.repo.create(
+                JobDomain(
+                    kind=kind,
+                    params=checked.model_dump(mode="json", exclude_unset=True),
+                    user_id=user_id,
+                )
+            )
+            self.uow.on_commit(self.runner.notify)
+            return job
+
+    async def get_job(self, job_id: int, user_id: int) -> JobDomain:
+        return self._require(
+            await self.repo.get_job_by_user(job_id, user_id),
+            f"Job with id {job_id} not found",
+        )
+
+    async def cancel_job(self, job_id: int, user_id: int) -> JobDomain:
+        """Request cancellation. Cancelling a finished job leaves it unchanged."""
+        async with self.uow:
+            job = await self.repo.request_cancel(job_id, user_id)
+            if job is None:
+                return await self.get_job(job_id, user_id)
+            if job.status == JobStatus.RUNNING:
+                self.uow.on_commit(lambda: self.runner.cancel(job_id))
+            return job
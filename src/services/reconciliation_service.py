@@ -0,0 +1,85 @@
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
+
+from src.db import UnitOfWork
+from src.db.repositories import AccountRepository
+from src.models.domain.reconciliation import BalanceDrift, ReconciliationReport
+
+from .summary_cache import SummaryCache
+
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+class ReconciliationService:
+    """
+    Checks account balances against the transaction ledger.
+
+    Accounts are read in id-keyset chunks, each with its expected balances
+    computed by the database in one grouped aggregate, so memory stays
+    bounded by the chunk size however large the ledger is.
+    """
+
+    def __init__(
+        self,
+        account_repository: AccountRepository,
+        uow: UnitOfWork,
+        summary_cache: SummaryCache | None = None,
+    ):
+        self.repo = account_repository
+        self.uow = uow
+        self.summary_cache = summary_cache
+
+    async def reconcile(
+        self,
+        repair: bool = False,
+        chunk_size: int = 1000,
+        max_reported: int = 1000,
+        progress: ProgressCallback | None = None,
+    ) -> ReconciliationReport:
+        """
+        Compare every account's balance with its opening balance plus its
+        ledger, and with repair=True correct the ones that drifted.
+
+        Each chunk is checked, and repaired, in its own transaction.
+        Corrections are applied as deltas, so writes that commit while the
+        reconciliation runs are not lost.
+        """
+        report = ReconciliationReport(repaired=repair)
+        total = await self.repo.count_accounts()
+        after_id = 0
+        while True:
+            async with self.uow:
+                rows = await self.repo.get_expected_balances(after_id, chunk_size)
+                corrections: dict[int, Decimal] = {}
+                for row in rows:
+                    if row.value == row.expected:
+                        continue
+                    report.drifted_accounts += 1
+                    if len(report.drifts) < max_reported:
+                        report.drifts.append(
+                            BalanceDrift(
+                                account_id=row.id,
+                                user_id=row.user_id,
+                                recorded=row.value,
+                                expected=row.expected,
+                            )
+                        )
+                    corrections[row.id] = row.expected - row.value
+                    if repair:
+                        self._touch_ledger(row.user_id)
+
+                if repair and corrections:
+                    await self.repo.adjust_balances(corrections)
+
+            if not rows:
+                break
+            report.accounts_checked += len(rows)
+            after_id = rows[-1].id
+            if progress is not None:
+                await progress(report.accounts_checked, total)
+
+        return report
+
+    def _touch_ledger(self, user_id: int) -> None:
+        if self.summary_cache is not None:
+            self.uow.on_commit(lambda: self.summary_cache.bump(user_id))
@@ -0,0 +1,110 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+
+from src.core.cache import TTLCache
+from src.models.domain.transaction import TransactionSummary as TransactionSummaryDomain
+
+
+@dataclass(frozen=True, slots=True)
+class CachedSummary:
+    """A dashboard summary along with the ledger version it was computed at."""
+
+    version: int
+    day: date
+    etag: str
+    summary: TransactionSummaryDomain
+
+
+class SummaryCache:
+    """
+    Per-user dashboard summaries, keyed by the user's ledger version.
+
+    Every committed transaction or account write bumps the user's ledger
+    version, which invalidates the cached summary. A cached entry is only
+    served while it was computed at the current version and on the current
+    day, since the summary covers a trailing window of days.
+
+    Versions are per process. A write made through another worker does not
+    bump them here, so until the local entry expires, at most `ttl` seconds,
+    this worker keeps serving the old summary and answers a matching
+    If-None-Match with 304. Versions are kept in a cache with the same
+    size and TTL as the summaries: a user whose version was evicted starts
+    again at 0, so an entry computed at a later version no longer matches
+    and is recomputed.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._entries: TTLCache[int, CachedSummary] = TTLCache(max_size, ttl)
+        self._versions: TTLCache[int, int] = TTLCache(max_size, ttl)
+        # Added to every user's version; advanced by writes to all users
+        self._epoch = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        return self._entries.hits
+
+    @property
+    def misses(self) -> int:
+        return self._entries.misses
+
+    @property
+    def invalidations(self) -> int:
+        return self._entries.invalidations
+
+    @property
+    def hit_ratio(self) -> float:
+        return self._entries.hit_ratio
+
+    def version(self, user_id: int) -> int:
+        return self._epoch + (self._versions.get(user_id) or 0)
+
+    def bump(self, user_id: int) -> None:
+        """Advance the user's ledger version and drop their cached summary."""
+        self._versions.set(user_id, (self._versions.get(user_id) or 0) + 1)
+        self._entries.invalidate(user_id)
+
+    def bump_all(self) -> None:
+        """Advance every user's ledger version, e.g. after a rollup rebuild."""
+        self._epoch += 1
+        self._entries.invalidate_matching(lambda user_id, entry: True)
+
+    def get(self, user_id: int) -> CachedSummary | None:
+        """Return the cached summary if it is still current."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        if entry.version != self.version(user_id) or entry.day != self.today():
+            self._entries.invalidate(user_id)
+            return None
+        return entry
+
+    def set(
+        self,
+        user_id: int,
+        version: int,
+        summary: TransactionSummaryDomain,
+    ) -> CachedSummary:
+        """
+        Cache a summary computed at the given version.
+
+        Callers read the version before querying, so a summary computed
+        while a write was committing is never stored as current.
+        """
+        digest = hashlib.sha1(summary.model_dump_json().encode()).hexdigest()[:16]
+        entry = CachedSummary(
+            version=version,
+            day=self.today(),
+            etag=f'"{version}-{digest}"',
+            summary=summary,
+        )
+        if version == self.version(user_id):
+            self._entries.set(user_id, entry)
+        return entry
+
+    @staticmethod
+    def today() -> date:
+        return datetime.now(timezone.utc).date()
@@ -1,15 +1,49 @@
+import csv
+import io
+import json
+from collections import defaultdict
+from collections.abc import AsyncIterator, Sequence
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 
-from src.core.exceptions import EntityNotFoundError, InsufficientFundsError
+from sqlalchemy import Row
+
+from src.core.exceptions import (
+    EntityNotFoundError,
+    InsufficientFundsError,
+    InvalidParameterError,
+)
+from src.core.pagination import decode_cursor, encode_cursor
+from src.core.periods import iter_periods, period_start, resolve_timezone
 
 from .base_service import BaseService
 from src.core.schemas.transaction import TransactionCreate, TransactionUpdate
 from src.models.domain.transaction import (
     Transaction as TransactionDomain,
+    TransactionAnalytics as TransactionAnalyticsDomain,
+    TransactionAnalyticsPoint as TransactionAnalyticsPointDomain,
+    TransactionBulkError as TransactionBulkErrorDomain,
+    TransactionBulkResult as TransactionBulkResultDomain,
+    TransactionPage as TransactionPageDomain,
     TransactionSummary as TransactionSummaryDomain,
 )
-from src.db.repositories import TransactionRepository, AccountRepository
-from src.models.enums import TransactionType
+from src.db import UnitOfWork
+from .summary_cache import CachedSummary, SummaryCache
+from src.db.repositories import (
+    TransactionRepository,
+    AccountRepository,
+    DailyTotalRepository,
+)
+from src.models.enums import AnalyticsBucket, ExportFormat, TransactionType
+
+EXPORT_COLUMNS = ["id", "created_at", "type", "amount", "account_id", "description"]
+
+# Periods covered when the request gives no start date.
+DEFAULT_ANALYTICS_PERIODS = {
+    AnalyticsBucket.DAY: 30,
+    AnalyticsBucket.WEEK: 12,
+    AnalyticsBucket.MONTH: 12,
+}
 
 
 class TransactionService(BaseService):
@@ -17,9 +51,15 @@ class TransactionService(BaseService):
         self,
         transaction_repository: TransactionRepository,
         account_repository: AccountRepository,
+        daily_total_repository: DailyTotalRepository,
+        uow: UnitOfWork,
+        summary_cache: SummaryCache,
     ):
         self.repo = transaction_repository
         self.account_repo = account_repository
+        self.daily_totals = daily_total_repository
+        self.uow = uow
+        self.summary_cache = summary_cache
 
     async def get(self, id: int) -> TransactionDomain:
         return self._require(
@@ -41,10 +81,129 @@ class TransactionService(BaseService):
         self,
         user_id: int,
         transaction_type: TransactionType,
-    ) -> list[TransactionDomain]:
-        return await self.repo.get_transactions(
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> TransactionPageDomain:
+        # Fetch one extra row to find out whether another page follows.
+        items = await self.repo.get_transactions(
             user_id=user_id,
             transaction_type=transaction_type,
+            after=decode_cursor(cursor) if cursor else None,
+            limit=limit + 1,
+        )
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        return TransactionPageDomain(items=items, next_cursor=next_cursor)
+
+    async def export_transactions(
+        self,
+        user_id: int,
+        export_format: ExportFormat,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        account_id: int | None = None,
+        fetch_size: int = 1000,
+    ) -> AsyncIterator[str]:
+        """Yield the user's ledger as CSV or NDJSON text, one batch at a time."""
+        if export_format == ExportFormat.CSV:
+            yield ",".join(EXPORT_COLUMNS) + "\r\n"
+
+        async for rows in self.repo.stream_transactions(
+            user_id=user_id,
+            date_from=date_from,
+            date_to=date_to,
+            account_id=account_id,
+            fetch_size=fetch_size,
+        ):
+            if export_format == ExportFormat.CSV:
+                yield self._format_csv(rows)
+            else:
+                yield self._format_ndjson(rows)
+
+    @staticmethod
+    def _export_values(row: Row) -> list:
+        return [
+            row.id,
+            row.created_at.isoformat(),
+            TransactionType(row.type).value,
+            str(row.amount),
+            row.account_id,
+            row.description,
+        ]
+
+    def _format_csv(self, rows: Sequence[Row]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(self._export_values(row) for row in rows)
+        return buffer.getvalue()
+
+    def _format_ndjson(self, rows: Sequence[Row]) -> str:
+        return "".join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, self._export_values(row)))) + "\n"
+            for row in rows
+        )
+
+    async def get_analytics(
+        self,
+        user_id: int,
+        bucket: AnalyticsBucket,
+        tz_name: str = "UTC",
+        date_from: date | None = None,
+        date_to: date | None = None,
+        account_id: int | None = None,
+        max_periods: int = 366,
+    ) -> TransactionAnalyticsDomain:
+        """
+        Return the user's incomes and expenses per local day, week or month.
+
+        Dates are local to `tz_name`; `date_to` is exclusive and defaults to
+        tomorrow, so the current period is included. Periods without
+        transactions are reported with zero totals.
+        """
+        tz = resolve_timezone(tz_name)
+        if date_to is None:
+            date_to = datetime.now(tz).date() + timedelta(days=1)
+        if date_from is None:
+            date_from = period_start(date_to - timedelta(days=1), bucket)
+            for _ in range(DEFAULT_ANALYTICS_PERIODS[bucket] - 1):
+                date_from = period_start(date_from - timedelta(days=1), bucket)
+        if date_from >= date_to:
+            raise InvalidParameterError("'from' must be earlier than 'to'")
+
+        periods = list(iter_periods(date_from, date_to, bucket))
+        if len(periods) > max_periods:
+            raise InvalidParameterError(
+                f"Range spans {len(periods)} periods, at most {max_periods} allowed"
+            )
+
+        rows = await self.repo.get_bucketed_totals(
+            user_id=user_id,
+            bucket=bucket,
+            start=datetime.combine(date_from, time(), tz),
+            end=datetime.combine(date_to, time(), tz),
+            tz=tz,
+            account_id=account_id,
+        )
+        series = {
+            period: TransactionAnalyticsPointDomain(period=period)
+            for period in periods
+        }
+        for row in rows:
+            point = series.get(row.period)
+            if point is None:
+                continue
+            if TransactionType(row.type) == TransactionType.INCOME:
+                point.incomes, point.income_count = row.total, row.count
+            else:
+                point.expenses, point.expense_count = row.total, row.count
+
+        return TransactionAnalyticsDomain(
+            bucket=bucket,
+            tz=tz.key,
+            date_from=date_from,
+            date_to=date_to,
+            series=list(series.values()),
         )
 
     async def add_transaction(
@@ -52,21 +211,107 @@ class TransactionService(BaseService):
         transaction_data: TransactionCreate,
         user_id: int,
     ) -> TransactionDomain:
-        balance = await self.account_repo.get_balance(transaction_data.account_id, user_id)
-        if balance is None:
-            raise EntityNotFoundError(f"Account with id {transaction_data.account_id} not found")
+        async with self.uow:
+            delta = self._balance_delta(transaction_data.type, transaction_data.amount)
+            balance = await self.account_repo.adjust_owned_balance(
+                transaction_data.account_id,
+                user_id,
+                delta,
+                check_funds=transaction_data.type == TransactionType.EXPENSE,
+            )
+            if balance is None:
+                await self._raise_balance_error(
+                    transaction_data.account_id, user_id, transaction_data.amount
+                )
 
-        if transaction_data.type == TransactionType.EXPENSE and balance < transaction_data.amount:
-            raise InsufficientFundsError(
-                f"Insufficient funds: balance {balance}, required {transaction_data.amount}"
+            created_at = datetime.now(timezone.utc)
+            result = await self.repo.create(
+                TransactionDomain(
+                    **transaction_data.model_dump(),
+                    user_id=user_id,
+                    created_at=created_at,
+                )
             )
+            await self.daily_totals.apply(
+                user_id,
+                transaction_data.account_id,
+                self.daily_totals.day_of(created_at),
+                transaction_data.type,
+                transaction_data.amount,
+                1,
+            )
+            self._touch_ledger(user_id)
+            return result
 
-        result = await self.repo.create(
-            TransactionDomain(**transaction_data.model_dump(), user_id=user_id)
-        )
-        delta = -transaction_data.amount if transaction_data.type == TransactionType.EXPENSE else transaction_data.amount
-        await self.account_repo.adjust_balance(transaction_data.account_id, delta)
-        return result
+    async def add_transactions(
+        self,
+        items: list[TransactionCreate],
+        user_id: int,
+    ) -> TransactionBulkResultDomain:
+        """
+        Create many transactions in a single DB transaction.
+
+        Items are applied in order against running balances. Items whose
+        account is missing or would be overdrawn are reported as errors;
+        the rest are inserted together, with one balance update overall.
+        """
+        async with self.uow:
+            balances = await self.account_repo.get_balances_for_update(
+                {item.account_id for item in items}, user_id
+            )
+            created_at = datetime.now(timezone.utc)
+            day = self.daily_totals.day_of(created_at)
+
+            accepted: list[TransactionDomain] = []
+            errors: list[TransactionBulkErrorDomain] = []
+            deltas: dict[int, Decimal] = defaultdict(Decimal)
+            rollup: dict[tuple[int, TransactionType], list] = defaultdict(
+                lambda: [Decimal(0), 0]
+            )
+            for index, item in enumerate(items):
+                balance = balances.get(item.account_id)
+                if balance is None:
+                    errors.append(
+                        TransactionBulkErrorDomain(
+                            index=index,
+                            detail=f"Account with id {item.account_id} not found",
+                        )
+                    )
+                    continue
+
+                if item.type == TransactionType.EXPENSE and balance < item.amount:
+                    errors.append(
+                        TransactionBulkErrorDomain(
+                            index=index,
+                            detail=f"Insufficient funds: balance {balance}, required {item.amount}",
+                        )
+                    )
+                    continue
+
+                delta = self._balance_delta(item.type, item.amount)
+                balances[item.account_id] = balance + delta
+                deltas[item.account_id] += delta
+                rollup[item.account_id, item.type][0] += item.amount
+                rollup[item.account_id, item.type][1] += 1
+                accepted.append(
+                    TransactionDomain(
+                        **item.model_dump(),
+                        user_id=user_id,
+                        created_at=created_at,
+                    )
+                )
+
+            created: list[TransactionDomain] = []
+            if accepted:
+                created = await self.repo.create_many(accepted)
+                await self.account_repo.adjust_balances(deltas)
+                for (account_id, transaction_type), (amount, count) in rollup.items():
+                    await self.daily_totals.apply(
+                        user_id, account_id, day, transaction_type, amount, count
+                    )
+                self._touch_ledger(user_id)
+
+            return TransactionBulkResultDomain(created=created, errors=errors)
 
     async def update_transaction(
         self,
@@ -74,65 +319,129 @@ class TransactionService(BaseService):
         transaction_data: TransactionUpdate,
         user_id: int,
     ) -> TransactionDomain:
-        old = await self.repo.get_transaction_by_user(transaction_id, user_id)
-        if not old:
-            raise EntityNotFoundError(f"Transaction with id {transaction_id} not found")
-
-        # Delta that reverses the old transaction's effect on its account
-        old_reverse: Decimal = old.amount if old.type == TransactionType.EXPENSE else -old.amount
-
-        if old.account_id != transaction_data.account_id:
-            # Account changed: verify new account ownership and check funds
-            new_balance = await self.account_repo.get_balance(transaction_data.account_id, user_id)
-            if new_balance is None:
-                raise EntityNotFoundError(f"Account with id {transaction_data.account_id} not found")
-
-            if transaction_data.type == TransactionType.EXPENSE and new_balance < transaction_data.amount:
-                raise InsufficientFundsError(
-                    f"Insufficient funds: balance {new_balance}, required {transaction_data.amount}"
-                )
+        async with self.uow:
+            old = await self.repo.get_transaction_by_user(
+                transaction_id, user_id, for_update=True
+            )
+            if not old:
+                raise EntityNotFoundError(f"Transaction with id {transaction_id} not found")
 
-            await self.account_repo.adjust_balance(old.account_id, old_reverse)
-            new_delta = -transaction_data.amount if transaction_data.type == TransactionType.EXPENSE else transaction_data.amount
-            await self.account_repo.adjust_balance(transaction_data.account_id, new_delta)
-        else:
-            # Same account: check balance after reverting old effect
-            current_balance = await self.account_repo.get_balance(old.account_id, user_id)
-            reverted_balance = current_balance + old_reverse
-
-            if transaction_data.type == TransactionType.EXPENSE and reverted_balance < transaction_data.amount:
-                raise InsufficientFundsError(
-                    f"Insufficient funds: balance {reverted_balance}, required {transaction_data.amount}"
+            # Delta that reverses the old transaction's effect on its account
+            old_reverse = -self._balance_delta(old.type, old.amount)
+            new_delta = self._balance_delta(transaction_data.type, transaction_data.amount)
+            check_funds = transaction_data.type == TransactionType.EXPENSE
+
+            if old.account_id != transaction_data.account_id:
+                # Account changed: charge the new account, then refund the old one
+                balance = await self.account_repo.adjust_owned_balance(
+                    transaction_data.account_id, user_id, new_delta, check_funds
+                )
+                if balance is None:
+                    await self._raise_balance_error(
+                        transaction_data.account_id, user_id, transaction_data.amount
+                    )
+                await self.account_repo.adjust_balance(old.account_id, old_reverse)
+            else:
+                # Same account: funds are checked against the reverted balance
+                balance = await self.account_repo.adjust_owned_balance(
+                    old.account_id, user_id, old_reverse + new_delta, check_funds
                 )
+                if balance is None:
+                    await self._raise_balance_error(
+                        old.account_id,
+                        user_id,
+                        transaction_data.amount,
+                        offset=old_reverse,
+                    )
 
-            new_delta = -transaction_data.amount if transaction_data.type == TransactionType.EXPENSE else transaction_data.amount
-            await self.account_repo.adjust_balance(old.account_id, old_reverse + new_delta)
+            day = self.daily_totals.day_of(old.created_at)
+            await self.daily_totals.apply(
+                user_id, old.account_id, day, old.type, -old.amount, -1
+            )
+            await self.daily_totals.apply(
+                user_id,
+                transaction_data.account_id,
+                day,
+                transaction_data.type,
+                transaction_data.amount,
+                1,
+            )
 
-        update_dict = transaction_data.model_dump(exclude_unset=True)
-        update_dict["user_id"] = user_id
-        return await self.repo.update(transaction_id, update_dict)
+            update_dict = transaction_data.model_dump(exclude_unset=True)
+            update_dict["user_id"] = user_id
+            self._touch_ledger(user_id)
+            return await self.repo.update(transaction_id, update_dict)
 
     async def delete_transaction(
         self,
         transaction_id: int,
         user_id: int,
     ) -> None:
-        old = await self.repo.get_transaction_by_user(transaction_id, user_id)
-        if not old:
-            raise EntityNotFoundError(f"Transaction with id {transaction_id} not found")
+        async with self.uow:
+            old = await self.repo.get_transaction_by_user(
+                transaction_id, user_id, for_update=True
+            )
+            if not old:
+                raise EntityNotFoundError(f"Transaction with id {transaction_id} not found")
 
-        reverse: Decimal = old.amount if old.type == TransactionType.EXPENSE else -old.amount
-        await self.repo.delete(transaction_id)
-        await self.account_repo.adjust_balance(old.account_id, reverse)
+            await self.repo.delete(transaction_id)
+            await self.account_repo.adjust_balance(
+                old.account_id, -self._balance_delta(old.type, old.amount)
+            )
+            await self.daily_totals.apply(
+                user_id,
+                old.account_id,
+                self.daily_totals.day_of(old.created_at),
+                old.type,
+                -old.amount,
+                -1,
+            )
+            self._touch_ledger(user_id)
 
-    async def get_summary(
+    def _touch_ledger(self, user_id: int) -> None:
+        """Invalidate the user's dashboard summary once this write commits."""
+        self.uow.on_commit(lambda: self.summary_cache.bump(user_id))
+
+    @staticmethod
+    def _balance_delta(transaction_type: TransactionType, amount: Decimal) -> Decimal:
+        """Return the signed change a transaction makes to its account balance."""
+        return -amount if transaction_type == TransactionType.EXPENSE else amount
+
+    async def _raise_balance_error(
         self,
+        account_id: int,
         user_id: int,
-    ) -> TransactionSummaryDomain:
-        incomes, expenses = await self.repo.get_incomes_and_expenses(user_id)
+        amount: Decimal,
+        offset: Decimal = Decimal(0),
+    ) -> None:
+        """Explain why a conditional balance update matched no account."""
+        balance = await self.account_repo.get_balance(account_id, user_id)
+        if balance is None:
+            raise EntityNotFoundError(f"Account with id {account_id} not found")
+        raise InsufficientFundsError(
+            f"Insufficient funds: balance {balance + offset}, required {amount}"
+        )
+
+    def get_cached_summary(self, user_id: int) -> CachedSummary | None:
+        """Return the user's summary if it is cached and current, without querying."""
+        return self.summary_cache.get(user_id)
+
+    async def get_summary_entry(self, user_id: int) -> CachedSummary:
+        if (entry := self.summary_cache.get(user_id)) is not None:
+            return entry
+
+        version = self.summary_cache.version(user_id)
+        incomes, expenses = await self.daily_totals.get_incomes_and_expenses(user_id)
         balance = await self.account_repo.get_overall_balance(user_id)
-        return TransactionSummaryDomain(
+        summary = TransactionSummaryDomain(
             total_balance=balance,
             total_incomes=incomes,
             total_expenses=expenses,
         )
+        return self.summary_cache.set(user_id, version, summary)
+
+    async def get_summary(
+        self,
+        user_id: int,
+    ) -> TransactionSummaryDomain:
+        return (await self.get_summary_entry(user_id)).summary
@@ -1,15 +1,41 @@
-from src.core.exceptions import EntityAlreadyExistsError
+from src.core.exceptions import (
+    EntityAlreadyExistsError,
+    EntityNotFoundError,
+    InvalidCredentialsError,
+)
 
 from .base_service import BaseService
 from src.core.schemas.user import UserCreate
 from src.models.domain.user import User as UserDomain
-from src.db.repositories import UserRepository
-from src.core.auth_config import get_password_hash
+from src.db.repositories import (
+    AccountRepository,
+    DailyTotalRepository,
+    TransactionRepository,
+    UserRepository,
+)
+from src.core.hashing import PasswordHasher
+from src.core.token_cache import TokenCache
+from src.db import UnitOfWork
 
 
 class UserService(BaseService):
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        password_hasher: PasswordHasher,
+        uow: UnitOfWork,
+        token_cache: TokenCache,
+        account_repository: AccountRepository,
+        transaction_repository: TransactionRepository,
+        daily_total_repository: DailyTotalRepository,
+    ):
         self.repo = user_repository
+        self.password_hasher = password_hasher
+        self.uow = uow
+        self.token_cache = token_cache
+        self.accounts = account_repository
+        self.transactions = transaction_repository
+        self.daily_totals = daily_total_repository
 
     async def get_by_id(self, id: int) -> UserDomain:
         return self._require(await self.repo.get(id), f"User with id {id} not found")
@@ -32,6 +58,59 @@ class UserService(BaseService):
             last_name=user_data.last_name,
             username=user_data.username,
             email=user_data.email,
-            hashed_password=get_password_hash(user_data.password),
+            hashed_password=await self.password_hasher.hash(user_data.password),
         )
-        return await self.repo.create(new_user)
+        async with self.uow:
+            return await self.repo.create(new_user)
+
+    async def change_password(
+        self,
+        user_id: int,
+        current_password: str,
+        new_password: str,
+    ) -> UserDomain:
+        user = await self.get_by_id(user_id)
+        if not await self.password_hasher.verify(
+            current_password, user.hashed_password
+        ):
+            raise InvalidCredentialsError("Current password is incorrect")
+
+        hashed_password = await self.password_hasher.hash(new_password)
+        async with self.uow:
+            user = await self.repo.update_password(user_id, hashed_password)
+            self._on_user_changed(user_id)
+        return user
+
+    async def deactivate(self, user_id: int) -> UserDomain:
+        async with self.uow:
+            user = self._require(
+                await self.repo.deactivate_user(user_id),
+                f"User with id {user_id} not found",
+            )
+            self._on_user_changed(user_id)
+        return user
+
+    async def delete(self, user_id: int) -> None:
+        """
+        Delete the user along with everything they own. Their daily totals,
+        transactions and accounts reference them without ON DELETE CASCADE,
+        so they are deleted first, in the same unit of work.
+        """
+        async with self.uow:
+            await self.daily_totals.delete_for_user(user_id)
+            await self.transactions.delete_for_user(user_id)
+            await self.accounts.delete_for_user(user_id)
+            if not await self.repo.delete(user_id):
+                raise EntityNotFoundError(f"User with id {user_id} not found")
+            self._on_user_changed(user_id)
+
+    def _on_user_changed(self, user_id: int) -> None:
+        """
+        The repository already dropped the cached user when it wrote, but a
+        concurrent request may cache the old row again before this unit of
+        work commits; drop it once more after the commit. The user's cached
+        tokens are dropped too, so their next use is verified again and
+        meets the new state of the user.
+        """
+        self.uow.on_commit(lambda: self.repo.invalidate(user_id))
+        self.uow.on_commit(lambda: self.token_cache.revoke_subject(str(user_id)))
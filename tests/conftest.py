@@ -0,0 +1,146 @@
+"""
+Test fixtures: the app booted in-process against a throwaway SQLite file.
+
+Settings are read when `src.core.config` is first imported, so the
+environment is set up here, before any test module imports the app.
+
+Tests that need Postgres use the `postgres` fixture and are skipped unless
+TEST_POSTGRES_URL names a throwaway database; its public schema is
+dropped at the start of every such test.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import httpx
+import pytest
+
+_DB_DIR = tempfile.mkdtemp(prefix="expense-tracker-tests-")
+os.environ.update(
+    DB_URL=f"sqlite+aiosqlite:///{_DB_DIR}/test.db",
+    DB_REPLICA_URL="",
+    SECRET_KEY="test-secret-key",
+    JWT_SECRET="test-jwt-secret",
+    DEBUG="False",
+    JOBS_ENABLED="True",
+    JOBS_POLL_INTERVAL="0.1",
+)
+
+PASSWORD = "test-password"
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def migrate(engine, command: str, revision: str) -> None:
+    """Run `alembic <command> <revision>` against the engine's database."""
+    url = engine.url.render_as_string(hide_password=False)
+    subprocess.run(
+        [sys.executable, "-m", "alembic", command, revision],
+        cwd=ROOT,
+        env=os.environ | {"DB_URL": url},
+        check=True,
+        capture_output=True,
+    )
+
+
+async def query_budget(
+    client, max_queries: int, method: str, url: str, **kwargs
+) -> httpx.Response:
+    """Send a request; fail if it issues more than max_queries statements."""
+    from src.db import query_budget
+
+    with query_budget(max_queries, f"{method} {url}"):
+        response = await client.request(method, url, **kwargs)
+    assert response.status_code < 400, response.text
+    return response
+
+
+async def make_superuser(app, username: str = "tester") -> None:
+    from src.db import UnitOfWork
+    from src.db.repositories import UserRepository
+
+    async with app.state.dishka_container() as container:
+        uow = await container.get(UnitOfWork)
+        repo = await container.get(UserRepository)
+        async with uow:
+            user = await repo.get_by_username(username)
+            await repo.update(user.id, {"is_superuser": True})
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def app():
+    """main:app with its lifespan running, on a freshly created schema."""
+    import main
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from src.db.models import Base
+
+    async with main.app.router.lifespan_context(main.app):
+        engine = await main.app.state.dishka_container.get(AsyncEngine)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        yield main.app
+
+
+@pytest.fixture
+async def postgres():
+    """An engine on TEST_POSTGRES_URL, with an empty public schema."""
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    from sqlalchemy import text
+
+    from src.core.config import settings
+    from src.db import create_engine
+
+    engine = create_engine(settings, db_url=url)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(app):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def login(
+    client, username: str, password: str = PASSWORD, register: bool = False
+) -> dict[str, str]:
+    """Log in a user, registering them first if asked; return their auth header."""
+    if register:
+        response = await client.post(
+            "/api/v1/users/auth/register",
+            json={
+                "first_name": "Test",
+                "last_name": "User",
+                "username": username,
+                "email": f"{username}@example.com",
+                "password": password,
+            },
+        )
+        assert response.status_code == 201, response.text
+    response = await client.post(
+        "/api/v1/users/auth/login",
+        json={"username": username, "password": password},
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+async def headers(client) -> dict[str, str]:
+    """Register and log in the user "tester"; return their auth header."""
+    return await login(client, "tester", register=True)
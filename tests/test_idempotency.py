@@ -0,0 +1,62 @@
+import pytest
+
+from tests.conftest import login
+
+pytestmark = pytest.mark.anyio
+
+ACCOUNTS = "/api/v1/accounts/"
+ACCOUNT = {
+    "name": "Account",
+    "number": "1",
+    "holder": "Test User",
+    "value": "100",
+    "type": "debit",
+}
+
+
+async def test_retry_with_a_new_token_replays(client, headers):
+    first = await client.post(
+        ACCOUNTS, headers=headers | {"Idempotency-Key": "k1"}, json=ACCOUNT
+    )
+    assert first.status_code == 201, first.text
+    new_headers = await login(client, "tester")
+    assert new_headers != headers
+
+    retry = await client.post(
+        ACCOUNTS, headers=new_headers | {"Idempotency-Key": "k1"}, json=ACCOUNT
+    )
+
+    assert retry.status_code == 201
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert retry.json() == first.json()
+
+
+async def test_keys_are_not_shared_between_users(client, headers):
+    other = await login(client, "other", register=True)
+    first = await client.post(
+        ACCOUNTS, headers=headers | {"Idempotency-Key": "k1"}, json=ACCOUNT
+    )
+
+    response = await client.post(
+        ACCOUNTS, headers=other | {"Idempotency-Key": "k1"}, json=ACCOUNT
+    )
+
+    assert response.status_code == 201, response.text
+    assert "idempotent-replayed" not in response.headers
+    assert response.json()["id"] != first.json()["id"]
+
+
+async def test_invalid_token_is_rejected_and_not_stored(client, headers):
+    response = await client.post(
+        ACCOUNTS,
+        headers={"Authorization": "Bearer nope", "Idempotency-Key": "k1"},
+        json=ACCOUNT,
+    )
+    assert response.status_code == 401
+
+    response = await client.post(
+        ACCOUNTS, headers=headers | {"Idempotency-Key": "k1"}, json=ACCOUNT
+    )
+
+    assert response.status_code == 201, response.text
+    assert "idempotent-replayed" not in response.headers
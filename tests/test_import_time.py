@@ -0,0 +1,73 @@
+"""
+Cold-start budget: each target is imported in a fresh interpreter under
+`python -X importtime`. No import may load the modules deferred until
+first use.
+
+Wall-clock time depends on the machine and its load, so the time budgets
+are only checked when IMPORT_BUDGET_SCALE is set (`just import-budget`
+sets it to 1); the budgets are multiplied by it. The best of a few runs
+must fit its budget.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tests.conftest import ROOT
+
+RUNS = 5
+BUDGET_SCALE = os.environ.get("IMPORT_BUDGET_SCALE")
+
+# Cumulative import time budget in milliseconds, and modules the import
+# must leave unloaded
+BUDGETS = {
+    # What a worker process loads before it can start serving
+    "main": (1000, ("uvicorn", "authx", "jwt", "pwdlib", "argon2")),
+    # What migrations/env.py loads
+    "src.db.models": (600, ("fastapi", "dishka", "authx", "pwdlib", "argon2")),
+}
+
+
+def import_once(module: str) -> tuple[float, set[str]]:
+    """Import module in a new interpreter; return milliseconds and modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    total_us = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if cumulative.strip().isdigit():
+            loaded.add(name)
+            if name == module:
+                total_us = int(cumulative)
+    assert total_us is not None, f"{module} is missing from -X importtime"
+    return total_us / 1000, loaded
+
+
+@pytest.mark.parametrize("module", BUDGETS)
+def test_import_defers_modules_until_first_use(module):
+    _, deferred = BUDGETS[module]
+
+    _, loaded = import_once(module)
+
+    assert sorted(name for name in deferred if name in loaded) == []
+
+
+@pytest.mark.skipif(BUDGET_SCALE is None, reason="IMPORT_BUDGET_SCALE is not set")
+@pytest.mark.parametrize("module", BUDGETS)
+def test_import_time_within_budget(module):
+    budget_ms, _ = BUDGETS[module]
+
+    timings = sorted(import_once(module)[0] for _ in range(RUNS))
+
+    assert timings[0] <= budget_ms * float(BUDGET_SCALE), timings
@@ -0,0 +1,300 @@
+"""
+The repositories' read queries are served by indexes.
+
+Each scenario runs a repository call, EXPLAINs every statement it sent
+with the same parameters, and checks that no table is scanned in full
+and that the expected indexes are used. The keyset ledger queries must
+also be read in (created_at DESC, id DESC) order from their index,
+without a sort.
+
+Runs on SQLite, and on Postgres when TEST_POSTGRES_URL is set. On
+Postgres, sequential scans are disabled for the EXPLAIN so that the
+plan does not depend on the size of the table.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from tests.conftest import migrate
+
+pytestmark = pytest.mark.anyio
+
+# Postgres gives its copies on each partition a name ending in the
+# indexed columns (transactions_2026_10_user_id_created_at_id_idx).
+BY_USER = ("ix_transactions_user_id_created_at", "_user_id_created_at_id_idx")
+BY_USER_TYPE = (
+    "ix_transactions_user_id_type_created_at",
+    "_user_id_type_created_at_id_idx",
+)
+BY_ACCOUNT = (
+    "ix_transactions_account_id_created_at",
+    "_account_id_created_at_id_idx",
+)
+# The Postgres and SQLite names of the index behind each key
+ACCOUNT_ID = ("accounts_pkey", "USING INTEGER PRIMARY KEY")
+ACCOUNTS_BY_USER = ("uq_user_account_number", "sqlite_autoindex_accounts_1")
+DAILY_TOTALS_BY_USER = ("daily_totals_pkey", "sqlite_autoindex_daily_totals_1")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    call: Callable[[Any, "Seed"], Any]
+    # Each entry holds alternative names for one index that must be used
+    indexes: tuple[tuple[str, ...], ...]
+    # The last statement must read its rows in keyset order from an index
+    ordered: bool = False
+    # ...but the merged per-account rows of the latest-transactions query
+    # may be sorted; only the per-account lookups must avoid a sort.
+    outer_sort_allowed: bool = False
+
+
+@dataclass(frozen=True)
+class Seed:
+    user_id: int
+    account_id: int
+    after: tuple[datetime, int]
+
+
+def _transactions(session):
+    from src.db.repositories import TransactionRepository
+
+    return TransactionRepository(session)
+
+
+def _accounts(session):
+    from src.db.repositories import AccountRepository
+
+    return AccountRepository(session)
+
+
+def _daily_totals(session):
+    from src.db.repositories import DailyTotalRepository
+
+    return DailyTotalRepository(session)
+
+
+def _expenses():
+    from src.models.enums import TransactionType
+
+    return TransactionType.EXPENSE
+
+
+def _bucketed_totals(session, seed: Seed):
+    from src.models.enums import AnalyticsBucket
+
+    end = datetime.now(timezone.utc)
+    return _transactions(session).get_bucketed_totals(
+        seed.user_id,
+        AnalyticsBucket.DAY,
+        start=end - timedelta(days=30),
+        end=end,
+        tz=ZoneInfo("UTC"),
+    )
+
+
+SCENARIOS = (
+    Scenario(
+        "list_first_page",
+        lambda s, seed: _transactions(s).get_transactions(seed.user_id),
+        (BY_USER,),
+        ordered=True,
+    ),
+    Scenario(
+        "list_deep_page",
+        lambda s, seed: _transactions(s).get_transactions(
+            seed.user_id, after=seed.after
+        ),
+        (BY_USER,),
+        ordered=True,
+    ),
+    Scenario(
+        "list_by_type_first_page",
+        lambda s, seed: _transactions(s).get_transactions(seed.user_id, _expenses()),
+        (BY_USER_TYPE,),
+        ordered=True,
+    ),
+    Scenario(
+        "list_by_type_deep_page",
+        lambda s, seed: _transactions(s).get_transactions(
+            seed.user_id, _expenses(), after=seed.after
+        ),
+        (BY_USER_TYPE,),
+        ordered=True,
+    ),
+    Scenario(
+        "accounts_latest_transactions",
+        lambda s, seed: _accounts(s).get_accounts(seed.user_id),
+        (ACCOUNTS_BY_USER, BY_ACCOUNT),
+        ordered=True,
+        outer_sort_allowed=True,
+    ),
+    Scenario(
+        "get_account",
+        lambda s, seed: _accounts(s).get_account(seed.account_id, seed.user_id),
+        (ACCOUNT_ID, BY_ACCOUNT),
+        ordered=True,
+        outer_sort_allowed=True,
+    ),
+    Scenario(
+        "dashboard_incomes_and_expenses",
+        lambda s, seed: _daily_totals(s).get_incomes_and_expenses(seed.user_id),
+        (DAILY_TOTALS_BY_USER,),
+    ),
+    Scenario(
+        "dashboard_overall_balance",
+        lambda s, seed: _accounts(s).get_overall_balance(seed.user_id),
+        (ACCOUNTS_BY_USER,),
+    ),
+    Scenario("analytics_bucketed_totals", _bucketed_totals, (BY_USER,)),
+)
+
+
+async def seed(sessionmaker) -> Seed:
+    """
+    Insert a user with one account and a few transactions, and roll them
+    up; the keyset position is that of the oldest transaction.
+    """
+    from sqlalchemy import insert, select
+
+    from src.db.models import Account, Transaction, User
+    from src.models.enums import AccountType, TransactionType
+
+    async with sessionmaker() as session:
+        user_id = await session.scalar(
+            insert(User)
+            .values(
+                first_name="Test",
+                last_name="User",
+                username="tester",
+                email="tester@example.com",
+                hashed_password="-",
+            )
+            .returning(User.id)
+        )
+        account_id = await session.scalar(
+            insert(Account)
+            .values(
+                name="Account",
+                number="1",
+                holder="Test User",
+                value=Decimal(1000),
+                type=AccountType.DEBIT,
+                user_id=user_id,
+            )
+            .returning(Account.id)
+        )
+        await session.execute(
+            insert(Transaction),
+            [
+                {
+                    "amount": Decimal(1),
+                    "type": TransactionType.EXPENSE,
+                    "account_id": account_id,
+                    "user_id": user_id,
+                }
+                for _ in range(10)
+            ],
+        )
+        oldest = (
+            await session.execute(
+                select(Transaction.created_at, Transaction.id)
+                .order_by(Transaction.id)
+                .limit(1)
+            )
+        ).one()
+        await _daily_totals(session).rebuild()
+        await session.commit()
+    return Seed(user_id, account_id, tuple(oldest))
+
+
+async def capture(engine, sessionmaker, scenario: Scenario, seed: Seed) -> list:
+    """Run the scenario's repository call; return the statements it sent."""
+    from sqlalchemy import event
+
+    captured = []
+
+    def listener(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        async with sessionmaker() as session:
+            await scenario.call(session, seed)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+    return captured
+
+
+async def explain(engine, statement: str, parameters) -> list[str]:
+    async with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            await conn.exec_driver_sql("SET LOCAL enable_bitmapscan = off")
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (COSTS OFF) {statement}", parameters
+            )
+            return [row[0] for row in result]
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        # Keep the parent id: top-level nodes have parent 0
+        return [f"{row[1]}:{row[3]}" for row in result]
+
+
+def full_scans(plan: list[str]) -> list[str]:
+    return [
+        line for line in plan if "Seq Scan" in line or re.search(r"\bSCAN \w+$", line)
+    ]
+
+
+def sorts(plan: list[str], outer_sort_allowed: bool) -> list[str]:
+    """Sort nodes in the plan, leaving out the top-level one if allowed."""
+    found = [
+        line
+        for line in plan
+        if re.fullmatch(r"\s*(->\s+)?(Incremental )?Sort", line)
+        or "TEMP B-TREE" in line
+    ]
+    if outer_sort_allowed:
+        # Postgres indents child nodes; SQLite's top-level nodes have parent 0
+        found = [
+            line
+            for line in found
+            if line[0].isspace() or (line[0].isdigit() and not line.startswith("0:"))
+        ]
+    return found
+
+
+async def check(engine, scenario: Scenario) -> None:
+    from src.db import create_sessionmaker
+
+    sessionmaker = create_sessionmaker(engine)
+    statements = await capture(engine, sessionmaker, scenario, await seed(sessionmaker))
+    plans = [await explain(engine, *statement) for statement in statements]
+    lines = [line for plan in plans for line in plan]
+
+    assert full_scans(lines) == [], lines
+    for names in scenario.indexes:
+        assert any(name in line for name in names for line in lines), (names, lines)
+    if scenario.ordered:
+        assert sorts(plans[-1], scenario.outer_sort_allowed) == [], plans[-1]
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda scenario: scenario.name)
+async def test_sqlite_query_is_served_by_its_indexes(app, scenario):
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    await check(await app.state.dishka_container.get(AsyncEngine), scenario)
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda scenario: scenario.name)
+async def test_postgres_query_is_served_by_its_indexes(postgres, scenario):
+    migrate(postgres, "upgrade", "head")
+    await check(postgres, scenario)
@@ -0,0 +1,160 @@
+import asyncio
+import time
+
+import pytest
+
+from tests.conftest import make_superuser
+
+pytestmark = pytest.mark.anyio
+
+JOBS = "/api/v1/jobs"
+
+
+async def wait_for_job(client, headers, job_id, predicate, timeout=5.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        response = await client.get(f"{JOBS}/{job_id}", headers=headers)
+        assert response.status_code == 200, response.text
+        job = response.json()
+        if predicate(job):
+            return job
+        assert time.monotonic() < deadline, f"timed out waiting on {job}"
+        await asyncio.sleep(0.02)
+
+
+async def test_enqueue_requires_superuser(client, headers):
+
+    response = await client.post(
+        f"{JOBS}/", headers=headers, json={"kind": "balance_reconcile"}
+    )
+
+    assert response.status_code == 403
+
+
+async def test_enqueue_rejects_unknown_kind(app, client, headers):
+    await make_superuser(app)
+
+    response = await client.post(f"{JOBS}/", headers=headers, json={"kind": "nope"})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"chunk_size": 0}, {"chunk_size": "many"}, {"repiar": True}],
+)
+async def test_enqueue_rejects_invalid_params(app, client, headers, params):
+    await make_superuser(app)
+
+    response = await client.post(
+        f"{JOBS}/",
+        headers=headers,
+        json={"kind": "balance_reconcile", "params": params},
+    )
+
+    assert response.status_code == 400, response.text
+
+
+async def test_rebuild_job_invalidates_cached_dashboards(app, client, headers):
+    await make_superuser(app)
+    response = await client.post(
+        "/api/v1/accounts/",
+        headers=headers,
+        json={
+            "name": "Account",
+            "number": "1",
+            "holder": "Test User",
+            "value": "100",
+            "type": "debit",
+        },
+    )
+    assert response.status_code == 201, response.text
+    dashboard = await client.get("/api/v1/transactions/dashboard", headers=headers)
+    assert dashboard.status_code == 200, dashboard.text
+
+    response = await client.post(
+        f"{JOBS}/", headers=headers, json={"kind": "daily_totals_rebuild"}
+    )
+    assert response.status_code == 202, response.text
+    await wait_for_job(
+        client, headers, response.json()["id"], lambda j: j["status"] == "succeeded"
+    )
+
+    response = await client.get("/api/v1/transactions/dashboard", headers=headers)
+    assert response.headers["X-Cache"] == "MISS"
+    assert response.headers["ETag"] != dashboard.headers["ETag"]
+
+
+async def test_reconcile_job_reports_progress_until_it_succeeds(app, client, headers):
+    await make_superuser(app)
+    for number in range(3):
+        response = await client.post(
+            "/api/v1/accounts/",
+            headers=headers,
+            json={
+                "name": "Account",
+                "number": str(number),
+                "holder": "Test User",
+                "value": "100",
+                "type": "debit",
+            },
+        )
+        assert response.status_code == 201, response.text
+
+    response = await client.post(
+        f"{JOBS}/",
+        headers=headers,
+        json={"kind": "balance_reconcile", "params": {"chunk_size": 1}},
+    )
+    assert response.status_code == 202, response.text
+    assert response.json()["status"] == "pending"
+
+    job = await wait_for_job(
+        client, headers, response.json()["id"], lambda j: j["status"] == "succeeded"
+    )
+    assert job["progress_done"] == job["progress_total"] == 3
+    assert job["result"]["accounts_checked"] == 3
+    assert job["result"]["drifted_accounts"] == 0
+    assert job["finished_at"] is not None
+
+
+async def test_running_job_can_be_cancelled(app, client, headers):
+    from src.core.jobs import JobRunner
+    from src.models.enums import JobKind
+
+    steps = 1000
+
+    async def slow_rebuild(ctx):
+        for done in range(steps):
+            await ctx.report(done, steps)
+            await asyncio.sleep(0.01)
+        return {"buckets": steps}
+
+    runner = await app.state.dishka_container.get(JobRunner)
+    runner.register(JobKind.DAILY_TOTALS_REBUILD, slow_rebuild)
+    await make_superuser(app)
+
+    response = await client.post(
+        f"{JOBS}/", headers=headers, json={"kind": "daily_totals_rebuild"}
+    )
+    assert response.status_code == 202, response.text
+    job_id = response.json()["id"]
+
+    job = await wait_for_job(
+        client,
+        headers,
+        job_id,
+        lambda j: j["status"] == "running" and j["progress_done"] > 0,
+    )
+    assert job["progress_total"] == steps
+
+    response = await client.post(f"{JOBS}/{job_id}/cancel", headers=headers)
+    assert response.status_code == 202, response.text
+    assert response.json()["cancel_requested"] is True
+
+    job = await wait_for_job(
+        client, headers, job_id, lambda j: j["status"] == "cancelled"
+    )
+    assert job["progress_done"] < steps
+    assert job["result"] is None
+    assert job["finished_at"] is not None
@@ -0,0 +1,30 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_request_latency_is_labelled_with_the_route_template(client, headers):
+    response = await client.post(
+        "/api/v1/accounts/",
+        headers=headers,
+        json={
+            "name": "Account",
+            "number": "1",
+            "holder": "Test User",
+            "value": "100",
+            "type": "debit",
+        },
+    )
+    assert response.status_code == 201, response.text
+    response = await client.get(
+        f"/api/v1/accounts/{response.json()['id']}", headers=headers
+    )
+    assert response.status_code == 200, response.text
+    await client.get("/nowhere")
+
+    metrics = (await client.get("/metrics")).text
+
+    assert 'route="/api/v1/accounts/{account_id}"' in metrics
+    assert 'route="/api/v1/accounts/"' in metrics
+    assert 'route="<unmatched>"' in metrics
+    assert "/api/v1/accounts/1" not in metrics
@@ -0,0 +1,244 @@
+"""Postgres only: the monthly partitioning of the transactions table."""
+
+import re
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from tests.conftest import migrate
+
+pytestmark = pytest.mark.anyio
+
+BEFORE_PARTITIONING = "5d2f7c9e1a83"
+PARTITION_PATTERN = re.compile(r"\btransactions_\d{4}_\d{2}\b")
+
+
+def months(start: date, end: date) -> list[str]:
+    """Partition names for every month from start to end, inclusive."""
+    names = []
+    month = start.replace(day=1)
+    while month <= end:
+        names.append(f"transactions_{month:%Y_%m}")
+        month = (month + timedelta(days=32)).replace(day=1)
+    return names
+
+
+async def seed(engine, days: int) -> tuple[int, int, datetime]:
+    """
+    Insert a user with one account and one 1.00 expense a day for the last
+    `days` days; return the user id, the account id and the oldest row's
+    created_at.
+    """
+    from sqlalchemy import insert
+
+    from src.db import create_sessionmaker
+    from src.db.models import Account, Transaction, User
+    from src.models.enums import TransactionType
+
+    now = datetime.now(timezone.utc)
+    async with create_sessionmaker(engine)() as session:
+        user_id = await session.scalar(
+            insert(User)
+            .values(
+                first_name="Test",
+                last_name="User",
+                username="tester",
+                email="tester@example.com",
+                hashed_password="-",
+            )
+            .returning(User.id)
+        )
+        account_id = await session.scalar(
+            insert(Account)
+            .values(
+                name="Account",
+                number="1",
+                holder="Test User",
+                value=Decimal(1000 - days),
+                initial_value=Decimal(1000),
+                user_id=user_id,
+            )
+            .returning(Account.id)
+        )
+        await session.execute(
+            insert(Transaction),
+            [
+                {
+                    "amount": Decimal(1),
+                    "type": TransactionType.EXPENSE,
+                    "account_id": account_id,
+                    "user_id": user_id,
+                    "created_at": now - timedelta(days=day),
+                }
+                for day in range(days)
+            ],
+        )
+        await session.commit()
+    return user_id, account_id, now - timedelta(days=days - 1)
+
+
+async def create_partitions(engine, since: datetime) -> None:
+    """Create the partitions from the month of `since` onwards."""
+    from sqlalchemy import text
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("SELECT create_transaction_partitions(:since, 3)"),
+            {"since": since.date()},
+        )
+
+
+async def catalog(engine) -> dict:
+    from sqlalchemy import text
+
+    async with engine.connect() as conn:
+        return {
+            "kind": await conn.scalar(
+                text(
+                    "SELECT relkind::text FROM pg_class "
+                    "WHERE oid = 'transactions'::regclass"
+                )
+            ),
+            "rows": await conn.scalar(text("SELECT count(*) FROM transactions")),
+            "constraints": sorted(
+                await conn.scalars(
+                    text(
+                        "SELECT conname FROM pg_constraint "
+                        "WHERE conrelid = 'transactions'::regclass"
+                    )
+                )
+            ),
+        }
+
+
+async def test_partitioning_migration_round_trip(postgres):
+    from src.db.partitions import list_transaction_partitions
+
+    migrate(postgres, "upgrade", BEFORE_PARTITIONING)
+    _, _, oldest = await seed(postgres, days=400)
+    constraints = [
+        "transactions_account_id_fkey",
+        "transactions_pkey",
+        "transactions_user_id_fkey",
+    ]
+    assert await catalog(postgres) == {
+        "kind": "r",
+        "rows": 400,
+        "constraints": constraints,
+    }
+
+    migrate(postgres, "upgrade", "head")
+
+    assert await catalog(postgres) == {
+        "kind": "p",
+        "rows": 400,
+        "constraints": constraints,
+    }
+    partitions = await list_transaction_partitions(postgres)
+    assert list(partitions) == months(oldest.date(), max(partitions.values()))
+
+    migrate(postgres, "downgrade", BEFORE_PARTITIONING)
+
+    assert await catalog(postgres) == {
+        "kind": "r",
+        "rows": 400,
+        "constraints": constraints,
+    }
+    migrate(postgres, "upgrade", "head")
+
+
+async def test_windowed_query_scans_only_its_partitions(postgres):
+    from sqlalchemy import event
+
+    from src.db import create_sessionmaker
+    from src.db.repositories import TransactionRepository
+    from src.models.enums import AnalyticsBucket
+
+    migrate(postgres, "upgrade", "head")
+    await create_partitions(postgres, datetime.now(timezone.utc) - timedelta(days=120))
+    user_id, _, _ = await seed(postgres, days=120)
+    end = datetime.now(timezone.utc)
+    start = end - timedelta(days=30)
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(postgres.sync_engine, "before_cursor_execute", capture)
+    try:
+        async with create_sessionmaker(postgres)() as session:
+            rows = await TransactionRepository(session).get_bucketed_totals(
+                user_id=user_id,
+                bucket=AnalyticsBucket.DAY,
+                start=start,
+                end=end,
+                tz=ZoneInfo("UTC"),
+            )
+    finally:
+        event.remove(postgres.sync_engine, "before_cursor_execute", capture)
+    assert sum(row.count for row in rows) == 30
+    statement, parameters = captured[-1]
+    async with postgres.connect() as conn:
+        plan = [
+            row[0]
+            for row in await conn.exec_driver_sql(
+                f"EXPLAIN (COSTS OFF) {statement}", parameters
+            )
+        ]
+
+    scanned = sorted(
+        {name for line in plan for name in PARTITION_PATTERN.findall(line)}
+    )
+    assert scanned == months(start.date(), end.date()), plan
+
+
+async def test_detach_keeps_balances_and_rollup(postgres):
+    from sqlalchemy import func, insert, select, update
+
+    from src.db import create_sessionmaker
+    from src.db.models import Account, DailyTotal, Transaction
+    from src.db.partitions import (
+        detach_transaction_partitions,
+        list_transaction_partitions,
+    )
+    from src.db.repositories import AccountRepository, DailyTotalRepository
+    from src.models.enums import TransactionType
+
+    migrate(postgres, "upgrade", "head")
+    await create_partitions(postgres, datetime.now(timezone.utc) - timedelta(days=120))
+    user_id, account_id, oldest = await seed(postgres, days=120)
+    sessionmaker = create_sessionmaker(postgres)
+    async with sessionmaker() as session:
+        await session.execute(
+            insert(Transaction).values(
+                amount=Decimal(5),
+                type=TransactionType.INCOME,
+                account_id=account_id,
+                user_id=user_id,
+                created_at=oldest,
+            )
+        )
+        await session.execute(update(Account).values(value=Account.value + 5))
+        await DailyTotalRepository(session).rebuild()
+        await session.commit()
+    before = (datetime.now(timezone.utc) - timedelta(days=40)).date()
+
+    detached = await detach_transaction_partitions(postgres, before)
+
+    assert detached == months(oldest.date(), before)[:-1]
+    assert (
+        min(await list_transaction_partitions(postgres))
+        == f"transactions_{before:%Y_%m}"
+    )
+    async with sessionmaker() as session:
+        kept = await session.scalar(select(func.count()).select_from(Transaction))
+        [account] = await AccountRepository(session).get_expected_balances(0, 10)
+        assert account.expected == account.value == Decimal(1000 - 120 + 5)
+        assert kept < 120
+
+        assert await DailyTotalRepository(session).rebuild() > 0
+        assert await DailyTotalRepository(session).verify() == []
+        rolled_up = await session.scalar(select(func.sum(DailyTotal.count)))
+        assert rolled_up == 121
@@ -0,0 +1,106 @@
+"""
+Each v1 endpoint stays within the same SQL query budget for a user with
+one account as for one with fifty, which catches N+1 patterns such as
+lazy-loading each account's transactions.
+"""
+
+import pytest
+
+from tests.conftest import query_budget
+
+pytestmark = pytest.mark.anyio
+
+API = "/api/v1"
+
+# Maximum statements per request, whatever the size of the user's data.
+# The authenticated user normally comes from the user cache, so the
+# budgets leave room for one extra lookup when it does not.
+BUDGETS = {
+    "users.me": ("GET", "/users/me", 2),
+    "accounts.list": ("GET", "/accounts/", 3),
+    "accounts.get": ("GET", "/accounts/{account_id}", 3),
+    "transactions.list": ("GET", "/transactions/", 2),
+    "transactions.get": ("GET", "/transactions/{transaction_id}", 2),
+    "transactions.create": ("POST", "/transactions/", 4),
+    "transactions.update": ("PUT", "/transactions/{transaction_id}", 8),
+    "transactions.export": ("GET", "/transactions/export", 2),
+    "dashboard": ("GET", "/transactions/dashboard", 3),
+}
+
+
+async def seed(client, headers, accounts: int, transactions: int) -> dict:
+    """Create accounts with transactions; return the ids to address."""
+    account_ids = []
+    for number in range(accounts):
+        response = await client.post(
+            f"{API}/accounts/",
+            headers=headers,
+            json={
+                "name": f"Account {number}",
+                "number": str(number),
+                "holder": "Test User",
+                "value": "1000",
+                "type": "debit",
+            },
+        )
+        assert response.status_code == 201, response.text
+        account_ids.append(response.json()["id"])
+    response = await client.post(
+        f"{API}/transactions/bulk",
+        headers=headers,
+        json={
+            "items": [
+                {
+                    "amount": "1.50",
+                    "type": "expense",
+                    "description": f"Seed {n}",
+                    "account_id": account_id,
+                }
+                for account_id in account_ids
+                for n in range(transactions)
+            ]
+        },
+    )
+    assert response.status_code == 200, response.text
+    return {
+        "account_id": account_ids[0],
+        "transaction_id": response.json()["created"][0]["id"],
+        "last_account_id": account_ids[-1],
+    }
+
+
+def request_kwargs(name: str, ids: dict) -> dict:
+    if name == "transactions.create":
+        return {
+            "json": {
+                "amount": "0.01",
+                "type": "expense",
+                "description": "Budget",
+                "account_id": ids["account_id"],
+            }
+        }
+    if name == "transactions.update":
+        return {
+            "json": {
+                "amount": "1.00",
+                "type": "income",
+                "description": "Budget",
+                "account_id": ids["last_account_id"],
+            }
+        }
+    return {}
+
+
+@pytest.mark.parametrize("accounts", [1, 50])
+async def test_endpoints_stay_within_query_budget(client, headers, accounts):
+    ids = await seed(client, headers, accounts, transactions=5)
+
+    for name, (method, path, budget) in BUDGETS.items():
+        await query_budget(
+            client,
+            budget,
+            method,
+            API + path.format(**ids),
+            headers=headers,
+            **request_kwargs(name, ids),
+        )
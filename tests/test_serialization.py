@@ -0,0 +1,60 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+ACCOUNTS = "/api/v1/accounts/"
+TRANSACTIONS = "/api/v1/transactions/"
+
+
+@pytest.fixture
+def fast_serialization(monkeypatch):
+    from src.core.config import settings
+
+    def set_to(enabled: bool) -> None:
+        monkeypatch.setattr(settings, "fast_serialization", enabled)
+
+    return set_to
+
+
+async def test_serializer_matches_response_model(client, headers, fast_serialization):
+    response = await client.post(
+        ACCOUNTS,
+        headers=headers,
+        json={
+            "name": "Account",
+            "number": "1",
+            "holder": "Test User",
+            "value": "100",
+            "type": "debit",
+        },
+    )
+    assert response.status_code == 201, response.text
+    account_id = response.json()["id"]
+    for amount, description in [("10", "Café"), ("0.5", "Lunch")]:
+        response = await client.post(
+            TRANSACTIONS,
+            headers=headers,
+            json={
+                "amount": amount,
+                "description": description,
+                "type": "expense",
+                "account_id": account_id,
+            },
+        )
+        assert response.status_code == 201, response.text
+    transaction_id = response.json()["id"]
+
+    for url in [
+        ACCOUNTS,
+        f"{ACCOUNTS}{account_id}",
+        TRANSACTIONS,
+        f"{TRANSACTIONS}{transaction_id}",
+    ]:
+        bodies = []
+        for enabled in (True, False):
+            fast_serialization(enabled)
+            response = await client.get(url, headers=headers)
+            assert response.status_code == 200, response.text
+            bodies.append(response.content)
+
+        assert bodies[0] == bodies[1], url
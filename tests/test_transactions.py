@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+ACCOUNTS = "/api/v1/accounts/"
+TRANSACTIONS = "/api/v1/transactions/"
+
+
+async def create_account(client, headers, value: str = "100") -> dict:
+    response = await client.post(
+        ACCOUNTS,
+        headers=headers,
+        json={
+            "name": "Account",
+            "number": "1",
+            "holder": "Test User",
+            "value": value,
+            "type": "debit",
+        },
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def test_writes_return_the_stored_values(client, headers):
+    account = await create_account(client, headers, value="10")
+    assert account["value"] == "10.00"
+    transaction = {
+        "amount": "10",
+        "description": "Lunch",
+        "type": "expense",
+        "account_id": account["id"],
+    }
+
+    created = await client.post(TRANSACTIONS, headers=headers, json=transaction)
+
+    assert created.status_code == 201, created.text
+    assert created.json()["amount"] == "10.00"
+    url = f"{TRANSACTIONS}{created.json()['id']}"
+    updated = await client.put(url, headers=headers, json=transaction | {"amount": "5"})
+    assert updated.status_code == 200, updated.text
+    assert updated.json()["amount"] == "5.00"
+    assert (await client.get(url, headers=headers)).json()["amount"] == "5.00"
+
+
+async def test_timestamps_are_utc_on_every_path(client, headers):
+    account = await create_account(client, headers)
+    created = await client.post(
+        TRANSACTIONS,
+        headers=headers,
+        json={
+            "amount": "10",
+            "description": "Lunch",
+            "type": "expense",
+            "account_id": account["id"],
+        },
+    )
+    assert created.status_code == 201, created.text
+    url = f"{TRANSACTIONS}{created.json()['id']}"
+
+    listed = await client.get(TRANSACTIONS, headers=headers)
+    viewed = await client.get(f"{ACCOUNTS}{account['id']}", headers=headers)
+    read = [
+        created.json(),
+        (await client.get(url, headers=headers)).json(),
+        listed.json()["items"][0],
+        viewed.json()["transactions"][0],
+    ]
+
+    for body in [account, *read]:
+        assert body["created_at"].endswith("Z"), body
+        assert body["updated_at"].endswith("Z"), body
+    assert len({body["created_at"] for body in read}) == 1
+
+
+async def test_analytics_must_be_revalidated_after_ledger_edits(client, headers):
+    account = await create_account(client, headers)
+    transaction = {
+        "amount": "10",
+        "description": "Lunch",
+        "type": "expense",
+        "account_id": account["id"],
+    }
+    created = await client.post(TRANSACTIONS, headers=headers, json=transaction)
+    assert created.status_code == 201, created.text
+    today = datetime.now(timezone.utc).date()
+    url = f"{TRANSACTIONS}analytics"
+    ranges = {"from": str(today - timedelta(days=7)), "to": str(today + timedelta(1))}
+    past = {"from": str(today - timedelta(days=7)), "to": str(today)}
+
+    for params in (ranges, past):
+        response = await client.get(url, headers=headers, params=params)
+        assert response.status_code == 200, response.text
+        assert response.headers["Cache-Control"] == "private, no-cache"
+    response = await client.get(url, headers=headers, params=ranges)
+    etag = response.headers["ETag"]
+    unchanged = await client.get(
+        url, headers={**headers, "If-None-Match": etag}, params=ranges
+    )
+    assert unchanged.status_code == 304
+
+    edited = await client.put(
+        f"{TRANSACTIONS}{created.json()['id']}",
+        headers=headers,
+        json=transaction | {"amount": "5"},
+    )
+    assert edited.status_code == 200, edited.text
+
+    changed = await client.get(
+        url, headers={**headers, "If-None-Match": etag}, params=ranges
+    )
+    assert changed.status_code == 200, changed.text
+    assert changed.headers["ETag"] != etag
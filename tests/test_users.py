@@ -0,0 +1,133 @@
+import pytest
+
+from tests.conftest import PASSWORD, login, make_superuser
+
+pytestmark = pytest.mark.anyio
+
+ME = "/api/v1/users/me"
+ACCOUNTS = "/api/v1/accounts/"
+NEW_PASSWORD = "another-password"
+
+
+async def cached_payload(app, headers):
+    from src.core.token_cache import TokenCache
+
+    cache = await app.state.dishka_container.get(TokenCache)
+    return cache.get_payload(headers["Authorization"].removeprefix("Bearer "))
+
+
+@pytest.fixture
+def verifications(monkeypatch) -> list[str]:
+    """Records every token that is signature-checked rather than cached."""
+    from src.core.auth_config import get_security
+
+    security = get_security()
+    verify_token = security.verify_token
+    tokens = []
+
+    def spy(token, *args, **kwargs):
+        tokens.append(token.token)
+        return verify_token(token, *args, **kwargs)
+
+    monkeypatch.setattr(security, "verify_token", spy)
+    return tokens
+
+
+async def test_password_change_reverifies_cached_tokens(
+    app, client, headers, verifications
+):
+    assert (await client.get(ME, headers=headers)).status_code == 200
+    verified = len(verifications)
+
+    response = await client.put(
+        f"{ME}/password",
+        headers=headers,
+        json={"current_password": PASSWORD, "new_password": NEW_PASSWORD},
+    )
+
+    assert response.status_code == 204, response.text
+    assert await cached_payload(app, headers) is None
+    assert (await client.get(ME, headers=headers)).status_code == 200
+    assert len(verifications) == verified + 1
+    await login(client, "tester", NEW_PASSWORD)
+
+
+async def test_failed_password_change_keeps_cached_tokens(app, client, headers):
+    assert (await client.get(ME, headers=headers)).status_code == 200
+
+    response = await client.put(
+        f"{ME}/password",
+        headers=headers,
+        json={"current_password": "wrong-password", "new_password": NEW_PASSWORD},
+    )
+
+    assert response.status_code == 401
+    assert await cached_payload(app, headers) is not None
+    await login(client, "tester")
+
+
+async def test_deactivated_user_is_rejected(app, client, headers):
+    other = await login(client, "other", register=True)
+    assert (await client.get(ACCOUNTS, headers=other)).status_code == 200
+    other_id = int((await cached_payload(app, other)).sub)
+    await make_superuser(app)
+
+    response = await client.post(
+        f"/api/v1/users/{other_id}/deactivate", headers=headers
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["is_active"] is False
+    assert await cached_payload(app, other) is None
+    response = await client.get(ACCOUNTS, headers=other)
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Inactive user"
+
+
+async def test_only_superusers_deactivate(app, client, headers):
+    await login(client, "other", register=True)
+
+    response = await client.post("/api/v1/users/2/deactivate", headers=headers)
+
+    assert response.status_code == 403
+
+
+async def test_deleting_a_user_deletes_their_ledger(app, client, headers):
+    from sqlalchemy import func, select
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from src.db.models import Account, DailyTotal, Transaction
+
+    response = await client.post(
+        ACCOUNTS,
+        headers=headers,
+        json={
+            "name": "Account",
+            "number": "1",
+            "holder": "Test User",
+            "value": "100",
+            "type": "debit",
+        },
+    )
+    assert response.status_code == 201, response.text
+    response = await client.post(
+        "/api/v1/transactions/",
+        headers=headers,
+        json={
+            "amount": "10",
+            "description": "Lunch",
+            "type": "expense",
+            "account_id": response.json()["id"],
+        },
+    )
+    assert response.status_code == 201, response.text
+
+    response = await client.delete(ME, headers=headers)
+
+    assert response.status_code == 204, response.text
+    assert await cached_payload(app, headers) is None
+    assert (await client.get(ACCOUNTS, headers=headers)).status_code == 404
+    engine = await app.state.dishka_container.get(AsyncEngine)
+    async with engine.connect() as conn:
+        for model in (Account, Transaction, DailyTotal):
+            assert await conn.scalar(select(func.count()).select_from(model)) == 0